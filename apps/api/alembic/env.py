@@ -17,6 +17,9 @@ import app.models.sync_state  # noqa: F401
 import app.models.contact_assignment  # noqa: F401
 import app.models.contact_assignment_member  # noqa: F401
 import app.models.mail_log  # noqa: F401
+import app.models.ticket_daily_stat  # noqa: F401
+import app.models.export_job  # noqa: F401
+import app.models.notification  # noqa: F401
 
 config = context.config
 
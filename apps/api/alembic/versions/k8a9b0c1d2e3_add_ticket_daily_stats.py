@@ -0,0 +1,65 @@
+"""Add ticket_daily_stats rollup (대시보드 통계 증분 집계)
+
+Revision ID: k8a9b0c1d2e3
+Revises: j7f8b9c0d1e2
+Create Date: 2026-02-09 10:00:00.000000
+
+- ticket_daily_stats: 생성일(KST) × 상태 × 작업구분 × 카테고리 × 요청자 부서/직급별 건수
+  (티켓 생성/상태·메타 변경/삭제 시 같은 트랜잭션에서 증감)
+- 기존 tickets로 백필 (이후 정합성 복구는 python -m app.services.ticket_stats rebuild)
+- ix_tickets_updated_at: 완료 KPI(오늘/어제 완료) 조회 시 최근 변경분만 스캔
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "k8a9b0c1d2e3"
+down_revision = "j7f8b9c0d1e2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ticket_daily_stats",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("status", sa.String(length=32), nullable=False),
+        sa.Column("work_type", sa.String(length=64), nullable=False, server_default=""),
+        sa.Column("category_id", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("department", sa.String(length=100), nullable=False, server_default=""),
+        sa.Column("requester_title", sa.String(length=100), nullable=False, server_default=""),
+        sa.Column("ticket_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("day", "status", "work_type", "category_id", "department", "requester_title"),
+    )
+    op.create_index("ix_tickets_updated_at", "tickets", ["updated_at"], unique=False)
+
+    op.execute(
+        """
+        INSERT INTO ticket_daily_stats (day, status, work_type, category_id, department, requester_title, ticket_count)
+        SELECT day, status, work_type, category_id, department, requester_title, COUNT(*)
+        FROM (
+            SELECT
+                CAST(timezone('Asia/Seoul', t.created_at) AS DATE) AS day,
+                t.status AS status,
+                COALESCE(t.work_type, '') AS work_type,
+                COALESCE(t.category_id, 0) AS category_id,
+                COALESCE(NULLIF(TRIM(CASE
+                    WHEN t.requester_kor_name IS NOT NULL OR t.requester_title IS NOT NULL
+                         OR t.requester_department IS NOT NULL
+                    THEN t.requester_department ELSE u.department END), ''), '') AS department,
+                COALESCE(NULLIF(TRIM(CASE
+                    WHEN t.requester_kor_name IS NOT NULL OR t.requester_title IS NOT NULL
+                         OR t.requester_department IS NOT NULL
+                    THEN t.requester_title ELSE u.title END), ''), '') AS requester_title
+            FROM tickets t
+            LEFT OUTER JOIN users u ON u.emp_no = t.requester_emp_no
+        ) k
+        GROUP BY day, status, work_type, category_id, department, requester_title
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tickets_updated_at", table_name="tickets")
+    op.drop_table("ticket_daily_stats")
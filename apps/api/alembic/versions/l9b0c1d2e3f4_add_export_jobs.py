@@ -0,0 +1,49 @@
+"""Add export_jobs (데이터 추출 백그라운드 작업)
+
+Revision ID: l9b0c1d2e3f4
+Revises: k8a9b0c1d2e3
+Create Date: 2026-02-16 10:00:00.000000
+
+- export_jobs: 추출 조건(params), 상태(queued/running/done/failed), 진행 건수, 생성 파일의 스토리지 키
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "l9b0c1d2e3f4"
+down_revision = "k8a9b0c1d2e3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "export_jobs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("kind", sa.String(length=32), nullable=False),
+        sa.Column("format", sa.String(length=8), nullable=False),
+        sa.Column("params", sa.Text(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("requested_emp_no", sa.String(length=50), sa.ForeignKey("users.emp_no"), nullable=False),
+        sa.Column("rows_total", sa.Integer(), nullable=True),
+        sa.Column("rows_scanned", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("rows_written", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("key", sa.String(length=1024), nullable=True),
+        sa.Column("filename", sa.String(length=255), nullable=True),
+        sa.Column("content_type", sa.String(length=128), nullable=True),
+        sa.Column("size", sa.BigInteger(), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    )
+    op.create_index("ix_export_jobs_status", "export_jobs", ["status"], unique=False)
+    op.create_index("ix_export_jobs_requested_emp_no", "export_jobs", ["requested_emp_no"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_export_jobs_requested_emp_no", table_name="export_jobs")
+    op.drop_index("ix_export_jobs_status", table_name="export_jobs")
+    op.drop_table("export_jobs")
@@ -0,0 +1,121 @@
+"""Add notifications inbox + notification_cursors (인앱 알림 쓰기 시점 팬아웃)
+
+Revision ID: m0c1d2e3f4a5
+Revises: l9b0c1d2e3f4
+Create Date: 2026-02-23 10:00:00.000000
+
+- notifications: 수신자별 알림 행 (티켓 생성/상태 변경/재요청/답변 시 생성)
+- notification_cursors: 사용자별 읽음 위치(last_read_id). 기존 localStorage 방식 대체
+- 기존 GET /notifications 규칙으로 백필 후, 백필분은 모두 읽음 처리
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "m0c1d2e3f4a5"
+down_revision = "l9b0c1d2e3f4"
+branch_labels = None
+depends_on = None
+
+
+STATUS_LABEL_SQL = """
+    CASE {col}
+        WHEN 'open' THEN '접수'
+        WHEN 'in_progress' THEN '진행'
+        WHEN 'resolved' THEN '완료'
+        WHEN 'closed' THEN '사업 검토'
+        ELSE COALESCE({col}, '-')
+    END
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "notifications",
+        sa.Column("id", sa.BigInteger(), primary_key=True),
+        sa.Column("recipient_emp_no", sa.String(length=50), sa.ForeignKey("users.emp_no"), nullable=False),
+        sa.Column("source_key", sa.String(length=100), nullable=False),
+        sa.Column("type", sa.String(length=32), nullable=False),
+        sa.Column("ticket_id", sa.Integer(), sa.ForeignKey("tickets.id", ondelete="CASCADE"), nullable=True),
+        sa.Column("ticket_title", sa.String(length=200), nullable=True),
+        sa.Column("message", sa.String(length=255), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.UniqueConstraint("recipient_emp_no", "source_key", name="uq_notifications_recipient_source"),
+    )
+    op.create_index("ix_notifications_recipient_id", "notifications", ["recipient_emp_no", "id"], unique=False)
+
+    op.create_table(
+        "notification_cursors",
+        sa.Column("emp_no", sa.String(length=50), sa.ForeignKey("users.emp_no"), primary_key=True),
+        sa.Column("last_read_id", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    )
+
+    status_from = STATUS_LABEL_SQL.format(col="e.from_value")
+    status_to = STATUS_LABEL_SQL.format(col="e.to_value")
+    op.execute(
+        f"""
+        INSERT INTO notifications (recipient_emp_no, source_key, type, ticket_id, ticket_title, message, created_at)
+        SELECT recipient_emp_no, source_key, type, ticket_id, ticket_title, message, created_at
+        FROM (
+            -- 요청자: 요청 접수 / 상태 변경(진행·완료·사업 검토)
+            SELECT t.requester_emp_no AS recipient_emp_no, 'event:' || e.id AS source_key, e.type,
+                   t.id AS ticket_id, t.title AS ticket_title,
+                   CASE WHEN e.type = 'ticket_created' THEN '요청이 접수되었습니다.'
+                        ELSE {status_from} || ' -> ' || {status_to} END AS message,
+                   e.created_at
+            FROM ticket_events e JOIN tickets t ON t.id = e.ticket_id
+            WHERE e.type = 'ticket_created'
+               OR (e.type = 'status_changed' AND e.to_value IN ('resolved', 'closed', 'in_progress'))
+            UNION ALL
+            -- 담당자(관리자): 최근 30일 재요청 접수
+            SELECT u.emp_no, 'event:' || e.id, 'reopened', t.id, t.title, '재요청이 접수되었습니다', e.created_at
+            FROM ticket_events e
+            JOIN tickets t ON t.id = e.ticket_id
+            JOIN users u ON u.role = 'admin' AND (
+                u.emp_no = t.assignee_emp_no
+                OR EXISTS (SELECT 1 FROM ticket_assignees a WHERE a.ticket_id = t.id AND a.emp_no = u.emp_no)
+            )
+            WHERE e.type = 'reopened' AND e.created_at >= now() - interval '30 days'
+            UNION ALL
+            -- 카테고리 담당자(관리자): 최근 30일 새 요청
+            SELECT m.emp_no, 'ticket:' || t.id, 'new_ticket', t.id, t.title, '새 요청이 등록되었습니다.', t.created_at
+            FROM tickets t
+            JOIN contact_assignment_members m ON m.category_id = t.category_id
+            JOIN users u ON u.emp_no = m.emp_no AND u.role = 'admin'
+            WHERE t.created_at >= now() - interval '30 days'
+            UNION ALL
+            -- 담당자(관리자): 요청자 답변
+            SELECT t.assignee_emp_no, 'comment:' || c.id, 'requester_commented', t.id, t.title,
+                   LEFT(COALESCE(NULLIF(c.title, ''), '답변이 등록되었습니다.'), 255), c.created_at
+            FROM ticket_comments c
+            JOIN tickets t ON t.id = c.ticket_id
+            JOIN users a ON a.emp_no = c.author_emp_no AND a.role = 'requester'
+            JOIN users s ON s.emp_no = t.assignee_emp_no AND s.role = 'admin'
+            UNION ALL
+            -- 요청자(관리자 제외): 관리자 답변
+            SELECT t.requester_emp_no, 'comment:' || c.id, 'staff_commented', t.id, t.title,
+                   LEFT(COALESCE(NULLIF(c.title, ''), '답변이 등록되었습니다.'), 255), c.created_at
+            FROM ticket_comments c
+            JOIN tickets t ON t.id = c.ticket_id
+            JOIN users a ON a.emp_no = c.author_emp_no AND a.role = 'admin'
+            JOIN users r ON r.emp_no = t.requester_emp_no AND r.role <> 'admin'
+        ) src
+        ORDER BY created_at, source_key
+        ON CONFLICT ON CONSTRAINT uq_notifications_recipient_source DO NOTHING
+        """
+    )
+    # 기존 읽음 상태(localStorage)는 옮길 수 없으므로 백필분은 읽음으로 둔다
+    op.execute(
+        """
+        INSERT INTO notification_cursors (emp_no, last_read_id)
+        SELECT recipient_emp_no, MAX(id) FROM notifications GROUP BY recipient_emp_no
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("notification_cursors")
+    op.drop_index("ix_notifications_recipient_id", table_name="notifications")
+    op.drop_table("notifications")
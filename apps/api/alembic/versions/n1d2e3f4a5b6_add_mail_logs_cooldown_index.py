@@ -0,0 +1,34 @@
+"""Add partial composite index for the mail cooldown check
+
+Revision ID: n1d2e3f4a5b6
+Revises: m0c1d2e3f4a5
+Create Date: 2026-03-02 10:00:00.000000
+
+- mail_logs: (recipient_email, event_type, created_at) INCLUDE (ticket_id) WHERE status = 'sent'
+  메일 등록 시 쿨다운 확인이 발송 완료 건 전체를 훑지 않고 최근 구간만 인덱스로 찾도록 한다.
+  벤치마크: docs/mail_cooldown_index_benchmark.sql
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "n1d2e3f4a5b6"
+down_revision = "m0c1d2e3f4a5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_mail_logs_cooldown",
+        "mail_logs",
+        ["recipient_email", "event_type", "created_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'sent'"),
+        postgresql_include=["ticket_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_mail_logs_cooldown", table_name="mail_logs")
@@ -0,0 +1,47 @@
+"""Add mail_logs_archive (mail_logs 보존 정책: 본문 정리 + 오래된 행 보관)
+
+Revision ID: o2e3f4a5b6c7
+Revises: n1d2e3f4a5b6
+Create Date: 2026-03-03 10:00:00.000000
+
+- mail_logs_archive: mail_logs와 같은 컬럼 + archived_at. 티켓 삭제와 무관하게 남도록 FK 없음
+- 이동/정리는 services/mail_retention.py (CLI·백그라운드 작업)
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "o2e3f4a5b6c7"
+down_revision = "n1d2e3f4a5b6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "mail_logs_archive",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("event_key", sa.String(length=200), nullable=False),
+        sa.Column("event_type", sa.String(length=64), nullable=False),
+        sa.Column("ticket_id", sa.Integer(), nullable=True),
+        sa.Column("recipient_emp_no", sa.String(length=50), nullable=True),
+        sa.Column("recipient_email", sa.String(length=255), nullable=False),
+        sa.Column("subject", sa.String(length=255), nullable=False),
+        sa.Column("body_text", sa.Text(), nullable=True),
+        sa.Column("body_html", sa.Text(), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_attempt_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    )
+    op.create_index("ix_mail_logs_archive_created_at", "mail_logs_archive", ["created_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_mail_logs_archive_created_at", table_name="mail_logs_archive")
+    op.drop_table("mail_logs_archive")
@@ -0,0 +1,33 @@
+"""Add partial index on mail_logs.last_attempt_at for sent mail (메일 큐 지표)
+
+Revision ID: p3f4a5b6c7d8
+Revises: o2e3f4a5b6c7
+Create Date: 2026-03-04 10:00:00.000000
+
+- mail_logs: (last_attempt_at) INCLUDE (created_at) WHERE status = 'sent'
+  GET /admin/mail/queue-stats의 최근 발송 건수·발송 지연·분당 처리량을 인덱스 범위 스캔으로 계산한다.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "p3f4a5b6c7d8"
+down_revision = "o2e3f4a5b6c7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_mail_logs_sent_at",
+        "mail_logs",
+        ["last_attempt_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'sent'"),
+        postgresql_include=["created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_mail_logs_sent_at", table_name="mail_logs")
@@ -0,0 +1,26 @@
+"""Add users.sync_hash for change detection in user sync (사용자 동기화 변경 감지)
+
+Revision ID: q4a5b6c7d8e9
+Revises: p3f4a5b6c7d8
+Create Date: 2026-03-05 10:00:00.000000
+
+- users.sync_hash: 동기화가 마지막으로 쓴 원본 값의 해시. 값이 같으면 upsert를 생략한다.
+  기존 행은 NULL이므로 배포 후 첫 프로필 동기화에서 한 번씩 다시 쓰이며 채워진다.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "q4a5b6c7d8e9"
+down_revision = "p3f4a5b6c7d8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("sync_hash", sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("users", "sync_hash")
@@ -0,0 +1,58 @@
+"""Backfill ticket requester snapshot and rebuild ticket_daily_stats (통계 롤업 키 고정)
+
+Revision ID: r5b6c7d8e9f0
+Revises: q4a5b6c7d8e9
+Create Date: 2026-03-10 10:00:00.000000
+
+- ticket_daily_stats의 부서/직급 키는 이제 티켓의 요청자 스냅샷(requester_department/requester_title)만 쓴다.
+  스냅샷이 없는 예전 티켓은 현재 사용자 정보로 폴백했기 때문에 사용자 동기화로 부서·직급이 바뀌면
+  생성 시 +1한 키와 이후 -1할 키가 달라져 롤업이 tickets와 어긋났다.
+- 스냅샷이 모두 비어 있는 티켓은 지금의 사용자 정보로 스냅샷(이름·직급·부서)을 채운다.
+  화면도 이 값을 쓰게 되며(serialize_ticket), 이후 새 티켓과 같이 요청 시점 값으로 고정된다.
+- 바뀐 키 기준으로 ticket_daily_stats를 tickets에서 다시 계산한다.
+"""
+
+from alembic import op
+
+
+revision = "r5b6c7d8e9f0"
+down_revision = "q4a5b6c7d8e9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        UPDATE tickets t
+        SET requester_kor_name = u.kor_name,
+            requester_title = u.title,
+            requester_department = u.department
+        FROM users u
+        WHERE u.emp_no = t.requester_emp_no
+          AND t.requester_kor_name IS NULL
+          AND t.requester_title IS NULL
+          AND t.requester_department IS NULL
+        """
+    )
+    op.execute("DELETE FROM ticket_daily_stats")
+    op.execute(
+        """
+        INSERT INTO ticket_daily_stats (day, status, work_type, category_id, department, requester_title, ticket_count)
+        SELECT
+            CAST(timezone('Asia/Seoul', created_at) AS DATE),
+            status,
+            COALESCE(work_type, ''),
+            COALESCE(category_id, 0),
+            COALESCE(NULLIF(TRIM(requester_department), ''), ''),
+            COALESCE(NULLIF(TRIM(requester_title), ''), ''),
+            COUNT(*)
+        FROM tickets
+        GROUP BY 1, 2, 3, 4, 5, 6
+        """
+    )
+
+
+def downgrade() -> None:
+    # 채운 스냅샷은 원래 값(NULL)과 구분할 수 없으므로 되돌리지 않는다
+    pass
@@ -5,6 +5,10 @@ class Settings(BaseModel):
     database_url: str = os.getenv("DATABASE_URL", "")
     jwt_secret: str = os.getenv("JWT_SECRET", "dev-secret")
     jwt_expires_min: int = int(os.getenv("JWT_EXPIRES_MIN", "120"))
+    # 알림 스트림(SSE) 연결용 토큰. URL 쿼리로 가므로 접속 로그에 남아도 곧 쓸 수 없도록 짧게 둔다
+    stream_token_expires_seconds: int = int(os.getenv("STREAM_TOKEN_EXPIRES_SECONDS", "60"))
+    user_cache_ttl_seconds: int = int(os.getenv("USER_CACHE_TTL_SECONDS", "30"))  # 0 = 캐시 끔
+    user_cache_max_size: int = int(os.getenv("USER_CACHE_MAX_SIZE", "2048"))
     allowed_email_domains: list[str] = [
         d.strip().lower()
         for d in os.getenv("ALLOWED_EMAIL_DOMAINS", "").split(",")
@@ -19,9 +23,20 @@ class Settings(BaseModel):
     sync_source_schema: str = os.getenv("SYNC_SOURCE_SCHEMA", "kdis")
     sync_emp_no_prefix: str = os.getenv("SYNC_EMP_NO_PREFIX", "3")
     sync_force_full: bool = os.getenv("SYNC_FORCE_FULL", "false").lower() == "true"
+    sync_chunk_size: int = int(os.getenv("SYNC_CHUNK_SIZE", "1000"))  # 청크마다 한 번에 반영하고 커밋
+    sync_source_pool_size: int = int(os.getenv("SYNC_SOURCE_POOL_SIZE", "2"))  # 원본 DB 연결 수 상한
+    sync_source_pool_timeout_seconds: int = int(os.getenv("SYNC_SOURCE_POOL_TIMEOUT_SECONDS", "30"))
+    sync_source_pool_recycle_seconds: int = int(os.getenv("SYNC_SOURCE_POOL_RECYCLE_SECONDS", "1800"))
+    scheduler_mode: str = os.getenv("SCHEDULER_MODE", "embedded").lower()  # embedded | off (python -m app.worker 사용)
+    scheduler_election_seconds: int = int(os.getenv("SCHEDULER_ELECTION_SECONDS", "10"))
     smtp_host: str = os.getenv("SMTP_HOST", "")
     smtp_port: int = int(os.getenv("SMTP_PORT", "25"))
     smtp_from: str = os.getenv("SMTP_FROM", "")
+    mail_sender_pool_size: int = int(os.getenv("MAIL_SENDER_POOL_SIZE", "4"))
+    mail_max_connections_per_host: int = int(os.getenv("MAIL_MAX_CONNECTIONS_PER_HOST", "4"))
+    mail_log_body_retention_days: int = int(os.getenv("MAIL_LOG_BODY_RETENTION_DAYS", "90"))  # 0 = 본문 보존
+    mail_log_archive_days: int = int(os.getenv("MAIL_LOG_ARCHIVE_DAYS", "365"))  # 0 = 보관 이동 안 함
+    mail_log_retention_interval_seconds: int = int(os.getenv("MAIL_LOG_RETENTION_INTERVAL_SECONDS", "86400"))  # 0 = 백그라운드 작업 끔
     app_base_url: str = os.getenv("APP_BASE_URL", "http://localhost:3000")
 
 settings = Settings()
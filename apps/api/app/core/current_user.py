@@ -1,28 +1,53 @@
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
 from ..db import get_session
 from ..models.user import User
-from .security import decode_token
+from .security import STREAM_TOKEN_SCOPE, decode_token
+from .user_cache import get_cached_user, put_cached_user
 
 bearer = HTTPBearer(auto_error=False)
 
-def get_current_user(
-    creds: HTTPAuthorizationCredentials = Depends(bearer),
-    session: Session = Depends(get_session),
-) -> User:
-    if not creds:
-        raise HTTPException(status_code=401, detail="Not authenticated")
 
+def _user_from_token(session: Session, token: str, scope: str | None = None) -> User:
+    """scope=None이면 일반 액세스 토큰만, scope를 주면 그 scope의 토큰만 받는다."""
     try:
-        payload = decode_token(creds.credentials)
+        payload = decode_token(token)
         emp_no = str(payload["sub"])
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid token")
+    if payload.get("scope") != scope:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    cached = get_cached_user(emp_no)
+    if cached is not None:
+        return cached
 
     user = session.scalar(select(User).where(User.emp_no == emp_no))
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
+    put_cached_user(user)
     return user
+
+
+def get_current_user(
+    creds: HTTPAuthorizationCredentials = Depends(bearer),
+    session: Session = Depends(get_session),
+) -> User:
+    if not creds:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return _user_from_token(session, creds.credentials)
+
+
+def get_stream_user(
+    token: str | None = Query(default=None),
+    session: Session = Depends(get_session),
+) -> User:
+    """EventSource(SSE)는 Authorization 헤더를 보낼 수 없어 토큰을 ?token=으로 받는다.
+    URL은 접속 로그에 남으므로 액세스 토큰은 받지 않고, POST /notifications/stream-token이 발급한
+    짧은 스트림 전용 토큰만 받는다."""
+    if not token:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return _user_from_token(session, token, scope=STREAM_TOKEN_SCOPE)
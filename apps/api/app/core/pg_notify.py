@@ -0,0 +1,67 @@
+"""Postgres LISTEN/NOTIFY 헬퍼.
+
+NOTIFY는 보내는 트랜잭션이 커밋될 때 전달되므로, 행을 넣는 세션에서 notify()를 호출하면
+롤백된 변경은 알려지지 않는다. LISTEN은 풀과 별도의 autocommit 연결을 쓴다.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import psycopg
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def notify(session: Session, channel: str, payload: str = "") -> None:
+    session.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": channel, "payload": payload})
+
+
+def listen_dsn() -> str:
+    # SQLAlchemy URL(postgresql+psycopg://...)을 psycopg가 받는 형식으로 변환
+    url = make_url(settings.database_url).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+def connect_listener(*channels: str) -> psycopg.Connection:
+    conn = psycopg.connect(listen_dsn(), autocommit=True)
+    for channel in channels:
+        conn.execute(f"LISTEN {channel}")
+    return conn
+
+
+class ChannelWaiter:
+    """워커 스레드가 sleep 대신 NOTIFY를 기다리게 한다. 연결이 끊기면 다음 wait에서 다시 연결한다."""
+
+    def __init__(self, channel: str) -> None:
+        self.channel = channel
+        self._conn: psycopg.Connection | None = None
+
+    def wait(self, timeout: float) -> bool:
+        """NOTIFY를 받으면 True, timeout이면 False.
+        연결을 새로 맺은 경우에는 그 전에 온 NOTIFY를 놓쳤을 수 있으므로 바로 True를 돌려준다."""
+        if self._conn is None:
+            self._conn = connect_listener(self.channel)
+            logger.info("LISTEN 연결됨: channel=%s", self.channel)
+            return True
+        try:
+            received = False
+            for _ in self._conn.notifies(timeout=timeout, stop_after=1):
+                received = True
+            return received
+        except psycopg.Error:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.close()
+        finally:
+            self._conn = None
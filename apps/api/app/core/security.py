@@ -43,5 +43,18 @@ def create_access_token(sub: str) -> str:
     }
     return jwt.encode(payload, settings.jwt_secret, algorithm="HS256")
 
+STREAM_TOKEN_SCOPE = "notifications:stream"
+
+def create_stream_token(sub: str) -> str:
+    """/notifications/stream 연결에만 쓰는 짧은 토큰 (scope 클레임이 있어 일반 API 인증에는 쓸 수 없다)."""
+    now = datetime.now(timezone.utc)
+    payload = {
+        "sub": sub,
+        "scope": STREAM_TOKEN_SCOPE,
+        "iat": int(now.timestamp()),
+        "exp": int((now + timedelta(seconds=settings.stream_token_expires_seconds)).timestamp()),
+    }
+    return jwt.encode(payload, settings.jwt_secret, algorithm="HS256")
+
 def decode_token(token: str) -> dict:
     return jwt.decode(token, settings.jwt_secret, algorithms=["HS256"])
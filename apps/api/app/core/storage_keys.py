@@ -41,3 +41,8 @@ def notice_editor_key_from_src_key(*, notice_id: int, notice_created_at: datetim
     basename = os.path.basename(src_key)
     return f"notices/{date_path}/{notice_id}/editor/{basename}"
 
+
+def export_file_key(*, job_id: int, job_created_at: datetime | None, filename: str) -> str:
+    date_path = _date_path(job_created_at)
+    ext = _ext_from_filename(filename)
+    return f"exports/{date_path}/{job_id}/{uuid4().hex}{ext}"
@@ -0,0 +1,96 @@
+"""인증 사용자 캐시.
+
+get_current_user가 요청마다 users를 조회하지 않도록, 토큰 sub(사번)별로 필요한 필드만
+프로세스 메모리에 TTL/LRU로 보관한다. 역할 변경(admin_users.update_role)과
+사용자 동기화(user_sync)에서 무효화하며, 다른 API 프로세스에는 TTL 안에 반영된다.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+import time
+from typing import Iterable
+
+from ..models.user import User
+from .config import settings
+
+
+@dataclass(frozen=True)
+class CachedUser:
+    emp_no: str
+    kor_name: str | None
+    eng_name: str | None
+    role: str
+    title: str | None
+    department: str | None
+    email: str | None
+    is_verified: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "CachedUser":
+        return cls(
+            emp_no=user.emp_no,
+            kor_name=user.kor_name,
+            eng_name=user.eng_name,
+            role=user.role,
+            title=user.title,
+            department=user.department,
+            email=user.email,
+            is_verified=user.is_verified,
+        )
+
+    def to_user(self) -> User:
+        # 세션에 붙지 않은(transient) User. 라우터는 속성만 읽으므로 요청마다 새로 만든다
+        return User(
+            emp_no=self.emp_no,
+            kor_name=self.kor_name,
+            eng_name=self.eng_name,
+            role=self.role,
+            title=self.title,
+            department=self.department,
+            email=self.email,
+            is_verified=self.is_verified,
+        )
+
+
+_lock = threading.Lock()
+_entries: OrderedDict[str, tuple[float, CachedUser]] = OrderedDict()
+
+
+def get_cached_user(emp_no: str) -> User | None:
+    if settings.user_cache_ttl_seconds <= 0:
+        return None
+    now = time.monotonic()
+    with _lock:
+        entry = _entries.get(emp_no)
+        if entry is None:
+            return None
+        expires_at, cached = entry
+        if expires_at <= now:
+            del _entries[emp_no]
+            return None
+        _entries.move_to_end(emp_no)
+    return cached.to_user()
+
+
+def put_cached_user(user: User) -> None:
+    if settings.user_cache_ttl_seconds <= 0:
+        return
+    entry = (time.monotonic() + settings.user_cache_ttl_seconds, CachedUser.from_user(user))
+    with _lock:
+        _entries[user.emp_no] = entry
+        _entries.move_to_end(user.emp_no)
+        while len(_entries) > settings.user_cache_max_size:
+            _entries.popitem(last=False)
+
+
+def invalidate_users(emp_nos: Iterable[str] | None = None) -> None:
+    """emp_nos가 None이면 전체를 비운다."""
+    with _lock:
+        if emp_nos is None:
+            _entries.clear()
+            return
+        for emp_no in emp_nos:
+            _entries.pop(emp_no, None)
@@ -3,23 +3,34 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
+import hashlib
 import logging
+import os
 import re
 import threading
 import time
+from typing import Callable
 
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
 from ..core.config import settings
+from ..core.user_cache import invalidate_users
 from ..db import SessionLocal
 from ..models.sync_state import SyncState
 
 
 SYNC_KEY_PASSWORD = "users_password_sync"
 SYNC_KEY_PROFILE = "users_profile_sync"
+SYNC_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 KST = ZoneInfo("Asia/Seoul")
 _force_full_done = False
+# 원본(MIS) DB 엔진은 프로세스당 하나만 만들어 동기화 실행마다 재사용한다
+_source_engine: Engine | None = None
+_source_engine_lock = threading.Lock()
+# 이 프로세스에서 도는 동기화 루프 (스케줄러 리더 또는 app.worker에서만 시작된다)
+_sync_thread: threading.Thread | None = None
 logger = logging.getLogger(__name__)
 
 
@@ -31,6 +42,7 @@ class SyncConfig:
     password_interval_seconds: int
     full_at_hour_kst: int
     full_at_minute_kst: int
+    chunk_size: int
 
 
 def _safe_schema_name(raw: str) -> str:
@@ -51,9 +63,57 @@ def _load_config() -> SyncConfig | None:
         password_interval_seconds=max(60, settings.sync_password_interval_seconds),
         full_at_hour_kst=settings.sync_full_at_hour_kst,
         full_at_minute_kst=settings.sync_full_at_minute_kst,
+        chunk_size=max(1, settings.sync_chunk_size),
     )
 
 
+def get_source_engine(cfg: SyncConfig) -> Engine:
+    """처음 호출할 때 원본 DB 엔진을 만든다. 풀 크기는 SYNC_SOURCE_POOL_SIZE로 제한(overflow 없음)."""
+    global _source_engine
+    with _source_engine_lock:
+        if _source_engine is None:
+            _source_engine = create_engine(
+                cfg.source_url,
+                pool_pre_ping=True,
+                pool_size=max(1, settings.sync_source_pool_size),
+                max_overflow=0,
+                pool_timeout=settings.sync_source_pool_timeout_seconds,
+                pool_recycle=settings.sync_source_pool_recycle_seconds,
+            )
+        return _source_engine
+
+
+def dispose_source_engine() -> None:
+    """종료 시 원본 DB 연결을 모두 닫는다. 이후 동기화가 다시 돌면 엔진을 새로 만든다."""
+    global _source_engine
+    with _source_engine_lock:
+        engine, _source_engine = _source_engine, None
+    if engine is not None:
+        engine.dispose()
+
+
+def is_sync_running() -> bool:
+    return _sync_thread is not None and _sync_thread.is_alive()
+
+
+def source_pool_stats() -> dict:
+    """이 프로세스의 원본 DB 연결 풀 현황. 아직 동기화가 한 번도 돌지 않았으면 created=False.
+    엔진은 프로세스마다 따로이므로, 동기화를 돌리지 않는 프로세스(runs_sync=False)의 값은 실제 동기화 풀과 무관하다."""
+    process = {"pid": os.getpid(), "runs_sync": is_sync_running()}
+    engine = _source_engine
+    if engine is None:
+        return {**process, "created": False, "size": max(1, settings.sync_source_pool_size)}
+    pool = engine.pool
+    return {
+        **process,
+        "created": True,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+
 def _source_query_password(schema: str) -> str:
     """Rows from ca_user_m (and gp_master for filter) where password was updated after last_sync."""
     return f"""
@@ -65,11 +125,13 @@ def _source_query_password(schema: str) -> str:
           AND gm.emp_tp IN ('1', '2')
           AND cu.password IS NOT NULL
           AND cu.update_dtime > :last_sync
+        ORDER BY cu.update_dtime, cu.user_id
     """
 
 
 def _source_query_profile(schema: str) -> str:
-    """Full profile (name, title, dept, email); password in SELECT for INSERT of new users only."""
+    """Full profile (name, title, dept, email, password); the upsert writes password on both INSERT and UPDATE
+    (it is part of sync_hash, so a changed password alone also rewrites the row)."""
     return f"""
         SELECT
             gm.emp_no,
@@ -113,151 +175,288 @@ def _source_query_profile(schema: str) -> str:
                 COALESCE(cc.update_dtime, TIMESTAMP '1970-01-01'),
                 COALESCE(d.update_dtime, TIMESTAMP '1970-01-01')
           ) > :last_sync
+        ORDER BY updated_at, emp_no
     """
 
 
-def sync_password_once() -> int:
-    """Sync only password from source; runs every sync_password_interval_seconds."""
-    cfg = _load_config()
-    if not cfg:
-        logger.info("user password sync skipped (disabled or missing source URL)")
-        return 0
+PASSWORD_UPDATE_SQL = text(
+    """
+    UPDATE users
+    SET password = :password, sync_hash = :sync_hash, updated_at = NOW()
+    WHERE emp_no = :emp_no
+    """
+)
 
-    source_engine = create_engine(cfg.source_url, pool_pre_ping=True)
-    max_updated = None
-    affected = 0
+PROFILE_UPSERT_SQL = text(
+    """
+    INSERT INTO users (
+        emp_no,
+        kor_name,
+        eng_name,
+        title,
+        department,
+        password,
+        email,
+        sync_hash,
+        role,
+        is_verified,
+        created_at,
+        updated_at
+    )
+    VALUES (
+        :emp_no,
+        :kor_name,
+        :eng_name,
+        :title,
+        :department,
+        :password,
+        :email,
+        :sync_hash,
+        'requester',
+        TRUE,
+        NOW(),
+        NOW()
+    )
+    ON CONFLICT (emp_no) DO UPDATE SET
+        kor_name = EXCLUDED.kor_name,
+        eng_name = EXCLUDED.eng_name,
+        title = EXCLUDED.title,
+        department = EXCLUDED.department,
+        password = EXCLUDED.password,
+        email = EXCLUDED.email,
+        sync_hash = EXCLUDED.sync_hash,
+        updated_at = NOW()
+    WHERE users.sync_hash IS DISTINCT FROM EXCLUDED.sync_hash
+    """
+)
+
+# 변경 감지 대상 컬럼. users.sync_hash는 이 값들로 계산하며 동기화가 쓸 때만 갱신된다.
+HASH_COLUMNS = ("kor_name", "eng_name", "title", "department", "email", "password")
+PROFILE_COLUMNS = ("emp_no",) + HASH_COLUMNS
 
-    with source_engine.connect() as source_conn, SessionLocal() as session:
-        state = session.get(SyncState, SYNC_KEY_PASSWORD)
-        last_sync = state.last_synced_at if state and state.last_synced_at else datetime(1970, 1, 1, tzinfo=timezone.utc)
 
-        rows = source_conn.execute(
-            text(_source_query_password(cfg.source_schema)),
+@dataclass
+class SyncResult:
+    rows: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    # stop 이벤트로 중간에 멈췄으면 True (체크포인트는 마지막으로 커밋한 청크까지만 반영됨)
+    stopped: bool = False
+
+    def add(self, other: "SyncResult") -> None:
+        self.rows += other.rows
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+
+
+def row_hash(values) -> str:
+    """HASH_COLUMNS 값의 해시. None과 빈 문자열을 구분한다."""
+    h = hashlib.blake2b(digest_size=16)
+    for col in HASH_COLUMNS:
+        value = values.get(col)
+        h.update(b"\x00" if value is None else b"\x01" + str(value).encode("utf-8"))
+        h.update(b"\x1f")
+    return h.hexdigest()
+
+
+def _current_users(session: Session, emp_nos: list[str]) -> dict:
+    rows = session.execute(
+        text(f"SELECT emp_no, {', '.join(HASH_COLUMNS)}, sync_hash FROM users WHERE emp_no = ANY(:emp_nos)"),
+        {"emp_nos": emp_nos},
+    ).mappings()
+    return {row["emp_no"]: row for row in rows}
+
+
+def _apply_password_chunk(session: Session, chunk: list) -> tuple[SyncResult, list[str]]:
+    """비밀번호가 실제로 바뀐 사용자만 갱신한다. 해시는 현재 프로필 값 + 새 비밀번호로 다시 계산해
+    다음 프로필 동기화가 같은 행을 또 쓰지 않게 한다. users에 없는 사번은 건너뛴다(프로필 동기화가 생성)."""
+    current = _current_users(session, [row["emp_no"] for row in chunk])
+    changed: dict[str, dict] = {}
+    for row in chunk:
+        user = current.get(row["emp_no"])
+        if user is None or user["password"] == row["password"]:
+            continue
+        values = {**user, "password": row["password"]}
+        changed[row["emp_no"]] = {"emp_no": row["emp_no"], "password": row["password"], "sync_hash": row_hash(values)}
+    if changed:
+        session.execute(PASSWORD_UPDATE_SQL, list(changed.values()))
+    result = SyncResult(rows=len(chunk), updated=len(changed), unchanged=len(chunk) - len(changed))
+    return result, list(changed)
+
+
+def _apply_profile_chunk(session: Session, chunk: list) -> tuple[SyncResult, list[str]]:
+    """해시가 저장된 값과 다른 행만 upsert한다 (변경 없는 행은 updated_at도 그대로)."""
+    current = _current_users(session, [row["emp_no"] for row in chunk])
+    result = SyncResult(rows=len(chunk))
+    changed: dict[str, dict] = {}
+    for row in chunk:
+        values = {col: row.get(col) for col in PROFILE_COLUMNS}
+        values["sync_hash"] = row_hash(values)
+        user = current.get(row["emp_no"])
+        if user is not None and user["sync_hash"] == values["sync_hash"]:
+            result.unchanged += 1
+            continue
+        if user is None:
+            result.inserted += 1
+        else:
+            result.updated += 1
+        changed[row["emp_no"]] = values
+    if changed:
+        session.execute(PROFILE_UPSERT_SQL, list(changed.values()))
+    return result, list(changed)
+
+
+def _save_checkpoint(session: Session, key: str, value: datetime) -> None:
+    state = session.get(SyncState, key)
+    if not state:
+        state = SyncState(key=key)
+        session.add(state)
+    state.last_synced_at = value
+
+
+def _safe_checkpoint(chunk: list) -> datetime | None:
+    """updated_at 순으로 정렬된 청크에서, 다음 청크에 같은 updated_at 행이 남아 있어도 안전한 체크포인트.
+    마지막 행과 같은 값은 다음 청크로 이어질 수 있으므로 그보다 작은 값까지만 기록한다."""
+    last = chunk[-1]["updated_at"]
+    for row in reversed(chunk):
+        if row["updated_at"] < last:
+            return row["updated_at"]
+    return None
+
+
+def _sync_in_chunks(
+    *,
+    source_conn,
+    session: Session,
+    key: str,
+    query: str,
+    last_sync: datetime,
+    cfg: SyncConfig,
+    apply_chunk: Callable[[Session, list], tuple[SyncResult, list[str]]],
+    on_commit: Callable[[list[str]], None] | None = None,
+    stop: threading.Event | None = None,
+) -> SyncResult:
+    """원본 행을 chunk_size씩 읽어 청크마다 바뀐 행만 executemany(psycopg 파이프라인) 한 번으로 반영하고 커밋한다.
+    청크마다 SyncState를 갱신하므로 중간에 실패하거나 stop으로 멈춰도 다음 실행은 마지막으로 커밋된 지점부터 이어간다.
+    stop은 청크 사이에서 확인하므로, 스케줄러가 리더를 내려놓으면 진행 중인 청크 하나만 마치고 멈춘다.
+    원본 조회는 서버 측 커서(stream_results)로 chunk_size씩 가져오므로 원본 행 수와 관계없이 메모리는 한 청크만큼만 쓴다."""
+    rows = (
+        source_conn.execution_options(stream_results=True, yield_per=cfg.chunk_size)
+        .execute(
+            text(query),
             {"emp_like": f"{cfg.emp_no_prefix}%", "last_sync": last_sync},
-        ).mappings()
-
-        for row in rows:
-            affected += 1
-            updated_at = row.get("updated_at")
-            if updated_at and (max_updated is None or updated_at > max_updated):
-                max_updated = updated_at
-            session.execute(
-                text(
-                    """
-                    UPDATE users
-                    SET password = :password, updated_at = NOW()
-                    WHERE emp_no = :emp_no
-                    """
-                ),
-                {"emp_no": row.get("emp_no"), "password": row.get("password")},
-            )
+        )
+        .mappings()
+    )
+
+    total = SyncResult()
+    max_updated = None
+    # mappings()의 partitions()는 yield_per를 물려받지 않으므로(None이면 fetchall) 크기를 직접 준다
+    for chunk in rows.partitions(cfg.chunk_size):
+        if stop is not None and stop.is_set():
+            total.stopped = True
+            return total
+        result, changed = apply_chunk(session, chunk)
+        total.add(result)
+        max_updated = chunk[-1]["updated_at"]
+        checkpoint = _safe_checkpoint(chunk)
+        if checkpoint is not None:
+            _save_checkpoint(session, key, checkpoint)
+        session.commit()
+        if on_commit and changed:
+            on_commit(changed)
 
-        if affected:
-            if not state:
-                state = SyncState(key=SYNC_KEY_PASSWORD)
-                session.add(state)
-            state.last_synced_at = max_updated or datetime.now(timezone.utc)
+    if total.rows:
+        _save_checkpoint(session, key, max_updated or datetime.now(timezone.utc))
         session.commit()
+    return total
+
+
+def _log_result(name: str, result: SyncResult, started: float) -> None:
+    elapsed = time.perf_counter() - started
+    logger.info(
+        "user %s sync %s; rows=%d inserted=%d updated=%d unchanged=%d elapsed=%.2fs rate=%.0f rows/s pool=%s",
+        name,
+        "stopped early" if result.stopped else "completed",
+        result.rows,
+        result.inserted,
+        result.updated,
+        result.unchanged,
+        elapsed,
+        result.rows / elapsed if elapsed else 0,
+        # 동기화를 실제로 돌린 프로세스의 원본 풀 현황 (API의 sync-source-pool은 요청을 받은 프로세스 기준)
+        source_pool_stats(),
+    )
+
 
-    if affected:
-        logger.info("user password sync completed; rows=%d", affected)
-    return affected
+def sync_password_once(stop: threading.Event | None = None) -> SyncResult:
+    """Sync only password from source; runs every sync_password_interval_seconds. Stops between chunks once `stop` is set."""
+    cfg = _load_config()
+    if not cfg:
+        logger.info("user password sync skipped (disabled or missing source URL)")
+        return SyncResult()
 
+    source_engine = get_source_engine(cfg)
+    started = time.perf_counter()
 
-def sync_profile_once() -> int:
-    """Sync profile (name, title, department, email) only; intended to run once per day at midnight KST."""
+    with source_engine.connect() as source_conn, SessionLocal() as session:
+        state = session.get(SyncState, SYNC_KEY_PASSWORD)
+        last_sync = state.last_synced_at if state and state.last_synced_at else SYNC_EPOCH
+        result = _sync_in_chunks(
+            source_conn=source_conn,
+            session=session,
+            key=SYNC_KEY_PASSWORD,
+            query=_source_query_password(cfg.source_schema),
+            last_sync=last_sync,
+            cfg=cfg,
+            apply_chunk=_apply_password_chunk,
+            stop=stop,
+        )
+
+    if result.rows:
+        _log_result("password", result, started)
+    return result
+
+
+def sync_profile_once(stop: threading.Event | None = None) -> SyncResult:
+    """Sync profile (name, title, department, email) only; intended to run once per day at midnight KST.
+    Stops between chunks once `stop` is set."""
     cfg = _load_config()
     if not cfg:
         logger.info("user profile sync skipped (disabled or missing source URL)")
-        return 0
+        return SyncResult()
 
-    source_engine = create_engine(cfg.source_url, pool_pre_ping=True)
-    max_updated = None
-    affected = 0
+    source_engine = get_source_engine(cfg)
+    started = time.perf_counter()
 
     with source_engine.connect() as source_conn, SessionLocal() as session:
         state = session.get(SyncState, SYNC_KEY_PROFILE)
         global _force_full_done
         if settings.sync_force_full and not _force_full_done:
-            last_sync = datetime(1970, 1, 1, tzinfo=timezone.utc)
+            last_sync = SYNC_EPOCH
         else:
-            last_sync = (
-                state.last_synced_at
-                if state and state.last_synced_at
-                else datetime(1970, 1, 1, tzinfo=timezone.utc)
-            )
-
-        rows = source_conn.execute(
-            text(_source_query_profile(cfg.source_schema)),
-            {"emp_like": f"{cfg.emp_no_prefix}%", "last_sync": last_sync},
-        ).mappings()
-
-        for row in rows:
-            affected += 1
-            updated_at = row.get("updated_at")
-            if updated_at and (max_updated is None or updated_at > max_updated):
-                max_updated = updated_at
-            session.execute(
-                text(
-                    """
-                    INSERT INTO users (
-                        emp_no,
-                        kor_name,
-                        eng_name,
-                        title,
-                        department,
-                        password,
-                        email,
-                        role,
-                        is_verified,
-                        created_at,
-                        updated_at
-                    )
-                    VALUES (
-                        :emp_no,
-                        :kor_name,
-                        :eng_name,
-                        :title,
-                        :department,
-                        :password,
-                        :email,
-                        'requester',
-                        TRUE,
-                        NOW(),
-                        NOW()
-                    )
-                    ON CONFLICT (emp_no) DO UPDATE SET
-                        kor_name = EXCLUDED.kor_name,
-                        eng_name = EXCLUDED.eng_name,
-                        title = EXCLUDED.title,
-                        department = EXCLUDED.department,
-                        email = EXCLUDED.email,
-                        updated_at = NOW()
-                    """
-                ),
-                {
-                    "emp_no": row.get("emp_no"),
-                    "kor_name": row.get("kor_name"),
-                    "eng_name": row.get("eng_name"),
-                    "title": row.get("title"),
-                    "department": row.get("department"),
-                    "password": row.get("password"),
-                    "email": row.get("email"),
-                },
-            )
-
-        if affected:
-            if not state:
-                state = SyncState(key=SYNC_KEY_PROFILE)
-                session.add(state)
-            state.last_synced_at = max_updated or datetime.now(timezone.utc)
-        session.commit()
-
-        if settings.sync_force_full:
+            last_sync = state.last_synced_at if state and state.last_synced_at else SYNC_EPOCH
+
+        result = _sync_in_chunks(
+            source_conn=source_conn,
+            session=session,
+            key=SYNC_KEY_PROFILE,
+            query=_source_query_profile(cfg.source_schema),
+            last_sync=last_sync,
+            cfg=cfg,
+            apply_chunk=_apply_profile_chunk,
+            # 이름/부서/이메일이 바뀐 사용자만 인증 사용자 캐시에서 제거
+            on_commit=invalidate_users,
+            stop=stop,
+        )
+
+        if settings.sync_force_full and not result.stopped:
             _force_full_done = True
 
-    logger.info("user profile sync completed; rows=%d", affected)
-    return affected
+    _log_result("profile", result, started)
+    return result
 
 
 def _is_midnight_kst(cfg: SyncConfig) -> bool:
@@ -265,7 +464,7 @@ def _is_midnight_kst(cfg: SyncConfig) -> bool:
     return now.hour == cfg.full_at_hour_kst and now.minute == cfg.full_at_minute_kst
 
 
-def _sync_loop() -> None:
+def _sync_loop(stop: threading.Event) -> None:
     cfg = _load_config()
     if not cfg:
         return
@@ -274,37 +473,41 @@ def _sync_loop() -> None:
     last_profile_date_kst: datetime | None = None
     check_interval = 60
 
-    while True:
+    while not stop.is_set():
         try:
             now_ts = time.time()
             now_kst = datetime.now(KST)
 
             # Password: every sync_password_interval_seconds
             if now_ts - last_password_run >= cfg.password_interval_seconds:
-                sync_password_once()
+                sync_password_once(stop)
                 last_password_run = now_ts
 
             # Profile: once per day when we're in the configured hour (KST)
             if now_kst.hour == cfg.full_at_hour_kst and (
                 last_profile_date_kst is None or now_kst.date() > last_profile_date_kst.date()
             ):
-                sync_profile_once()
+                sync_profile_once(stop)
                 last_profile_date_kst = now_kst
         except Exception:
             logger.exception("user sync failed")
 
-        time.sleep(check_interval)
+        stop.wait(check_interval)
 
 
-def start_user_sync_thread() -> None:
+def start_user_sync_thread(stop: threading.Event | None = None) -> threading.Thread | None:
+    """Start the sync loop; it exits once `stop` is set (the scheduler sets it when leadership is lost)."""
+    global _sync_thread
     cfg = _load_config()
     if not cfg:
-        return
-    t = threading.Thread(target=_sync_loop, name="user-sync", daemon=True)
+        return None
+    t = threading.Thread(target=_sync_loop, args=(stop or threading.Event(),), name="user-sync", daemon=True)
     t.start()
+    _sync_thread = t
     logger.info(
         "user sync started: password every %ds, profile at %02d:%02d KST",
         cfg.password_interval_seconds,
         cfg.full_at_hour_kst,
         cfg.full_at_minute_kst,
     )
+    return t
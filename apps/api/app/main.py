@@ -3,13 +3,16 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 import os
 
-from .routers import auth, health, tickets, comments, uploads, attachments, me, admin_users, notices, faqs, ticket_categories, projects, users, notifications, contact_assignments
+from .routers import auth, health, tickets, comments, uploads, attachments, me, admin_users, admin_stats, admin_exports, admin_mail, notices, faqs, ticket_categories, projects, users, notifications, contact_assignments
 from .models.user import Base
 from .db import engine, SessionLocal
 from .core.seed import seed_ticket_categories
 from .core.settings import settings
-from .core.user_sync import start_user_sync_thread
-from .services.mail_service import start_mail_worker_thread
+from .core.user_sync import dispose_source_engine
+from .services.export_jobs import start_export_worker_thread
+from .services.mail_dispatch import start_mail_dispatcher, stop_mail_dispatcher
+from .services.scheduler import start_scheduler, stop_scheduler
+from .services.notification_stream import start_notification_listener_thread
 
 import app.models.ticket  # noqa: F401
 import app.models.comment  # noqa: F401
@@ -22,6 +25,9 @@ import app.models.sync_state  # noqa: F401
 import app.models.contact_assignment  # noqa: F401
 import app.models.contact_assignment_member  # noqa: F401
 import app.models.mail_log  # noqa: F401
+import app.models.ticket_daily_stat  # noqa: F401
+import app.models.export_job  # noqa: F401
+import app.models.notification  # noqa: F401
 
 
 app = FastAPI(title="IT Service Desk API")
@@ -45,14 +51,17 @@ def on_startup():
             conn.execute(text("ALTER TABLE users ADD COLUMN IF NOT EXISTS is_verified BOOLEAN NOT NULL DEFAULT TRUE"))
             conn.execute(text("ALTER TABLE users ADD COLUMN IF NOT EXISTS created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()"))
             conn.execute(text("ALTER TABLE users ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()"))
+            conn.execute(text("ALTER TABLE users ADD COLUMN IF NOT EXISTS sync_hash VARCHAR(32)"))
 
         # Seed ticket categories only. admin/test 등 기본 사용자는 생성하지 않음.
         with SessionLocal() as session:
             seed_ticket_categories(session)
 
-    # Start periodic user sync (if enabled).
-    start_user_sync_thread()
-    start_mail_worker_thread()
+    # 주기 작업(사용자 동기화·메일 발송·mail_logs 보존)은 advisory lock을 잡은 리더 프로세스 하나만 실행
+    start_scheduler()
+    start_mail_dispatcher()
+    start_export_worker_thread()
+    start_notification_listener_thread()
 
     if settings.AUTO_DB_BOOTSTRAP:
         # Migrate tickets to category_id-only schema if legacy columns exist.
@@ -80,6 +89,15 @@ def on_startup():
             conn.execute(text("ALTER TABLE tickets DROP COLUMN IF EXISTS category"))
 
 
+@app.on_event("shutdown")
+def on_shutdown():
+    # 응답 후 미뤄 둔 메일 알림이 남아 있으면 처리하고 종료
+    stop_mail_dispatcher()
+    # 리더였다면 작업을 멈추고 잠금을 풀어 다른 프로세스가 바로 이어받게 한다
+    stop_scheduler()
+    dispose_source_engine()
+
+
 app.include_router(health.router)
 app.include_router(auth.router)
 app.include_router(tickets.router)
@@ -88,6 +106,9 @@ app.include_router(uploads.router)
 app.include_router(attachments.router)
 app.include_router(me.router)
 app.include_router(admin_users.router)
+app.include_router(admin_stats.router)
+app.include_router(admin_exports.router)
+app.include_router(admin_mail.router)
 app.include_router(notices.router)
 app.include_router(faqs.router)
 app.include_router(ticket_categories.router)
@@ -109,4 +130,6 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 목록 API의 키셋 페이지네이션 커서(X-Next-Cursor)를 브라우저에서 읽을 수 있도록 노출
+    expose_headers=[tickets.NEXT_CURSOR_HEADER],
 )
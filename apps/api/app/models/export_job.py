@@ -0,0 +1,31 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, String, Text, func
+from .user import Base
+
+
+class ExportJob(Base):
+    """데이터 추출 백그라운드 작업. status: queued | running | done | failed"""
+
+    __tablename__ = "export_jobs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    kind: Mapped[str] = mapped_column(String(32), default="tickets")
+    format: Mapped[str] = mapped_column(String(8))
+    params: Mapped[str] = mapped_column(Text)  # TicketExportIn JSON
+    status: Mapped[str] = mapped_column(String(20), default="queued", index=True)
+    requested_emp_no: Mapped[str] = mapped_column(String(50), ForeignKey("users.emp_no"), index=True)
+
+    rows_total: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    rows_scanned: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    rows_written: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+
+    key: Mapped[str | None] = mapped_column(String(1024), nullable=True)  # storage key
+    filename: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    content_type: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    size: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    started_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,10 +1,29 @@
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func, text
 from .user import Base
 
 
 class MailLog(Base):
     __tablename__ = "mail_logs"
+    __table_args__ = (
+        # 쿨다운 확인(같은 수신자·이벤트의 최근 발송 여부): 발송 완료 건만 담은 부분 인덱스.
+        # ticket_id는 IS NOT DISTINCT FROM 비교라 키로 쓰이지 않으므로 INCLUDE로 두어 인덱스만으로 판단한다.
+        Index(
+            "ix_mail_logs_cooldown",
+            "recipient_email",
+            "event_type",
+            "created_at",
+            postgresql_where=text("status = 'sent'"),
+            postgresql_include=["ticket_id"],
+        ),
+        # 발송 지표(최근 N분 발송 건수·지연·분당 처리량): 발송 완료 시각 범위를 인덱스만으로 읽는다
+        Index(
+            "ix_mail_logs_sent_at",
+            "last_attempt_at",
+            postgresql_where=text("status = 'sent'"),
+            postgresql_include=["created_at"],
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     event_key: Mapped[str] = mapped_column(String(200), unique=True, index=True)
@@ -26,3 +45,32 @@ class MailLog(Base):
     updated_at: Mapped[DateTime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+
+
+class MailLogArchive(Base):
+    """보존 기간이 지난 mail_logs 행의 보관 테이블 (services/mail_retention.py가 옮김).
+    티켓이 삭제돼도 남도록 FK는 두지 않는다."""
+
+    __tablename__ = "mail_logs_archive"
+    __table_args__ = (
+        # 월 단위 조회·정리용
+        Index("ix_mail_logs_archive_created_at", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    event_key: Mapped[str] = mapped_column(String(200))
+    event_type: Mapped[str] = mapped_column(String(64))
+    ticket_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    recipient_emp_no: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    recipient_email: Mapped[str] = mapped_column(String(255))
+    subject: Mapped[str] = mapped_column(String(255))
+    body_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    body_html: Mapped[str | None] = mapped_column(Text, nullable=True)
+    status: Mapped[str] = mapped_column(String(20))
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    last_attempt_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    next_attempt_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True))
+    updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True))
+    archived_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
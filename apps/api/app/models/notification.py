@@ -0,0 +1,35 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, UniqueConstraint, func
+from .user import Base
+
+
+class Notification(Base):
+    """사용자별 인앱 알림함. 쓰기 시점(티켓 생성/상태 변경/재요청/답변)에 수신자별로 한 행씩 생성한다."""
+
+    __tablename__ = "notifications"
+    __table_args__ = (
+        # 같은 원본 이벤트가 두 번 반영되지 않도록 (수신자, 원본) 유일
+        UniqueConstraint("recipient_emp_no", "source_key", name="uq_notifications_recipient_source"),
+        # 피드 조회/안 읽은 수: 수신자별 id 범위 스캔
+        Index("ix_notifications_recipient_id", "recipient_emp_no", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    recipient_emp_no: Mapped[str] = mapped_column(String(50), ForeignKey("users.emp_no"))
+    # 예: event:{ticket_event_id}, ticket:{ticket_id}, comment:{comment_id} (기존 알림 id 형식 유지)
+    source_key: Mapped[str] = mapped_column(String(100))
+    type: Mapped[str] = mapped_column(String(32))
+    ticket_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("tickets.id", ondelete="CASCADE"), nullable=True)
+    ticket_title: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    message: Mapped[str] = mapped_column(String(255))
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class NotificationCursor(Base):
+    """사용자별 읽음 위치. last_read_id 이하의 알림은 읽은 것으로 본다."""
+
+    __tablename__ = "notification_cursors"
+
+    emp_no: Mapped[str] = mapped_column(String(50), ForeignKey("users.emp_no"), primary_key=True)
+    last_read_id: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,21 @@
+from datetime import date
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Date, Integer, String
+from .user import Base
+
+
+class TicketDailyStat(Base):
+    """티켓 통계 롤업: 생성일(KST) × 현재 상태 × 작업구분 × 카테고리 × 요청자 부서/직급별 건수.
+
+    미지정 값은 NULL 대신 ''(문자열) / 0(카테고리)으로 저장해 PK(업서트 대상)로 쓸 수 있게 한다.
+    """
+
+    __tablename__ = "ticket_daily_stats"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    status: Mapped[str] = mapped_column(String(32), primary_key=True)
+    work_type: Mapped[str] = mapped_column(String(64), primary_key=True, server_default="")
+    category_id: Mapped[int] = mapped_column(Integer, primary_key=True, server_default="0")
+    department: Mapped[str] = mapped_column(String(100), primary_key=True, server_default="")
+    requester_title: Mapped[str] = mapped_column(String(100), primary_key=True, server_default="")
+    ticket_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
@@ -16,6 +16,8 @@ class User(Base):
     department: Mapped[str | None] = mapped_column(String(100), nullable=True)
     email: Mapped[str | None] = mapped_column(String(255), nullable=True)
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False)
+    # 사용자 동기화가 마지막으로 쓴 원본 값(이름·직급·부서·이메일·비밀번호)의 해시. 같으면 쓰기를 생략한다.
+    sync_hash: Mapped[str | None] = mapped_column(String(32), nullable=True)
 
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,161 @@
+import json
+from urllib.parse import quote
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from ..core.current_user import get_current_user
+from ..core.storage import get_presigned_get_url
+from ..db import SessionLocal, get_session
+from ..models.export_job import ExportJob
+from ..models.user import User
+from ..schemas.ticket_export import ExportJobOut, TicketExportIn
+from ..services.export_jobs import create_export_job, is_object_storage, job_progress, local_path_for_key
+from ..services.ticket_export import MEDIA_TYPES, export_filename, iter_ticket_export, validate_export_params
+
+
+router = APIRouter(prefix="/admin", tags=["admin-exports"])
+
+
+def require_staff(user: User) -> None:
+    if user.role != "admin":
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+
+def split_csv_param(value: str | None) -> list[str]:
+    if not value:
+        return []
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def parse_export_query(
+    format: str,
+    columns: str | None,
+    created_year_include: str | None,
+    created_day_range_percent: str | None,
+    filter_rules: str | None,
+) -> TicketExportIn:
+    try:
+        day_range = split_csv_param(created_day_range_percent) or ["0", "100"]
+        params = TicketExportIn(
+            format=format,
+            columns=split_csv_param(columns),
+            created_year_include=split_csv_param(created_year_include),
+            created_day_range_percent=tuple(day_range),
+            filter_rules=json.loads(filter_rules) if filter_rules else [],
+        )
+        validate_export_params(params)
+    except (ValueError, ValidationError) as exc:
+        # pydantic ValidationError / json.JSONDecodeError 모두 ValueError 계열
+        raise HTTPException(status_code=422, detail=str(exc))
+    return params
+
+
+def content_disposition(filename: str) -> str:
+    return f"attachment; filename=\"{filename}\"; filename*=UTF-8''{quote(filename)}"
+
+
+@router.get("/tickets/export")
+def export_tickets(
+    user: User = Depends(get_current_user),
+    format: str = Query(default="csv", pattern="^(csv|xlsx)$"),
+    columns: str | None = Query(default=None, description="출력 컬럼 키(쉼표 구분, 순서 유지). 비우면 전체"),
+    created_year_include: str | None = Query(default=None, description="작성 연도(쉼표 구분)"),
+    created_day_range_percent: str | None = Query(default=None, description="작성일 범위 퍼센트 'start,end' (0~100)"),
+    filter_rules: str | None = Query(default=None, description="FilterRule 배열(JSON)"),
+):
+    """데이터 추출 페이지와 동일한 컬럼/필터 모델로 티켓을 CSV/XLSX로 스트리밍 다운로드한다."""
+    require_staff(user)
+    params = parse_export_query(format, columns, created_year_include, created_day_range_percent, filter_rules)
+
+    def body():
+        # 요청 세션(get_session)은 응답 전송 전에 닫히므로 스트리밍 동안 쓸 세션을 따로 연다
+        with SessionLocal() as session:
+            yield from iter_ticket_export(session, params)
+
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[params.format],
+        headers={"Content-Disposition": content_disposition(export_filename(params.format))},
+    )
+
+
+def serialize_job(job: ExportJob) -> dict:
+    data = ExportJobOut.model_validate(job).model_dump()
+    data["progress"] = job_progress(job)
+    return data
+
+
+def get_done_job(session: Session, job_id: int) -> ExportJob:
+    job = session.get(ExportJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    if job.status != "done" or not job.key:
+        raise HTTPException(status_code=409, detail="Export is not ready")
+    return job
+
+
+@router.post("/exports", response_model=ExportJobOut)
+def create_export(
+    payload: TicketExportIn,
+    session: Session = Depends(get_session),
+    user: User = Depends(get_current_user),
+):
+    """추출 작업을 큐에 등록한다. 파일은 워커가 스토리지에 생성하고, 진행 상황은 GET /admin/exports/{id}로 조회."""
+    require_staff(user)
+    try:
+        validate_export_params(payload)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    job = create_export_job(session, payload, user)
+    return serialize_job(job)
+
+
+@router.get("/exports/{job_id}", response_model=ExportJobOut)
+def get_export(
+    job_id: int,
+    session: Session = Depends(get_session),
+    user: User = Depends(get_current_user),
+):
+    require_staff(user)
+    job = session.get(ExportJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return serialize_job(job)
+
+
+@router.get("/exports/{job_id}/download-url")
+def get_export_download_url(
+    job_id: int,
+    session: Session = Depends(get_session),
+    user: User = Depends(get_current_user),
+):
+    require_staff(user)
+    job = get_done_job(session, job_id)
+    if is_object_storage():
+        return {"url": get_presigned_get_url(key=job.key, expires_in=600), "expires_in": 600, "filename": job.filename}
+    return {"url": f"/admin/exports/{job_id}/download", "expires_in": 0, "filename": job.filename}
+
+
+@router.get("/exports/{job_id}/download")
+def download_export(
+    job_id: int,
+    session: Session = Depends(get_session),
+    user: User = Depends(get_current_user),
+):
+    require_staff(user)
+    job = get_done_job(session, job_id)
+    if is_object_storage():
+        return RedirectResponse(get_presigned_get_url(key=job.key, expires_in=600))
+
+    path = local_path_for_key(job.key)
+    if not path.exists():
+        raise HTTPException(status_code=404, detail="File missing on server")
+    # FileResponse는 Range 요청을 지원하므로 중단된 다운로드를 이어받을 수 있다
+    return FileResponse(
+        path=str(path),
+        media_type=job.content_type or "application/octet-stream",
+        filename=job.filename,
+    )
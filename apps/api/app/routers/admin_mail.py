@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.orm import Session
+
+from ..core.current_user import get_current_user
+from ..db import get_session
+from ..models.user import User
+from ..schemas.mail_queue import MailQueueStatsOut
+from ..services.mail_metrics import collect_mail_queue_stats, render_prometheus
+
+
+router = APIRouter(prefix="/admin/mail", tags=["admin-mail"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def require_staff(user: User) -> None:
+    if user.role != "admin":
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+
+@router.get("/queue-stats", response_model=MailQueueStatsOut)
+def get_mail_queue_stats(
+    session: Session = Depends(get_session),
+    user: User = Depends(get_current_user),
+    window_minutes: int = Query(default=60, ge=1, le=1440),
+):
+    """메일 큐 현황: 대기/재시도/실패 건수, 가장 오래된 미발송 건, 최근 N분 발송 지연 분위수와 분당 처리량."""
+    require_staff(user)
+    return collect_mail_queue_stats(session, window_minutes)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_mail_metrics(
+    session: Session = Depends(get_session),
+    user: User = Depends(get_current_user),
+    window_minutes: int = Query(default=5, ge=1, le=1440),
+):
+    """queue-stats와 같은 값을 Prometheus text format으로 반환 (관리자 토큰으로 scrape)."""
+    require_staff(user)
+    stats = collect_mail_queue_stats(session, window_minutes)
+    return PlainTextResponse(render_prometheus(stats), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,155 @@
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import Date, and_, cast, func, literal_column, select
+from sqlalchemy.orm import Session
+
+from ..core.current_user import get_current_user
+from ..db import get_session
+from ..models.ticket import Ticket
+from ..models.ticket_daily_stat import TicketDailyStat
+from ..models.user import User
+from ..schemas.admin_stats import TicketStatsOut
+
+
+router = APIRouter(prefix="/admin/stats", tags=["admin-stats"])
+
+KST = ZoneInfo("Asia/Seoul")
+PENDING_STATUSES = ("open", "in_progress")
+DONE_STATUSES = ("resolved", "closed")
+ALLOWED_BUCKETS = {"day": "day", "week": "week", "month": "month"}
+
+
+def require_staff(user: User) -> None:
+    if user.role != "admin":
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+
+def kst_start_of(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=KST)
+
+
+def bucket_start(day: date, bucket: str) -> date:
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())
+    if bucket == "month":
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket(start: date, bucket: str) -> date:
+    if bucket == "week":
+        return start + timedelta(days=7)
+    if bucket == "month":
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def fill_series(counts: dict[date, int], date_from: date | None, date_to: date | None, bucket: str) -> list[dict]:
+    """기간이 주어지면 빈 구간을 0으로 채워 연속된 시계열로 반환한다."""
+    if date_from is None or date_to is None:
+        return [{"bucket_start": k, "count": counts[k]} for k in sorted(counts)]
+    series: list[dict] = []
+    cur = bucket_start(date_from, bucket)
+    while cur <= date_to:
+        series.append({"bucket_start": cur, "count": counts.get(cur, 0)})
+        cur = next_bucket(cur, bucket)
+    return series
+
+
+def build_summary(session: Session) -> dict:
+    today = datetime.now(KST).date()
+    yesterday = today - timedelta(days=1)
+    today_start = kst_start_of(today)
+    yesterday_start = kst_start_of(yesterday)
+
+    # 건수 KPI는 롤업에서 합산
+    counts = session.execute(
+        select(
+            func.coalesce(func.sum(TicketDailyStat.ticket_count), 0).label("total_tickets"),
+            func.coalesce(
+                func.sum(TicketDailyStat.ticket_count).filter(TicketDailyStat.status.in_(PENDING_STATUSES)), 0
+            ).label("total_pending"),
+            func.coalesce(func.sum(TicketDailyStat.ticket_count).filter(TicketDailyStat.day == today), 0).label(
+                "today_new"
+            ),
+            func.coalesce(
+                func.sum(TicketDailyStat.ticket_count).filter(TicketDailyStat.day == yesterday), 0
+            ).label("yesterday_new"),
+        )
+    ).mappings().one()
+
+    # 완료 KPI는 완료 시각 기준이라 롤업 키(생성일)로는 구할 수 없음.
+    # 완료 처리 시 updated_at이 갱신되므로 updated_at 인덱스로 어제 이후 변경분만 스캔한다.
+    done_at = func.coalesce(Ticket.resolved_at, Ticket.closed_at, Ticket.updated_at)
+    is_done = Ticket.status.in_(DONE_STATUSES)
+    done = session.execute(
+        select(
+            func.count(Ticket.id).filter(done_at >= today_start).label("today_done"),
+            func.count(Ticket.id)
+            .filter(and_(done_at >= yesterday_start, done_at < today_start))
+            .label("yesterday_done"),
+        ).where(is_done, Ticket.updated_at >= yesterday_start)
+    ).mappings().one()
+
+    return {**{k: int(v or 0) for k, v in counts.items()}, **{k: int(v or 0) for k, v in done.items()}}
+
+
+@router.get("", response_model=TicketStatsOut)
+def get_ticket_stats(
+    session: Session = Depends(get_session),
+    user: User = Depends(get_current_user),
+    date_from: date | None = Query(default=None),
+    date_to: date | None = Query(default=None),
+    bucket: str = Query(default="day"),
+):
+    """대시보드 통계. 기간(KST, 양끝 포함) 내 요청 건수를 ticket_daily_stats 롤업에서 합산해 반환한다."""
+    require_staff(user)
+
+    if bucket not in ALLOWED_BUCKETS:
+        raise HTTPException(status_code=422, detail=f"Invalid bucket: {bucket}")
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=422, detail="date_from must be before date_to")
+
+    conditions = []
+    if date_from is not None:
+        conditions.append(TicketDailyStat.day >= date_from)
+    if date_to is not None:
+        conditions.append(TicketDailyStat.day <= date_to)
+
+    def grouped(key_expr, *, empty=None) -> list[tuple]:
+        # 롤업은 NULL 대신 ''/0을 키로 저장하므로 응답 시 다시 None으로 돌려준다
+        total = func.sum(TicketDailyStat.ticket_count)
+        stmt = (
+            select(key_expr.label("key"), total.label("count"))
+            .where(*conditions)
+            .group_by(key_expr)
+            .having(total > 0)
+            .order_by(total.desc())
+        )
+        return [(None if row.key == empty else row.key, int(row.count)) for row in session.execute(stmt).all()]
+
+    by_status = grouped(TicketDailyStat.status)
+    by_work_type = grouped(TicketDailyStat.work_type, empty="")
+    by_category = grouped(TicketDailyStat.category_id, empty=0)
+    by_title = grouped(TicketDailyStat.requester_title, empty="")
+    by_department = grouped(TicketDailyStat.department, empty="")
+
+    # SELECT/GROUP BY 식이 동일해야 하므로 바인드 파라미터 대신 리터럴 사용
+    bucket_expr = cast(func.date_trunc(literal_column(f"'{ALLOWED_BUCKETS[bucket]}'"), TicketDailyStat.day), Date)
+    series_counts = {key: count for key, count in grouped(bucket_expr) if key is not None}
+
+    return {
+        "date_from": date_from,
+        "date_to": date_to,
+        "bucket": bucket,
+        "total": sum(count for _, count in by_status),
+        "summary": build_summary(session),
+        "by_status": [{"key": k, "count": c} for k, c in by_status],
+        "by_work_type": [{"key": k, "count": c} for k, c in by_work_type],
+        "by_category": [{"category_id": k, "count": c} for k, c in by_category],
+        "by_requester_title": [{"key": k, "count": c} for k, c in by_title],
+        "by_requester_department": [{"key": k, "count": c} for k, c in by_department],
+        "series": fill_series(series_counts, date_from, date_to, bucket),
+    }
@@ -6,7 +6,9 @@ from ..db import get_session
 from ..models.user import User
 from ..models.ticket import Ticket
 from ..core.current_user import get_current_user
-from ..schemas.admin_user import AdminUserOut, UserRoleUpdateIn
+from ..core.user_cache import invalidate_users
+from ..core.user_sync import source_pool_stats
+from ..schemas.admin_user import AdminUserOut, SyncSourcePoolOut, UserRoleUpdateIn
 
 
 router = APIRouter(prefix="/admin/users", tags=["admin-users"])
@@ -56,6 +58,17 @@ def list_users(
     return [AdminUserOut(**row) for row in rows]
 
 
+@router.get("/sync-source-pool", response_model=SyncSourcePoolOut)
+def get_sync_source_pool(user: User = Depends(get_current_user)):
+    """사용자 동기화가 쓰는 원본 DB 연결 풀 현황 (요청을 처리한 API 프로세스 기준).
+
+    동기화는 스케줄러 리더 프로세스(또는 python -m app.worker)에서만 돌므로, runs_sync=False인 응답은
+    실제 동기화 풀이 아니다. 실제 풀 현황은 동기화를 돌린 프로세스가 실행마다 로그(user ... sync ... pool=)로 남긴다.
+    """
+    require_staff(user)
+    return source_pool_stats()
+
+
 @router.patch("/{emp_no}/role", response_model=AdminUserOut)
 def update_role(
     emp_no: str,
@@ -75,6 +88,7 @@ def update_role(
 
     target.role = payload.role
     session.commit()
+    invalidate_users([emp_no])
 
     pending_case = case((Ticket.status.in_(PENDING_STATUSES), 1), else_=0)
     stmt = (
@@ -1,5 +1,4 @@
 from datetime import datetime
-import logging
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from sqlalchemy import select
@@ -12,8 +11,8 @@ from ..core.current_user import get_current_user
 from ..core.tiptap import dump_tiptap, is_empty_doc, load_tiptap
 from ..models.user import User
 from ..models.ticket_category import TicketCategory
-from ..services.assignment_service import get_category_admins_for_categories, get_ticket_category_ids, get_ticket_category_labels
-from ..services.mail_events import notify_admin_commented, notify_requester_commented
+from ..services.mail_dispatch import defer_comment_created
+from ..services.notification_inbox import add_comment_notifications
 
 router = APIRouter(tags=["comments"])
 
@@ -103,42 +102,14 @@ def create_comment(
     session.add(comment)
     # 업데이트 시각 갱신
     ticket.updated_at = datetime.utcnow()
+    session.flush()
+    add_comment_notifications(session, ticket, comment, user)
     session.commit()
     session.refresh(comment)
 
-    # notify_email이 True일 때만 메일 발송
+    # notify_email이 True일 때만 메일 발송 (응답 이후 디스패처가 처리)
     if payload.notify_email:
-        try:
-            requester = session.get(User, ticket.requester_emp_no)
-            if requester:
-                category_label = get_ticket_category_labels(session, ticket)
-                if user.emp_no == ticket.requester_emp_no:
-                    admins: list[User] = []
-                    if ticket.assignee_emp_no:
-                        assignee = session.get(User, ticket.assignee_emp_no)
-                        if assignee and assignee.role == "admin":
-                            admins = [assignee]
-                    if not admins:
-                        category_ids = get_ticket_category_ids(session, ticket)
-                        admins = get_category_admins_for_categories(session, category_ids)
-                    notify_requester_commented(
-                        ticket,
-                        comment,
-                        requester,
-                        admins,
-                        category_label=category_label,
-                    )
-                else:
-                    notify_admin_commented(
-                        ticket,
-                        comment,
-                        requester,
-                        user,
-                        category_label=category_label,
-                    )
-        except Exception:
-            logger = logging.getLogger(__name__)
-            logger.exception("답변 메일 발송 처리 실패 (comment_id=%s)", comment.id)
+        defer_comment_created(comment.id, user.emp_no)
 
     return CommentOut(
         id=comment.id,
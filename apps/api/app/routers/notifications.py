@@ -1,216 +1,147 @@
-from datetime import datetime, timedelta
-import json
-from fastapi import APIRouter, Depends
-from sqlalchemy import select, desc
+import asyncio
+import time
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from ..db import get_session
-from ..core.current_user import get_current_user
-from ..models.event import TicketEvent
-from ..models.ticket import Ticket, TicketAssignee
-from ..models.comment import TicketComment
+from ..db import SessionLocal, get_session
+from ..core.config import settings
+from ..core.current_user import get_current_user, get_stream_user
+from ..core.security import create_stream_token
+from ..models.notification import Notification
 from ..models.user import User
-from ..models.contact_assignment_member import ContactAssignmentMember
-from ..schemas.notification import NotificationOut
+from ..schemas.notification import (
+    NotificationOut,
+    NotificationReadIn,
+    NotificationStateOut,
+    NotificationStreamTokenOut,
+)
+from ..services.notification_inbox import count_unread, get_last_read_id, get_latest_id, list_inbox, mark_read
+from ..services import notification_stream
 
 router = APIRouter(tags=["notifications"])
 
-
-def is_staff(user: User) -> bool:
-    return user.role == "admin"
-
-
-STATUS_LABELS = {
-    "open": "접수",
-    "in_progress": "진행",
-    "resolved": "완료",
-    "closed": "사업 검토",
-}
-
-
-def _status_label(value: str | None) -> str:
-    if not value:
-        return "-"
-    s = value.lower()
-    if s in ("open", "new", "pending"):
-        return STATUS_LABELS["open"]
-    if s in ("in_progress", "processing", "assigned", "working", "progress"):
-        return STATUS_LABELS["in_progress"]
-    if s in ("resolved", "done", "completed"):
-        return STATUS_LABELS["resolved"]
-    if s in ("closed", "review", "business_review"):
-        return STATUS_LABELS["closed"]
-    return value
-
-
-def _event_message(event: TicketEvent) -> str:
-    if event.type == "ticket_created":
-        return "요청이 접수되었습니다."
-    if event.type == "reopened":
-        return "재요청이 접수되었습니다."
-    if event.type == "status_changed":
-        if event.from_value or event.to_value:
-            before = _status_label(event.from_value)
-            after = _status_label(event.to_value)
-            return f"{before} -> {after}"
-    if event.type == "requester_updated" and event.note:
-        try:
-            payload = json.loads(event.note)
-            summary = payload.get("summary")
-            if isinstance(summary, str) and summary.strip():
-                return summary
-        except Exception:
-            return event.note
-    return event.note or ""
+# 프록시가 유휴 연결을 끊지 않도록 주기적으로 주석 라인을 보낸다
+STREAM_KEEPALIVE_SECONDS = 25
+# 일정 시간 후 스트림을 닫아, 클라이언트가 새 스트림 토큰을 받으며(액세스 토큰 재확인) 다시 연결하게 한다
+STREAM_MAX_SECONDS = 30 * 60
+STREAM_RETRY_MS = 5000
+
+
+def serialize_notification(n: Notification, last_read_id: int) -> NotificationOut:
+    return NotificationOut(
+        id=n.source_key,
+        seq=n.id,
+        ticket_id=n.ticket_id,
+        ticket_title=n.ticket_title,
+        type=n.type,
+        message=n.message,
+        created_at=n.created_at,
+        read=n.id <= last_read_id,
+    )
 
 
 @router.get("/notifications", response_model=list[NotificationOut])
 def list_notifications(
+    since: int | None = Query(default=None, ge=0, description="이 seq 이후에 생긴 알림만 조회"),
+    session: Session = Depends(get_session),
+    user: User = Depends(get_current_user),
+):
+    # 알림은 쓰기 시점에 notifications 테이블로 팬아웃되므로 수신자별 인덱스 범위 스캔 1회로 끝난다
+    last_read_id = get_last_read_id(session, user.emp_no)
+    return [serialize_notification(n, last_read_id) for n in list_inbox(session, user.emp_no, since=since)]
+
+
+def _load_since(emp_no: str, since: int | None) -> tuple[int, list[tuple[int, str]]]:
+    """since 이후 알림을 SSE data(JSON)로 만든다. since가 없으면 현재 위치만 돌려준다."""
+    with SessionLocal() as session:
+        if since is None:
+            return get_latest_id(session, emp_no), []
+        items = list_inbox(session, emp_no, since=since)
+        if not items:
+            return since, []
+        last_read_id = get_last_read_id(session, emp_no)
+        # 오래된 것부터 보내서 클라이언트의 Last-Event-ID가 항상 마지막 seq가 되게 한다
+        payloads = [(n.id, serialize_notification(n, last_read_id).model_dump_json()) for n in reversed(items)]
+        return items[0].id, payloads
+
+
+def _parse_seq(value: str | None) -> int | None:
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+@router.post("/notifications/stream-token", response_model=NotificationStreamTokenOut)
+def issue_stream_token(user: User = Depends(get_current_user)):
+    """/notifications/stream?token= 에 쓸 짧은 스트림 전용 토큰을 발급한다 (연결할 때마다 새로 받는다)."""
+    return NotificationStreamTokenOut(
+        token=create_stream_token(user.emp_no),
+        expires_in=settings.stream_token_expires_seconds,
+    )
+
+
+@router.get("/notifications/stream")
+async def stream_notifications(
+    request: Request,
+    since: int | None = Query(default=None, ge=0, description="이 seq 이후의 알림부터 전송 (생략 시 연결 이후 알림만)"),
+    user: User = Depends(get_stream_user),
+):
+    """새 알림을 Server-Sent Events(event: notification, id: seq)로 전달한다."""
+    emp_no = user.emp_no
+    start = _parse_seq(request.headers.get("last-event-id"))
+    if start is None:
+        start = since
+
+    async def body():
+        wakeup = notification_stream.subscribe(emp_no)
+        try:
+            yield f"retry: {STREAM_RETRY_MS}\n\n"
+            seq, payloads = await run_in_threadpool(_load_since, emp_no, start)
+            opened = time.monotonic()
+            while True:
+                for item_seq, data in payloads:
+                    yield f"id: {item_seq}\nevent: notification\ndata: {data}\n\n"
+                if time.monotonic() - opened > STREAM_MAX_SECONDS or await request.is_disconnected():
+                    return
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    payloads = []
+                    continue
+                wakeup.clear()
+                seq, payloads = await run_in_threadpool(_load_since, emp_no, seq)
+        finally:
+            notification_stream.unsubscribe(emp_no, wakeup)
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/notifications/unread-count", response_model=NotificationStateOut)
+def get_unread_count(
     session: Session = Depends(get_session),
     user: User = Depends(get_current_user),
 ):
-    items: list[NotificationOut] = []
-    seen_event_ids: set[int] = set()
-
-    # 1) Ticket events for the user's own requests (SMTP 조건과 동일: 요청 접수, 상태 변경만. 담당자 배정/변경은 SMTP에서 미발송)
-    event_stmt = (
-        select(TicketEvent, Ticket)
-        .join(Ticket, TicketEvent.ticket_id == Ticket.id)
-        .where(Ticket.requester_emp_no == user.emp_no)
-        .where(TicketEvent.type.in_(["ticket_created", "status_changed"]))
-        .order_by(desc(TicketEvent.created_at), desc(TicketEvent.id))
-        .limit(50)
+    return NotificationStateOut(
+        last_read_id=get_last_read_id(session, user.emp_no),
+        unread_count=count_unread(session, user.emp_no),
     )
-    for event, ticket in session.execute(event_stmt).all():
-        if event.type == "status_changed" and event.to_value not in ("resolved", "closed", "in_progress"):
-            continue
-        created_at = event.created_at or ticket.updated_at or ticket.created_at
-        if not created_at:
-            continue
-        if event.id in seen_event_ids:
-            continue
-        items.append(
-            NotificationOut(
-                id=f"event:{event.id}",
-                ticket_id=ticket.id,
-                ticket_title=ticket.title,
-                type=event.type,
-                message=_event_message(event),
-                created_at=created_at,
-            )
-        )
-        seen_event_ids.add(event.id)
-
-    if is_staff(user):
-        cutoff = datetime.utcnow() - timedelta(days=30)
-
-        # 2) Reopened tickets for assignees (재요청 접수)
-        reopen_stmt = (
-            select(TicketEvent, Ticket)
-            .join(Ticket, TicketEvent.ticket_id == Ticket.id)
-            .where(TicketEvent.type == "reopened")
-            .where(TicketEvent.created_at >= cutoff)
-            .order_by(desc(TicketEvent.created_at), desc(TicketEvent.id))
-            .limit(50)
-        )
-        for event, ticket in session.execute(reopen_stmt).all():
-            assignee_emp_nos = set(
-                session.scalars(select(TicketAssignee.emp_no).where(TicketAssignee.ticket_id == ticket.id)).all()
-            )
-            if ticket.assignee_emp_no:
-                assignee_emp_nos.add(ticket.assignee_emp_no)
-            if user.emp_no not in assignee_emp_nos:
-                continue
-            created_at = event.created_at or ticket.updated_at or ticket.created_at
-            if not created_at:
-                continue
-            if event.id in seen_event_ids:
-                continue
-            items.append(
-                NotificationOut(
-                    id=f"event:{event.id}",
-                    ticket_id=ticket.id,
-                    ticket_title=ticket.title,
-                    type="reopened",
-                    message="재요청이 접수되었습니다",
-                    created_at=created_at,
-                )
-            )
-            seen_event_ids.add(event.id)
-
-        # 3) New tickets for staff (카테고리 담당자만)
-        new_stmt = (
-            select(Ticket)
-            .join(ContactAssignmentMember, ContactAssignmentMember.category_id == Ticket.category_id)
-            .where(ContactAssignmentMember.emp_no == user.emp_no)
-            .where(Ticket.created_at >= cutoff)
-            .order_by(desc(Ticket.created_at), desc(Ticket.id))
-            .limit(50)
-        )
-        for ticket in session.scalars(new_stmt).all():
-            items.append(
-                NotificationOut(
-                    id=f"ticket:{ticket.id}",
-                    ticket_id=ticket.id,
-                    ticket_title=ticket.title,
-                    type="new_ticket",
-                    message="새 요청이 등록되었습니다.",
-                    created_at=ticket.created_at,
-                )
-            )
-
-        # 4) Requester comments on assigned tickets (SMTP notify_requester_commented와 동일 조건)
-        comment_stmt = (
-            select(TicketComment, Ticket, User)
-            .join(Ticket, TicketComment.ticket_id == Ticket.id)
-            .join(User, TicketComment.author_emp_no == User.emp_no)
-            .where(Ticket.assignee_emp_no == user.emp_no)
-            .where(User.role == "requester")
-            .order_by(desc(TicketComment.created_at), desc(TicketComment.id))
-            .limit(50)
-        )
-        for comment, ticket, author in session.execute(comment_stmt).all():
-            created_at = comment.created_at or ticket.updated_at or ticket.created_at
-            if not created_at:
-                continue
-            snippet = comment.title or "답변이 등록되었습니다."
-            items.append(
-                NotificationOut(
-                    id=f"comment:{comment.id}",
-                    ticket_id=ticket.id,
-                    ticket_title=ticket.title,
-                    type="requester_commented",
-                    message=snippet,
-                    created_at=created_at,
-                )
-            )
-        # SMTP에는 "담당자로 나 배정" 메일 없음 → 인앱에서도 제외
-    else:
-        # 3) Staff comments on the user's tickets
-        comment_stmt = (
-            select(TicketComment, Ticket, User)
-            .join(Ticket, TicketComment.ticket_id == Ticket.id)
-            .join(User, TicketComment.author_emp_no == User.emp_no)
-            .where(Ticket.requester_emp_no == user.emp_no)
-            .where(User.role == "admin")
-            .order_by(desc(TicketComment.created_at), desc(TicketComment.id))
-            .limit(50)
-        )
-        for comment, ticket, author in session.execute(comment_stmt).all():
-            created_at = comment.created_at or ticket.updated_at or ticket.created_at
-            if not created_at:
-                continue
-            snippet = comment.title or "답변이 등록되었습니다."
-            items.append(
-                NotificationOut(
-                    id=f"comment:{comment.id}",
-                    ticket_id=ticket.id,
-                    ticket_title=ticket.title,
-                    type="staff_commented",
-                    message=snippet,
-                    created_at=created_at,
-                )
-            )
-
-    items.sort(key=lambda i: i.created_at, reverse=True)
-    return items[:50]
+
+
+@router.post("/notifications/read", response_model=NotificationStateOut)
+def mark_notifications_read(
+    payload: NotificationReadIn,
+    session: Session = Depends(get_session),
+    user: User = Depends(get_current_user),
+):
+    """last_read_id(seq)까지 읽음 처리. 생략하면 현재까지 모두 읽음."""
+    last_read_id = mark_read(session, user.emp_no, payload.last_read_id)
+    return NotificationStateOut(last_read_id=last_read_id, unread_count=count_unread(session, user.emp_no))
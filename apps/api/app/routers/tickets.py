@@ -1,16 +1,17 @@
 from datetime import datetime
+import base64
 import logging
 import json
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import select, desc, case
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.orm import Session, defer
+from sqlalchemy import select, desc, case, tuple_
 
 from ..db import get_session
 from ..models.ticket import Ticket, TicketReopen, TicketAssignee, TicketCategoryLink
 from ..models.project import Project
 from ..models.project_member import ProjectMember
 from ..models.ticket_category import TicketCategory
-from ..schemas.ticket import TicketCreateIn, TicketOut, TicketUpdateIn, TicketAdminMetaUpdateIn
+from ..schemas.ticket import TicketCreateIn, TicketOut, TicketSummaryOut, TicketUpdateIn, TicketAdminMetaUpdateIn
 from ..schemas.reopen import ReopenCreateIn, ReopenOut, ReopenAsNewCreateIn
 from ..core.current_user import get_current_user
 from ..models.user import User
@@ -28,12 +29,18 @@ from ..core.tiptap import dump_tiptap, load_tiptap, is_empty_doc, extract_image_
 from ..core.settings import settings
 from ..core.storage import delete_object, extract_key_from_url, move_object
 from ..core.storage_keys import ticket_editor_key_from_src_key
-from ..services.assignment_service import get_category_admins, get_category_admins_for_categories, get_ticket_category_labels
-from ..services.mail_events import (
-    notify_admins_ticket_created,
-    notify_requester_status_changed,
-    notify_requester_ticket_created,
-    notify_assignees_reopen_received,
+from ..services.assignment_service import get_category_admins
+from ..services.mail_dispatch import defer_reopen_received, defer_status_changed, defer_ticket_created
+from ..services.notification_inbox import (
+    add_reopened_notifications,
+    add_status_changed_notifications,
+    add_ticket_created_notifications,
+)
+from ..services.ticket_stats import (
+    record_ticket_changed,
+    record_ticket_created,
+    record_ticket_deleted,
+    ticket_stat_key,
 )
 
 router = APIRouter(prefix="/tickets", tags=["tickets"])
@@ -142,13 +149,14 @@ def get_category_label(session: Session, category_id: int | None) -> str:
     return category.name or str(category_id)
 
 
-def serialize_ticket(
+def serialize_ticket_summary(
     t: Ticket,
     users: dict[str, User],
     projects: dict[int, Project] | None = None,
     category_map: dict[int, list[int]] | None = None,
     assignee_map: dict[int, list[str]] | None = None,
 ) -> dict:
+    """description(본문)을 제외한 티켓 직렬화. 본문 컬럼을 로드하지 않은 티켓에도 사용 가능."""
     project = projects.get(t.project_id) if projects and t.project_id else None
     category_ids = []
     if category_map and t.id in category_map:
@@ -179,7 +187,6 @@ def serialize_ticket(
     return {
         "id": t.id,
         "title": t.title,
-        "description": load_tiptap(t.description),
         "status": t.status,
         "priority": t.priority,
         "category_id": t.category_id,
@@ -202,6 +209,18 @@ def serialize_ticket(
     }
 
 
+def serialize_ticket(
+    t: Ticket,
+    users: dict[str, User],
+    projects: dict[int, Project] | None = None,
+    category_map: dict[int, list[int]] | None = None,
+    assignee_map: dict[int, list[str]] | None = None,
+) -> dict:
+    data = serialize_ticket_summary(t, users, projects, category_map, assignee_map)
+    data["description"] = load_tiptap(t.description)
+    return data
+
+
 @router.post("", response_model=TicketOut)
 def create_ticket(
     payload: TicketCreateIn,
@@ -262,6 +281,7 @@ def create_ticket(
         session.add(TicketAssignee(ticket_id=t.id, emp_no=emp_no))
     if assignee_emp_nos:
         t.assignee_emp_no = assignee_emp_nos[0]
+    record_ticket_created(session, t.id)
     session.commit()
     session.refresh(t)
     ev = TicketEvent(
@@ -273,6 +293,8 @@ def create_ticket(
         note=None,
     )
     session.add(ev)
+    session.flush()
+    add_ticket_created_notifications(session, t, ev)
     session.commit()
     user_ids: set[str] = {t.requester_emp_no}
     user_ids.update(assignee_emp_nos)
@@ -281,15 +303,8 @@ def create_ticket(
     projects = build_project_map(session, project_ids)
     assignee_map = {t.id: assignee_emp_nos} if assignee_emp_nos else {}
 
-    try:
-        category_label = ", ".join(c.name or str(c.id) for c in categories)
-        notify_requester_ticket_created(t, user, category_label=category_label)
-        if category_ids:
-            admins = get_category_admins_for_categories(session, category_ids)
-            notify_admins_ticket_created(t, user, admins, category_label=category_label)
-    except Exception:
-        logger = logging.getLogger(__name__)
-        logger.exception("티켓 접수 메일 발송 처리 실패 (ticket_id=%s)", t.id)
+    # 메일 렌더링·수신자 조회·큐 등록은 응답 이후 디스패처가 처리
+    defer_ticket_created(t.id, user.emp_no)
 
     return serialize_ticket(t, users, projects, {t.id: category_ids}, assignee_map)
 
@@ -382,16 +397,18 @@ def reopen_as_new_ticket(
         session.add(TicketAssignee(ticket_id=t.id, emp_no=emp_no))
     if assignee_emp_nos:
         t.assignee_emp_no = assignee_emp_nos[0]
-    session.add(
-        TicketEvent(
-            ticket_id=t.id,
-            actor_emp_no=user.emp_no,
-            type="ticket_created",
-            from_value=None,
-            to_value=None,
-            note=None,
-        )
+    ev = TicketEvent(
+        ticket_id=t.id,
+        actor_emp_no=user.emp_no,
+        type="ticket_created",
+        from_value=None,
+        to_value=None,
+        note=None,
     )
+    session.add(ev)
+    session.flush()
+    add_ticket_created_notifications(session, t, ev)
+    record_ticket_created(session, t.id)
     session.commit()
     session.refresh(t)
 
@@ -400,14 +417,7 @@ def reopen_as_new_ticket(
     user_ids = {t.requester_emp_no} | set(assignee_map.get(t.id, []))
     users = build_user_map(session, user_ids)
     projects = build_project_map(session, [t.project_id] if t.project_id else [])
-    try:
-        category_label = get_ticket_category_labels(session, t) or "-"
-        notify_requester_ticket_created(t, user, category_label=category_label)
-        if assignee_map.get(t.id):
-            assignees = [u for u in users.values() if u.emp_no in assignee_map.get(t.id, [])]
-            notify_assignees_reopen_received(t, user, assignees, category_label=category_label)
-    except Exception:
-        logging.getLogger(__name__).exception("reopen-as-new 메일 발송 실패 ticket_id=%s", t.id)
+    defer_reopen_received(t.id, user.emp_no, assignee_map.get(t.id, []))
 
     return {
         "ticket": serialize_ticket(t, users, projects, category_map_out, assignee_map),
@@ -461,6 +471,7 @@ def reopen_ticket(
     if is_empty_doc(payload.description):
         raise HTTPException(status_code=422, detail="재요청 사유를 입력해주세요.")
 
+    stat_before = ticket_stat_key(session, ticket_id)
     now = datetime.utcnow()
     r = TicketReopen(
         ticket_id=ticket_id,
@@ -492,6 +503,9 @@ def reopen_ticket(
         note=json.dumps({"reopen_id": r.id}, ensure_ascii=False),
     )
     session.add(ev)
+    session.flush()
+    add_reopened_notifications(session, t, ev)
+    record_ticket_changed(session, ticket_id, stat_before)
     session.commit()
     session.refresh(t)
 
@@ -502,14 +516,7 @@ def reopen_ticket(
     users = build_user_map(session, user_ids)
     projects = build_project_map(session, [t.project_id] if t.project_id else [])
 
-    try:
-        category_label = get_ticket_category_labels(session, t) or "-"
-        notify_requester_ticket_created(t, user, category_label=category_label)
-        if assignee_emp_nos:
-            assignees = [u for u in users.values() if u.emp_no in assignee_emp_nos]
-            notify_assignees_reopen_received(t, user, assignees, category_label=category_label)
-    except Exception:
-        logging.getLogger(__name__).exception("재요청 메일 발송 실패 ticket_id=%s", ticket_id)
+    defer_reopen_received(t.id, user.emp_no, assignee_emp_nos)
 
     return {
         "ticket": serialize_ticket(t, users, projects, category_map, {t.id: assignee_emp_nos}),
@@ -532,6 +539,7 @@ def update_ticket(
     if t.status != "open":
         raise HTTPException(status_code=422, detail="Only open tickets can be updated")
 
+    stat_before = ticket_stat_key(session, ticket_id)
     old_description_raw = t.description
     old_created_at = t.created_at
     old_updated_at = t.updated_at
@@ -643,6 +651,7 @@ def update_ticket(
         )
         session.add(ev)
 
+    record_ticket_changed(session, ticket_id, stat_before)
     session.commit()
     session.refresh(t)
     category_map = load_ticket_category_map(session, [t.id])
@@ -669,6 +678,7 @@ def delete_ticket(
         raise HTTPException(status_code=403, detail="Forbidden")
     if t.status != "open":
         raise HTTPException(status_code=422, detail="Only open tickets can be deleted")
+    stat_before = ticket_stat_key(session, ticket_id)
     attachments = session.scalars(select(Attachment).where(Attachment.ticket_id == ticket_id)).all()
     keys = set()
     for src in extract_image_sources(t.description):
@@ -696,6 +706,7 @@ def delete_ticket(
     for att in attachments:
         session.delete(att)
     session.delete(t)
+    record_ticket_deleted(session, stat_before)
     session.commit()
     return {"ok": True}
 
@@ -713,6 +724,7 @@ def admin_delete_ticket(
     if not t:
         raise HTTPException(status_code=404, detail="Not found")
 
+    stat_before = ticket_stat_key(session, ticket_id)
     attachments = session.scalars(select(Attachment).where(Attachment.ticket_id == ticket_id)).all()
     keys = set()
     for src in extract_image_sources(t.description):
@@ -749,6 +761,7 @@ def admin_delete_ticket(
         session.delete(log)
 
     session.delete(t)
+    record_ticket_deleted(session, stat_before)
     session.commit()
     return {"ok": True}
 
@@ -780,6 +793,7 @@ def update_status(
             detail=f"Invalid transition: {old} -> {new}",
         )
 
+    stat_before = ticket_stat_key(session, ticket_id)
     ticket.status = new
     now = datetime.utcnow()
     ticket.updated_at = now
@@ -808,20 +822,13 @@ def update_status(
         note=note,
     )
     session.add(ev)
+    session.flush()
+    add_status_changed_notifications(session, ticket, ev)
+    record_ticket_changed(session, ticket_id, stat_before)
 
     session.commit()
 
-    if new in ("resolved", "closed", "in_progress"):
-        try:
-            requester = session.get(User, ticket.requester_emp_no)
-            if requester:
-                category_label = get_ticket_category_labels(session, ticket)
-                notify_requester_status_changed(
-                    ticket, requester, new, old_status=old, category_label=category_label
-                )
-        except Exception:
-            logger = logging.getLogger(__name__)
-            logger.exception("상태 변경 메일 발송 처리 실패 (ticket_id=%s)", ticket_id)
+    defer_status_changed(ticket_id, new, old)
 
     return {"ok": True, "from": old, "to": new}
 
@@ -999,6 +1006,7 @@ def update_admin_meta(
         raise HTTPException(status_code=404, detail="Ticket not found")
 
     has_changes = False
+    stat_before = ticket_stat_key(session, ticket_id)
 
     # Update category without creating event
     if payload.category_ids is not None or payload.category_id is not None:
@@ -1027,6 +1035,7 @@ def update_admin_meta(
 
     if has_changes:
         ticket.updated_at = datetime.utcnow()
+        record_ticket_changed(session, ticket_id, stat_before)
         session.commit()
 
     return {"ok": True}
@@ -1034,10 +1043,37 @@ def update_admin_meta(
 
 ALLOWED_STATUS = {"open", "in_progress", "resolved", "closed"}
 ALLOWED_PRIORITY = {"low", "medium", "high", "urgent"}
+# 목록 기본 정렬 순서: 대기→진행→완료→사업검토
+STATUS_SORT_ORDER = ["open", "in_progress", "resolved", "closed"]
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
 
-@router.get("", response_model=list[TicketOut])
+def encode_list_cursor(t: Ticket) -> str:
+    """목록 마지막 티켓의 (상태 순위, 생성일, id)를 불투명 커서 문자열로 인코딩한다."""
+    raw = json.dumps(
+        {"r": STATUS_SORT_ORDER.index(t.status), "c": t.created_at.isoformat(), "i": t.id},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_list_cursor(cursor: str) -> tuple[int, datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        rank = int(data["r"])
+        created_at = datetime.fromisoformat(data["c"])
+        ticket_id = int(data["i"])
+    except Exception:
+        raise HTTPException(status_code=422, detail="Invalid cursor")
+    if not 0 <= rank < len(STATUS_SORT_ORDER):
+        raise HTTPException(status_code=422, detail="Invalid cursor")
+    return rank, created_at, ticket_id
+
+
+@router.get("", response_model=list[TicketOut | TicketSummaryOut])
 def list_tickets(
+    response: Response,
     session: Session = Depends(get_session),
     user: User = Depends(get_current_user),
     scope: str = Query(default="mine"),
@@ -1047,8 +1083,14 @@ def list_tickets(
     assignee_emp_no: str | None = Query(default=None),
     limit: int = Query(default=100, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
+    fields: str = Query(default="full", pattern="^(full|summary)$"),
 ):
+    summary = fields == "summary"
     stmt = select(Ticket)
+    if summary:
+        # 목록 화면은 본문을 쓰지 않으므로 description 컬럼 자체를 조회하지 않는다.
+        stmt = stmt.options(defer(Ticket.description, raiseload=True))
 
     if scope == "all":
         if user.role != "admin":
@@ -1080,8 +1122,36 @@ def list_tickets(
 
     # 정렬: 상태 필터 없으면 대기→진행→완료→사업검토 순, 각 상태 내에서는 생성일 최신순
     # 상태 필터 있으면(예: tickets/resolved, tickets/review) 생성일 최신순만
-    if status is not None:
-        stmt = stmt.order_by(desc(Ticket.created_at)).limit(limit).offset(offset)
+    if cursor is not None or offset == 0:
+        # 키셋 페이지네이션: 상태별로 (status, created_at) 인덱스를 타고 커서 위치부터 바로 읽는다.
+        # 계산식 정렬(case) 없이 상태 순서대로 이어 붙이므로 N페이지도 1페이지와 비용이 같다.
+        start_rank = 0
+        seek: tuple[datetime, int] | None = None
+        if cursor is not None:
+            start_rank, cursor_created_at, cursor_id = decode_list_cursor(cursor)
+            seek = (cursor_created_at, cursor_id)
+        if status is not None:
+            statuses = [status]
+            if seek is not None and STATUS_SORT_ORDER[start_rank] != status:
+                raise HTTPException(status_code=422, detail="Invalid cursor")
+        else:
+            statuses = STATUS_SORT_ORDER[start_rank:]
+
+        tickets: list[Ticket] = []
+        for idx, s in enumerate(statuses):
+            remaining = limit - len(tickets)
+            if remaining <= 0:
+                break
+            page_stmt = stmt if status is not None else stmt.where(Ticket.status == s)
+            if idx == 0 and seek is not None:
+                page_stmt = page_stmt.where(tuple_(Ticket.created_at, Ticket.id) < seek)
+            page_stmt = page_stmt.order_by(desc(Ticket.created_at), desc(Ticket.id)).limit(remaining)
+            tickets.extend(session.scalars(page_stmt).all())
+        if len(tickets) == limit:
+            response.headers[NEXT_CURSOR_HEADER] = encode_list_cursor(tickets[-1])
+    elif status is not None:
+        stmt = stmt.order_by(desc(Ticket.created_at), desc(Ticket.id)).limit(limit).offset(offset)
+        tickets = list(session.scalars(stmt).all())
     else:
         status_order = case(
             (Ticket.status == "open", 0),
@@ -1090,9 +1160,9 @@ def list_tickets(
             (Ticket.status == "closed", 3),
             else_=4,
         )
-        stmt = stmt.order_by(status_order.asc(), desc(Ticket.created_at)).limit(limit).offset(offset)
+        stmt = stmt.order_by(status_order.asc(), desc(Ticket.created_at), desc(Ticket.id)).limit(limit).offset(offset)
+        tickets = list(session.scalars(stmt).all())
 
-    tickets = list(session.scalars(stmt).all())
     ticket_ids = [t.id for t in tickets]
     category_map = load_ticket_category_map(session, ticket_ids)
     assignee_map = load_ticket_assignee_map(session, ticket_ids)
@@ -1106,7 +1176,8 @@ def list_tickets(
     project_ids: set[int] = {t.project_id for t in tickets if t.project_id}
     users = build_user_map(session, user_ids)
     projects = build_project_map(session, project_ids)
-    return [serialize_ticket(t, users, projects, category_map, assignee_map) for t in tickets]
+    serialize = serialize_ticket_summary if summary else serialize_ticket
+    return [serialize(t, users, projects, category_map, assignee_map) for t in tickets]
 
 
 @router.get("/{ticket_id}/detail", response_model=TicketDetailOut)
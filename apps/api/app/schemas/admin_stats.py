@@ -0,0 +1,40 @@
+from datetime import date
+from pydantic import BaseModel, Field
+
+
+class StatCountOut(BaseModel):
+    key: str | None = None
+    count: int
+
+
+class CategoryStatCountOut(BaseModel):
+    category_id: int | None = None
+    count: int
+
+
+class StatSeriesPointOut(BaseModel):
+    bucket_start: date
+    count: int
+
+
+class TicketStatsSummaryOut(BaseModel):
+    total_tickets: int
+    total_pending: int
+    today_new: int
+    yesterday_new: int
+    today_done: int
+    yesterday_done: int
+
+
+class TicketStatsOut(BaseModel):
+    date_from: date | None = None
+    date_to: date | None = None
+    bucket: str
+    total: int
+    summary: TicketStatsSummaryOut
+    by_status: list[StatCountOut] = Field(default_factory=list)
+    by_work_type: list[StatCountOut] = Field(default_factory=list)
+    by_category: list[CategoryStatCountOut] = Field(default_factory=list)
+    by_requester_title: list[StatCountOut] = Field(default_factory=list)
+    by_requester_department: list[StatCountOut] = Field(default_factory=list)
+    series: list[StatSeriesPointOut] = Field(default_factory=list)
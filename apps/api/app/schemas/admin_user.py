@@ -14,3 +14,14 @@ class AdminUserOut(BaseModel):
 
 class UserRoleUpdateIn(BaseModel):
     role: str
+
+
+class SyncSourcePoolOut(BaseModel):
+    # 요청을 처리한 API 프로세스 기준. runs_sync=False이면 이 프로세스는 동기화를 돌리지 않는다
+    pid: int
+    runs_sync: bool
+    created: bool
+    size: int
+    checked_in: int = 0
+    checked_out: int = 0
+    overflow: int = 0
@@ -0,0 +1,28 @@
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+
+class MailLatencyOut(BaseModel):
+    p50: float | None = None
+    p95: float | None = None
+    p99: float | None = None
+    max: float | None = None
+
+
+class MailThroughputPointOut(BaseModel):
+    minute: datetime
+    sent: int
+
+
+class MailQueueStatsOut(BaseModel):
+    generated_at: datetime
+    window_minutes: int
+    pending: int
+    failed: int
+    dead: int
+    oldest_pending_at: datetime | None = None
+    oldest_pending_age_seconds: float | None = None
+    sent: int
+    sent_per_minute: float
+    latency_seconds: MailLatencyOut
+    throughput: list[MailThroughputPointOut] = Field(default_factory=list)
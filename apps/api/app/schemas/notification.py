@@ -1,11 +1,27 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 
 
 class NotificationOut(BaseModel):
     id: str
+    seq: int | None = None
     ticket_id: int | None = None
     ticket_title: str | None = None
     type: str
     message: str
     created_at: datetime
+    read: bool = False
+
+
+class NotificationReadIn(BaseModel):
+    last_read_id: int | None = Field(default=None, ge=0)
+
+
+class NotificationStreamTokenOut(BaseModel):
+    token: str
+    expires_in: int
+
+
+class NotificationStateOut(BaseModel):
+    last_read_id: int
+    unread_count: int
@@ -27,10 +27,10 @@ class TicketAdminMetaUpdateIn(BaseModel):
     category_ids: list[int] | None = None
     work_type: str | None = None
 
-class TicketOut(BaseModel):
+class TicketSummaryOut(BaseModel):
+    """목록 화면용 경량 응답 (본문 description 제외)."""
     id: int
     title: str
-    description: dict
     status: str
     priority: str
     category_id: int | None = None
@@ -53,3 +53,7 @@ class TicketOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class TicketOut(TicketSummaryOut):
+    description: dict
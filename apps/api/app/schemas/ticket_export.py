@@ -0,0 +1,38 @@
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+
+class ExportFilterRule(BaseModel):
+    field: str
+    mode: str = Field(pattern="^(include_only|exclude)$")
+    values: list[str] = Field(default_factory=list)
+
+
+class TicketExportIn(BaseModel):
+    """데이터 추출 페이지(data-extract-types.ts)의 프리셋과 동일한 컬럼/필터 모델."""
+
+    format: str = Field(default="csv", pattern="^(csv|xlsx)$")
+    columns: list[str] = Field(default_factory=list)
+    created_year_include: list[str] = Field(default_factory=list)
+    created_day_range_percent: tuple[float, float] = (0, 100)
+    filter_rules: list[ExportFilterRule] = Field(default_factory=list)
+
+
+class ExportJobOut(BaseModel):
+    id: int
+    kind: str
+    format: str
+    status: str
+    rows_total: int | None = None
+    rows_scanned: int
+    rows_written: int
+    progress: float | None = None  # 0~100, 대상 건수 집계 전에는 None
+    filename: str | None = None
+    size: int | None = None
+    error_message: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,223 @@
+"""데이터 추출 백그라운드 작업 큐.
+
+POST /admin/exports가 export_jobs에 작업을 넣으면 워커 스레드가 가져가
+파일을 스토리지(object: S3 호환 / local: LOCAL_UPLOAD_ROOT)에 기록한다.
+다운로드는 첨부파일과 같은 방식(presigned URL 또는 FileResponse)으로 제공한다.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import logging
+import os
+from pathlib import Path
+import tempfile
+import threading
+import time
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.orm import Session
+
+from ..core.settings import settings
+from ..core.storage import delete_object, upload_fileobj
+from ..core.storage_keys import export_file_key
+from ..db import SessionLocal
+from ..models.export_job import ExportJob
+from ..models.user import User
+from ..schemas.ticket_export import TicketExportIn
+from .ticket_export import MEDIA_TYPES, count_export_candidates, export_filename, iter_ticket_export
+
+logger = logging.getLogger(__name__)
+
+EXPORT_POLL_SECONDS = 5
+EXPORT_PROGRESS_INTERVAL_SECONDS = 1.0
+# 진행률 갱신이 이 시간 이상 멈춘 running 작업은 워커가 죽은 것으로 보고 다시 가져간다
+EXPORT_STALE_SECONDS = 600
+EXPORT_RETENTION_DAYS = 7
+
+_wakeup = threading.Event()
+
+
+def is_object_storage() -> bool:
+    return settings.STORAGE_BACKEND == "object"
+
+
+def local_path_for_key(key: str) -> Path:
+    return Path(settings.LOCAL_UPLOAD_ROOT) / key
+
+
+def job_progress(job: ExportJob) -> float | None:
+    if job.status == "done":
+        return 100.0
+    if not job.rows_total:
+        return 0.0 if job.rows_total == 0 else None
+    return round(min(100.0, job.rows_scanned * 100 / job.rows_total), 1)
+
+
+def create_export_job(session: Session, params: TicketExportIn, user: User) -> ExportJob:
+    job = ExportJob(
+        kind="tickets",
+        format=params.format,
+        params=params.model_dump_json(),
+        status="queued",
+        requested_emp_no=user.emp_no,
+    )
+    session.add(job)
+    session.commit()
+    session.refresh(job)
+    # 같은 프로세스의 워커는 즉시 깨우고, 다른 프로세스는 폴링으로 가져간다
+    _wakeup.set()
+    return job
+
+
+def _claim_job(session: Session, now: datetime) -> ExportJob | None:
+    stale_before = now - timedelta(seconds=EXPORT_STALE_SECONDS)
+    stmt = (
+        select(ExportJob)
+        .where(
+            or_(
+                ExportJob.status == "queued",
+                (ExportJob.status == "running") & (ExportJob.updated_at < stale_before),
+            )
+        )
+        .order_by(ExportJob.id)
+        .with_for_update(skip_locked=True)
+        .limit(1)
+    )
+    job = session.scalars(stmt).first()
+    if not job:
+        return None
+    job.status = "running"
+    job.started_at = now
+    job.rows_scanned = 0
+    job.rows_written = 0
+    job.error_message = None
+    session.commit()
+    return job
+
+
+def _update_job(job_id: int, **values) -> None:
+    with SessionLocal() as session:
+        session.execute(update(ExportJob).where(ExportJob.id == job_id).values(**values))
+        session.commit()
+
+
+def _stream_to(job_id: int, params: TicketExportIn, fileobj, counts: dict[str, int]) -> int:
+    """추출 파일을 fileobj에 기록하고 바이트 수를 반환한다. counts에 최종 처리 건수를 남긴다."""
+    last_report = 0.0
+
+    def on_progress(scanned: int, written: int) -> None:
+        nonlocal last_report
+        counts.update(scanned=scanned, written=written)
+        now = time.monotonic()
+        if now - last_report < EXPORT_PROGRESS_INTERVAL_SECONDS:
+            return
+        last_report = now
+        _update_job(job_id, rows_scanned=scanned, rows_written=written)
+
+    size = 0
+    # 서버 측 커서가 열린 세션은 커밋하면 안 되므로 진행률 갱신(_update_job)은 별도 세션으로 한다
+    with SessionLocal() as session:
+        for chunk in iter_ticket_export(session, params, on_progress):
+            fileobj.write(chunk)
+            size += len(chunk)
+    return size
+
+
+def _run_job(job: ExportJob) -> None:
+    job_id = job.id
+    params = TicketExportIn.model_validate_json(job.params)
+    filename = export_filename(params.format)
+    content_type = MEDIA_TYPES[params.format]
+    key = export_file_key(job_id=job_id, job_created_at=job.created_at, filename=filename)
+
+    with SessionLocal() as session:
+        rows_total = count_export_candidates(session, params)
+    _update_job(job_id, rows_total=rows_total)
+
+    counts = {"scanned": 0, "written": 0}
+    if is_object_storage():
+        with tempfile.TemporaryFile() as tmp:
+            size = _stream_to(job_id, params, tmp, counts)
+            tmp.seek(0)
+            upload_fileobj(fileobj=tmp, key=key, content_type=content_type)
+    else:
+        path = local_path_for_key(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(path.name + ".part")
+        with open(partial, "wb") as f:
+            size = _stream_to(job_id, params, f, counts)
+        os.replace(partial, path)
+
+    _update_job(
+        job_id,
+        status="done",
+        key=key,
+        filename=filename,
+        content_type=content_type,
+        size=size,
+        rows_scanned=counts["scanned"],
+        rows_written=counts["written"],
+        finished_at=datetime.now(timezone.utc),
+    )
+    logger.info("데이터 추출 완료: job=%s rows=%s size=%s", job_id, counts["written"], size)
+
+
+def delete_export_file(key: str) -> None:
+    if is_object_storage():
+        delete_object(key=key)
+    else:
+        path = local_path_for_key(key)
+        if path.exists():
+            path.unlink()
+
+
+def _purge_expired(now: datetime) -> None:
+    cutoff = now - timedelta(days=EXPORT_RETENTION_DAYS)
+    with SessionLocal() as session:
+        jobs = session.scalars(
+            select(ExportJob).where(ExportJob.finished_at < cutoff).order_by(ExportJob.id).limit(50)
+        ).all()
+        for job in jobs:
+            if job.key:
+                try:
+                    delete_export_file(job.key)
+                except Exception:  # noqa: BLE001 - 파일 삭제 실패해도 작업 기록은 정리
+                    logger.exception("만료된 추출 파일 삭제 실패: job=%s", job.id)
+            session.delete(job)
+        session.commit()
+
+
+def _process_once() -> bool:
+    """작업 하나를 처리했으면 True."""
+    now = datetime.now(timezone.utc)
+    with SessionLocal() as session:
+        job = _claim_job(session, now)
+        if not job:
+            _purge_expired(now)
+            return False
+        session.refresh(job)
+        session.expunge(job)
+
+    try:
+        _run_job(job)
+    except Exception as exc:  # noqa: BLE001 - 실패 사유는 작업 상태로 노출
+        logger.exception("데이터 추출 실패: job=%s", job.id)
+        _update_job(job.id, status="failed", error_message=str(exc), finished_at=datetime.now(timezone.utc))
+    return True
+
+
+def _worker_loop() -> None:
+    while True:
+        try:
+            if _process_once():
+                continue
+        except Exception:
+            logger.exception("데이터 추출 워커 오류")
+        _wakeup.wait(EXPORT_POLL_SECONDS)
+        _wakeup.clear()
+
+
+def start_export_worker_thread() -> None:
+    t = threading.Thread(target=_worker_loop, name="export-worker", daemon=True)
+    t.start()
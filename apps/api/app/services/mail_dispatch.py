@@ -0,0 +1,176 @@
+"""메일 알림 팬아웃을 요청 처리 경로 밖으로 미루는 디스패처.
+
+라우터는 커밋 후 이벤트(티켓/댓글 id 등)만 큐에 넣고 바로 응답한다.
+카테고리 라벨·담당자 조회, 본문 렌더링, mail_logs 등록은 디스패치 스레드가
+자기 세션으로 다시 읽어서 처리한다. 큐가 가득 차면 요청 스레드에서 바로 처리한다(유실 방지).
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from ..db import SessionLocal
+from ..models.comment import TicketComment
+from ..models.ticket import Ticket
+from ..models.user import User
+from .assignment_service import (
+    get_category_admins_for_categories,
+    get_ticket_category_ids,
+    get_ticket_category_labels,
+)
+from .mail_events import (
+    notify_admin_commented,
+    notify_admins_ticket_created,
+    notify_assignees_reopen_received,
+    notify_requester_commented,
+    notify_requester_status_changed,
+    notify_requester_ticket_created,
+)
+
+logger = logging.getLogger(__name__)
+
+MAIL_DISPATCH_WORKERS = 2
+MAIL_DISPATCH_QUEUE_SIZE = 1000
+# 요청자에게 메일을 보내는 상태 변경
+NOTIFY_STATUSES = ("resolved", "closed", "in_progress")
+
+_queue: queue.Queue[tuple[str, Callable[..., None], tuple] | None] = queue.Queue(maxsize=MAIL_DISPATCH_QUEUE_SIZE)
+_threads: list[threading.Thread] = []
+_lock = threading.Lock()
+
+
+def _users_by_emp_no(session: Session, emp_nos: list[str]) -> list[User]:
+    return [u for u in (session.get(User, emp_no) for emp_no in emp_nos) if u]
+
+
+def _ticket_created(session: Session, ticket_id: int, requester_emp_no: str) -> None:
+    ticket = session.get(Ticket, ticket_id)
+    requester = session.get(User, requester_emp_no)
+    if not ticket or not requester:
+        return
+    category_label = get_ticket_category_labels(session, ticket)
+    notify_requester_ticket_created(ticket, requester, category_label=category_label)
+    category_ids = get_ticket_category_ids(session, ticket)
+    if category_ids:
+        admins = get_category_admins_for_categories(session, category_ids)
+        notify_admins_ticket_created(ticket, requester, admins, category_label=category_label)
+
+
+def _reopen_received(session: Session, ticket_id: int, requester_emp_no: str, assignee_emp_nos: list[str]) -> None:
+    ticket = session.get(Ticket, ticket_id)
+    requester = session.get(User, requester_emp_no)
+    if not ticket or not requester:
+        return
+    category_label = get_ticket_category_labels(session, ticket)
+    notify_requester_ticket_created(ticket, requester, category_label=category_label)
+    if assignee_emp_nos:
+        assignees = _users_by_emp_no(session, assignee_emp_nos)
+        notify_assignees_reopen_received(ticket, requester, assignees, category_label=category_label)
+
+
+def _status_changed(session: Session, ticket_id: int, new_status: str, old_status: str | None) -> None:
+    ticket = session.get(Ticket, ticket_id)
+    if not ticket:
+        return
+    requester = session.get(User, ticket.requester_emp_no)
+    if not requester:
+        return
+    category_label = get_ticket_category_labels(session, ticket)
+    notify_requester_status_changed(ticket, requester, new_status, old_status=old_status, category_label=category_label)
+
+
+def _comment_created(session: Session, comment_id: int, author_emp_no: str) -> None:
+    comment = session.get(TicketComment, comment_id)
+    author = session.get(User, author_emp_no)
+    if not comment or not author:
+        return
+    ticket = session.get(Ticket, comment.ticket_id)
+    requester = session.get(User, ticket.requester_emp_no) if ticket else None
+    if not ticket or not requester:
+        return
+    category_label = get_ticket_category_labels(session, ticket)
+    if author.emp_no == ticket.requester_emp_no:
+        admins: list[User] = []
+        if ticket.assignee_emp_no:
+            assignee = session.get(User, ticket.assignee_emp_no)
+            if assignee and assignee.role == "admin":
+                admins = [assignee]
+        if not admins:
+            admins = get_category_admins_for_categories(session, get_ticket_category_ids(session, ticket))
+        notify_requester_commented(ticket, comment, requester, admins, category_label=category_label)
+    else:
+        notify_admin_commented(ticket, comment, requester, author, category_label=category_label)
+
+
+def _run(name: str, handler: Callable[..., None], args: tuple) -> None:
+    try:
+        with SessionLocal() as session:
+            handler(session, *args)
+    except Exception:
+        logger.exception("메일 알림 처리 실패: %s %s", name, args)
+
+
+def _worker_loop() -> None:
+    while True:
+        item = _queue.get()
+        try:
+            if item is None:
+                return
+            _run(*item)
+        finally:
+            _queue.task_done()
+
+
+def _submit(name: str, handler: Callable[..., None], *args) -> None:
+    start_mail_dispatcher()
+    try:
+        _queue.put_nowait((name, handler, args))
+    except queue.Full:
+        logger.warning("메일 알림 큐가 가득 차 요청 스레드에서 처리합니다: %s", name)
+        _run(name, handler, args)
+
+
+def defer_ticket_created(ticket_id: int, requester_emp_no: str) -> None:
+    """요청자 접수 확인 + 카테고리 담당자 신규 요청 메일."""
+    _submit("ticket_created", _ticket_created, ticket_id, requester_emp_no)
+
+
+def defer_reopen_received(ticket_id: int, requester_emp_no: str, assignee_emp_nos: list[str]) -> None:
+    """요청자 접수 확인 + 담당자 재요청 접수 메일."""
+    _submit("reopen_received", _reopen_received, ticket_id, requester_emp_no, list(assignee_emp_nos))
+
+
+def defer_status_changed(ticket_id: int, new_status: str, old_status: str | None) -> None:
+    if new_status not in NOTIFY_STATUSES:
+        return
+    _submit("status_changed", _status_changed, ticket_id, new_status, old_status)
+
+
+def defer_comment_created(comment_id: int, author_emp_no: str) -> None:
+    _submit("comment_created", _comment_created, comment_id, author_emp_no)
+
+
+def start_mail_dispatcher() -> None:
+    with _lock:
+        if _threads:
+            return
+        for i in range(MAIL_DISPATCH_WORKERS):
+            t = threading.Thread(target=_worker_loop, name=f"mail-dispatch-{i}", daemon=True)
+            t.start()
+            _threads.append(t)
+
+
+def stop_mail_dispatcher(timeout: float = 10.0) -> None:
+    """종료 시 남은 이벤트를 처리하고 스레드를 멈춘다."""
+    with _lock:
+        threads = list(_threads)
+        _threads.clear()
+    for _ in threads:
+        _queue.put(None)
+    for t in threads:
+        t.join(timeout)
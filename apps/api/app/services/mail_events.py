@@ -3,7 +3,12 @@ from __future__ import annotations
 from ..models.ticket import Ticket
 from ..models.user import User
 from ..models.comment import TicketComment
-from .mail_notifications import MailTarget, enqueue_ticket_mail, enqueue_comment_mail
+from .mail_notifications import (
+    MailTarget,
+    build_ticket_mail,
+    enqueue_payloads,
+    enqueue_ticket_mail,
+)
 
 
 STATUS_LABELS = {
@@ -114,6 +119,7 @@ def notify_admins_ticket_created(
     work_type_label: str | None = None,
 ) -> None:
     requester_label = _user_label(requester, requester.emp_no)
+    payloads = []
     for admin in admins:
         status_label = _status_label(ticket.status)
         summary = "신규 요청이 접수되었습니다."
@@ -124,18 +130,21 @@ def notify_admins_ticket_created(
             ("작업 구분", _work_type_value(ticket, work_type_label)),
             ("요청자", requester_label),
         ]
-        enqueue_ticket_mail(
-            event_key=f"ticket_created:admin:{ticket.id}:{admin.emp_no}",
-            event_type="ticket_created_admin",
-            ticket=ticket,
-            recipient=_admin_target(admin),
-            subject=subject,
-            alert_type="신규 요청 접수",
-            summary=summary,
-            fields=fields,
-            status_label=status_label,
-            is_admin_link=True,
+        payloads.append(
+            build_ticket_mail(
+                event_key=f"ticket_created:admin:{ticket.id}:{admin.emp_no}",
+                event_type="ticket_created_admin",
+                ticket=ticket,
+                recipient=_admin_target(admin),
+                subject=subject,
+                alert_type="신규 요청 접수",
+                summary=summary,
+                fields=fields,
+                status_label=status_label,
+                is_admin_link=True,
+            )
         )
+    enqueue_payloads(payloads)
 
 
 def notify_requester_status_changed(
@@ -180,6 +189,7 @@ def notify_requester_commented(
     work_type_label: str | None = None,
 ) -> None:
     requester_label = _user_label(requester, requester.emp_no)
+    payloads = []
     for admin in admins:
         status_label = _status_label(ticket.status)
         summary = "요청에 답변이 등록되었습니다."
@@ -190,19 +200,21 @@ def notify_requester_commented(
             ("작업 구분", _work_type_value(ticket, work_type_label)),
             ("요청자", requester_label),
         ]
-        enqueue_comment_mail(
-            event_key=f"comment_requester:admin:{ticket.id}:{comment.id}:{admin.emp_no}",
-            event_type="comment_requester",
-            ticket=ticket,
-            comment=comment,
-            recipient=_admin_target(admin),
-            subject=subject,
-            alert_type="요청자 답변",
-            summary=summary,
-            fields=fields,
-            status_label=status_label,
-            is_admin_link=True,
+        payloads.append(
+            build_ticket_mail(
+                event_key=f"comment_requester:admin:{ticket.id}:{comment.id}:{admin.emp_no}",
+                event_type="comment_requester",
+                ticket=ticket,
+                recipient=_admin_target(admin),
+                subject=subject,
+                alert_type="요청자 답변",
+                summary=summary,
+                fields=fields,
+                status_label=status_label,
+                is_admin_link=True,
+            )
         )
+    enqueue_payloads(payloads)
 
 
 def notify_admin_commented(
@@ -222,11 +234,10 @@ def notify_admin_commented(
         ("작업 구분", _work_type_value(ticket, work_type_label)),
         ("담당자", _user_label(author, author.emp_no)),
     ]
-    enqueue_comment_mail(
+    enqueue_ticket_mail(
         event_key=f"comment_admin:requester:{ticket.id}:{comment.id}:{requester.emp_no}",
         event_type="comment_admin",
         ticket=ticket,
-        comment=comment,
         recipient=_requester_target(requester),
         subject=subject,
         alert_type="담당자 답변",
@@ -248,6 +259,7 @@ def notify_assignees_reopen_received(
     summary = "재요청이 접수되었습니다"
     subject = _build_subject(summary)
     requester_label = _user_label(requester, requester.emp_no)
+    payloads = []
     for admin in assignees:
         status_label = _status_label(ticket.status)
         fields = [
@@ -256,15 +268,18 @@ def notify_assignees_reopen_received(
             ("작업 구분", _work_type_value(ticket, work_type_label)),
             ("요청자", requester_label),
         ]
-        enqueue_ticket_mail(
-            event_key=f"reopen_received:assignee:{ticket.id}:{admin.emp_no}",
-            event_type="reopen_received",
-            ticket=ticket,
-            recipient=_admin_target(admin),
-            subject=subject,
-            alert_type="재요청 접수",
-            summary=summary,
-            fields=fields,
-            status_label=status_label,
-            is_admin_link=True,
+        payloads.append(
+            build_ticket_mail(
+                event_key=f"reopen_received:assignee:{ticket.id}:{admin.emp_no}",
+                event_type="reopen_received",
+                ticket=ticket,
+                recipient=_admin_target(admin),
+                subject=subject,
+                alert_type="재요청 접수",
+                summary=summary,
+                fields=fields,
+                status_label=status_label,
+                is_admin_link=True,
+            )
         )
+    enqueue_payloads(payloads)
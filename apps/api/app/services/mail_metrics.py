@@ -0,0 +1,144 @@
+"""메일 큐 지표 (GET /admin/mail/queue-stats, /admin/mail/metrics).
+
+모든 값은 mail_logs에서 인덱스로 읽는 범위만 계산하므로 API 프로세스가 여러 개여도 같은 값을 준다.
+- 대기/재시도/실패 건수, 가장 오래된 미발송 건: ix_mail_logs_status (미발송 행만 스캔)
+- 최근 N분 발송 건수·발송 지연(created_at → last_attempt_at)·분당 처리량: ix_mail_logs_sent_at (index only)
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Float, and_, func, literal_column, select
+from sqlalchemy.dialects.postgresql import ARRAY, array
+from sqlalchemy.orm import Session
+
+from ..models.mail_log import MailLog
+from .mail_service import MAIL_MAX_ATTEMPTS, RETRYABLE_STATUSES
+
+LATENCY_QUANTILES = (0.5, 0.95, 0.99)
+METRIC_PREFIX = "itsd_mail"
+
+
+def _queue_counts(session: Session) -> dict:
+    exhausted = MailLog.attempts >= MAIL_MAX_ATTEMPTS
+    undelivered = and_(MailLog.status.in_(RETRYABLE_STATUSES), ~exhausted)
+    row = session.execute(
+        select(
+            func.count().filter(MailLog.status == "pending").label("pending"),
+            func.count().filter(and_(MailLog.status == "failed", ~exhausted)).label("failed"),
+            func.count().filter(and_(MailLog.status == "failed", exhausted)).label("dead"),
+            func.min(MailLog.created_at).filter(undelivered).label("oldest_pending_at"),
+        ).where(MailLog.status.in_(RETRYABLE_STATUSES))
+    ).one()
+    return row._asdict()
+
+
+def _sent_window(session: Session, since: datetime) -> dict:
+    latency = func.extract("epoch", MailLog.last_attempt_at - MailLog.created_at)
+    row = session.execute(
+        select(
+            func.count().label("sent"),
+            func.max(latency).label("max"),
+            func.percentile_cont(array(LATENCY_QUANTILES))
+            .within_group(latency)
+            .cast(ARRAY(Float))
+            .label("quantiles"),
+        )
+        .where(MailLog.status == "sent")
+        .where(MailLog.last_attempt_at >= since)
+    ).one()
+    quantiles = row.quantiles or [None] * len(LATENCY_QUANTILES)
+    return {
+        "sent": int(row.sent or 0),
+        "latency_seconds": {
+            "p50": quantiles[0],
+            "p95": quantiles[1],
+            "p99": quantiles[2],
+            "max": float(row.max) if row.max is not None else None,
+        },
+    }
+
+
+def _throughput(session: Session, since: datetime, now: datetime) -> list[dict]:
+    """최근 N분의 분당 발송 건수. 발송이 없던 분은 0으로 채운다."""
+    minute = func.date_trunc(literal_column("'minute'"), MailLog.last_attempt_at)
+    rows = session.execute(
+        select(minute.label("minute"), func.count().label("sent"))
+        .where(MailLog.status == "sent")
+        .where(MailLog.last_attempt_at >= since)
+        .group_by(minute)
+    ).all()
+    counts = {row.minute.astimezone(timezone.utc): int(row.sent) for row in rows}
+    series = []
+    cur = since.astimezone(timezone.utc).replace(second=0, microsecond=0)
+    while cur <= now:
+        series.append({"minute": cur, "sent": counts.get(cur, 0)})
+        cur += timedelta(minutes=1)
+    return series
+
+
+def collect_mail_queue_stats(session: Session, window_minutes: int = 60, now: datetime | None = None) -> dict:
+    now = now or datetime.now(timezone.utc)
+    since = now - timedelta(minutes=window_minutes)
+    counts = _queue_counts(session)
+    sent = _sent_window(session, since)
+    oldest = counts["oldest_pending_at"]
+    return {
+        "generated_at": now,
+        "window_minutes": window_minutes,
+        "pending": int(counts["pending"] or 0),
+        "failed": int(counts["failed"] or 0),
+        "dead": int(counts["dead"] or 0),
+        "oldest_pending_at": oldest,
+        "oldest_pending_age_seconds": max(0.0, (now - oldest).total_seconds()) if oldest else None,
+        "sent": sent["sent"],
+        "sent_per_minute": round(sent["sent"] / window_minutes, 3),
+        "latency_seconds": sent["latency_seconds"],
+        "throughput": _throughput(session, since, now),
+    }
+
+
+def _metric(lines: list[str], name: str, kind: str, help_text: str, samples: list[tuple[str, float | None]]) -> None:
+    lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+    lines.append(f"# TYPE {METRIC_PREFIX}_{name} {kind}")
+    for labels, value in samples:
+        # 값이 없는 지표(발송 이력 없음 등)는 NaN으로 내보낸다
+        lines.append(f"{METRIC_PREFIX}_{name}{labels} {'NaN' if value is None else repr(float(value))}")
+
+
+def render_prometheus(stats: dict) -> str:
+    """collect_mail_queue_stats 결과를 Prometheus text exposition format(0.0.4)으로 변환한다."""
+    window = f'window="{stats["window_minutes"]}m"'
+    latency = stats["latency_seconds"]
+    lines: list[str] = []
+    _metric(lines, "queue_pending", "gauge", "Mails waiting for their first send attempt.", [("", stats["pending"])])
+    _metric(lines, "queue_failed", "gauge", "Mails waiting for a retry after a failed attempt.", [("", stats["failed"])])
+    _metric(lines, "queue_dead", "gauge", "Mails that exhausted all send attempts.", [("", stats["dead"])])
+    _metric(
+        lines,
+        "queue_oldest_pending_age_seconds",
+        "gauge",
+        "Age of the oldest undelivered mail.",
+        [("", stats["oldest_pending_age_seconds"] or 0)],
+    )
+    _metric(lines, "sent_window", "gauge", "Mails sent within the window.", [(f"{{{window}}}", stats["sent"])])
+    _metric(
+        lines,
+        "sent_per_minute",
+        "gauge",
+        "Average mails sent per minute within the window.",
+        [(f"{{{window}}}", stats["sent_per_minute"])],
+    )
+    _metric(
+        lines,
+        "send_latency_seconds",
+        "gauge",
+        "Queue-to-send latency (created_at to last_attempt_at) of mails sent within the window.",
+        [
+            (f'{{{window},quantile="{q}"}}', latency[key])
+            for q, key in zip(LATENCY_QUANTILES, ("p50", "p95", "p99"))
+        ]
+        + [(f'{{{window},quantile="1"}}', latency["max"])],
+    )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,189 @@
+"""mail_logs 보존 정책.
+
+- 본문 정리: 발송 완료(sent)·생략(skipped) 후 MAIL_LOG_BODY_RETENTION_DAYS가 지난 행의 body_html/body_text를 비운다.
+  제목·수신자·상태 등 발송 이력은 그대로 남는다.
+- 보관: MAIL_LOG_ARCHIVE_DAYS가 지난 완료 행(sent/skipped/재시도 소진 failed)을 mail_logs_archive로 옮긴다.
+  event_key 중복 방지는 mail_logs 기준이므로, 보관된 이벤트와 같은 키는 다시 등록될 수 있다.
+
+백그라운드 스레드(스케줄러 리더 프로세스)가 MAIL_LOG_RETENTION_INTERVAL_SECONDS마다 실행하며, 수동 실행은
+`python -m app.services.mail_retention run [--body-days N] [--archive-days N] [--dry-run]`.
+행은 배치 단위로 잠그고(SKIP LOCKED) 배치마다 커밋하므로 여러 프로세스가 동시에 돌아도 안전하다.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import logging
+import threading
+
+from sqlalchemy import and_, delete, func, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..db import SessionLocal
+from ..models.mail_log import MailLog, MailLogArchive
+from .mail_service import MAIL_MAX_ATTEMPTS
+
+logger = logging.getLogger(__name__)
+
+MAIL_RETENTION_BATCH_SIZE = 5000
+COMPACT_STATUSES = ("sent", "skipped")
+ARCHIVE_COLUMNS = [c.name for c in MailLog.__table__.columns]
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    body_days: int  # 0 = 본문 정리 안 함
+    archive_days: int  # 0 = 보관 이동 안 함
+
+    @classmethod
+    def from_settings(cls) -> "RetentionPolicy":
+        return cls(
+            body_days=settings.mail_log_body_retention_days,
+            archive_days=settings.mail_log_archive_days,
+        )
+
+
+def _compact_candidates(cutoff: datetime):
+    return (
+        select(MailLog.id)
+        .where(MailLog.status.in_(COMPACT_STATUSES))
+        .where(MailLog.created_at < cutoff)
+        .where(or_(MailLog.body_html.is_not(None), MailLog.body_text.is_not(None)))
+    )
+
+
+def _archive_candidates(cutoff: datetime):
+    return (
+        select(MailLog.id)
+        .where(MailLog.created_at < cutoff)
+        .where(
+            or_(
+                MailLog.status.in_(COMPACT_STATUSES),
+                and_(MailLog.status == "failed", MailLog.attempts >= MAIL_MAX_ATTEMPTS),
+            )
+        )
+    )
+
+
+def _count(session: Session, candidates) -> int:
+    return session.scalar(select(func.count()).select_from(candidates.subquery())) or 0
+
+
+def compact_mail_bodies(session: Session, cutoff: datetime, batch_size: int = MAIL_RETENTION_BATCH_SIZE) -> int:
+    """cutoff 이전 완료 행의 본문을 비운다. 정리한 행 수를 반환."""
+    total = 0
+    while True:
+        ids = _compact_candidates(cutoff).order_by(MailLog.id).limit(batch_size).with_for_update(skip_locked=True)
+        result = session.execute(
+            update(MailLog)
+            .where(MailLog.id.in_(ids.scalar_subquery()))
+            .values(body_html=None, body_text=None)
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        total += result.rowcount or 0
+        if (result.rowcount or 0) < batch_size:
+            return total
+
+
+def archive_mail_logs(session: Session, cutoff: datetime, batch_size: int = MAIL_RETENTION_BATCH_SIZE) -> int:
+    """cutoff 이전 완료 행을 mail_logs_archive로 옮긴다(DELETE ... RETURNING → INSERT 한 문장). 옮긴 행 수를 반환."""
+    total = 0
+    while True:
+        ids = _archive_candidates(cutoff).order_by(MailLog.id).limit(batch_size).with_for_update(skip_locked=True)
+        moved = (
+            delete(MailLog)
+            .where(MailLog.id.in_(ids.scalar_subquery()))
+            .returning(*[MailLog.__table__.c[name] for name in ARCHIVE_COLUMNS])
+            .cte("moved")
+        )
+        # INSERT ... SELECT FROM (DELETE ...)의 rowcount는 드라이버가 -1을 줄 수 있어 RETURNING으로 센다
+        count = len(
+            session.execute(
+                insert(MailLogArchive)
+                .from_select(ARCHIVE_COLUMNS, select(*[moved.c[name] for name in ARCHIVE_COLUMNS]))
+                .returning(MailLogArchive.id)
+            ).all()
+        )
+        session.commit()
+        total += count
+        if count < batch_size:
+            return total
+
+
+def run_mail_retention(
+    session: Session, policy: RetentionPolicy, now: datetime | None = None, dry_run: bool = False
+) -> dict[str, int]:
+    """보존 정책을 한 번 적용한다. dry_run이면 대상 건수만 센다."""
+    now = now or datetime.now(timezone.utc)
+    result = {"compacted": 0, "archived": 0}
+    archive_cutoff = now - timedelta(days=policy.archive_days) if policy.archive_days > 0 else None
+    # 보관할 행의 본문을 먼저 비울 필요는 없으므로 보관부터 한다
+    if archive_cutoff is not None:
+        if dry_run:
+            result["archived"] = _count(session, _archive_candidates(archive_cutoff))
+        else:
+            result["archived"] = archive_mail_logs(session, archive_cutoff)
+    if policy.body_days > 0:
+        cutoff = now - timedelta(days=policy.body_days)
+        if dry_run:
+            candidates = _compact_candidates(cutoff)
+            if archive_cutoff is not None:
+                candidates = candidates.where(MailLog.created_at >= archive_cutoff)
+            result["compacted"] = _count(session, candidates)
+        else:
+            result["compacted"] = compact_mail_bodies(session, cutoff)
+    return result
+
+
+def _retention_loop(stop: threading.Event) -> None:
+    interval = settings.mail_log_retention_interval_seconds
+    policy = RetentionPolicy.from_settings()
+    while not stop.is_set():
+        try:
+            with SessionLocal() as session:
+                result = run_mail_retention(session, policy)
+            if result["compacted"] or result["archived"]:
+                logger.info("mail_logs 보존 정책 적용: %s", result)
+        except Exception:
+            logger.exception("mail_logs 보존 정책 적용 실패")
+        stop.wait(interval)
+
+
+def start_mail_retention_thread(stop: threading.Event | None = None) -> threading.Thread | None:
+    if settings.mail_log_retention_interval_seconds <= 0:
+        logger.info("mail_logs 보존 작업 비활성화 (MAIL_LOG_RETENTION_INTERVAL_SECONDS=0)")
+        return None
+    t = threading.Thread(target=_retention_loop, args=(stop or threading.Event(),), name="mail-retention", daemon=True)
+    t.start()
+    return t
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="mail_logs 본문 정리·보관")
+    parser.add_argument("command", choices=["run"])
+    parser.add_argument("--body-days", type=int, default=None, help="본문을 비울 기준 일수 (0 = 안 함)")
+    parser.add_argument("--archive-days", type=int, default=None, help="보관 테이블로 옮길 기준 일수 (0 = 안 함)")
+    parser.add_argument("--dry-run", action="store_true", help="대상 건수만 출력")
+    args = parser.parse_args()
+
+    import app.models.ticket  # noqa: F401
+    import app.models.ticket_category  # noqa: F401
+    import app.models.project  # noqa: F401
+
+    logging.basicConfig(level=logging.INFO)
+    default = RetentionPolicy.from_settings()
+    policy = RetentionPolicy(
+        body_days=default.body_days if args.body_days is None else args.body_days,
+        archive_days=default.archive_days if args.archive_days is None else args.archive_days,
+    )
+    with SessionLocal() as session:
+        result = run_mail_retention(session, policy, dry_run=args.dry_run)
+    logger.info("mail_logs retention%s: policy=%s result=%s", " (dry-run)" if args.dry_run else "", policy, result)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,25 +2,48 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import logging
+import queue
 import smtplib
+import socket
 import threading
 import time
 from email.message import EmailMessage
+from typing import Iterator
 
 from email_validator import validate_email, EmailNotValidError
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import Boolean, Integer, String, Text, case, cast, column, func, literal, null, select, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, aliased
 
 from ..core.config import settings
+from ..core.pg_notify import ChannelWaiter, notify
 from ..db import SessionLocal
 from ..models.mail_log import MailLog
 
 logger = logging.getLogger(__name__)
 
 MAIL_MAX_ATTEMPTS = 3
+RETRYABLE_STATUSES = ("pending", "failed")
 MAIL_POLL_SECONDS = 10
+# enqueue_mail\uc774 \ucee4\ubc0b\ub420 \ub54c \uc6cc\ucee4\ub97c \uae68\uc6b0\ub294 \ucc44\ub110. LISTEN \uc911\uc5d0\ub294 \uc7ac\uc2dc\ub3c4(backoff) \uac74\ub9cc \uc774 \uc8fc\uae30\ub85c \ud655\uc778\ud55c\ub2e4
+MAIL_QUEUE_CHANNEL = "mail_queue"
+MAIL_LISTEN_FALLBACK_SECONDS = 60
 MAIL_COOLDOWN_SECONDS = 60
+# \ubc30\uce58\uac00 \uac00\ub4dd \ucc28\uba74 \ub2e4\uc74c \ubc30\uce58\ub97c \ub450 \ubc30\ub85c \ud0a4\uc6cc \uc801\uccb4\ub97c \ube68\ub9ac \ube44\uc6b0\uace0, \ub35c \ucc28\uba74 \uae30\ubcf8 \ud06c\uae30\ub85c \ub418\ub3cc\ub9b0\ub2e4
+MAIL_BATCH_SIZE = 20
+MAIL_MAX_BATCH_SIZE = 200
+# \uc11c\ubc84 \uce21 \uc5f0\uacb0\ub2f9 \uba54\uc2dc\uc9c0 \uc81c\ud55c\uc744 \ud53c\ud558\uae30 \uc704\ud574 \uc77c\uc815 \uac74\uc218\ub9c8\ub2e4 \ub2e4\uc2dc \uc5f0\uacb0\ud55c\ub2e4
+MAIL_MAX_MESSAGES_PER_CONNECTION = 100
+SMTP_TIMEOUT_SECONDS = 10
+# SMTP \uc11c\ubc84 \uc7a5\uc560\ub85c \ubc30\uce58\ub97c \uc911\ub2e8\ud588\uc744 \ub54c \ub2e4\uc2dc \uc2dc\ub3c4\ud558\uae30\uae4c\uc9c0\uc758 \ub300\uae30 (\uc5f0\uc18d \uc7a5\uc560\ub9c8\ub2e4 \ub450 \ubc30, \ucd5c\ub300\uac12\uae4c\uc9c0)
+MAIL_SMTP_RETRY_SECONDS = 5
+MAIL_SMTP_MAX_RETRY_SECONDS = 300
+# _process_once\uac00 SMTP \uc5f0\uacb0 \uc7a5\uc560\ub85c \ubc30\uce58\ub97c \uc911\ub2e8\ud588\uc74c\uc744 \uc54c\ub9ac\ub294 \uac12 (0\uc740 \ud050\uac00 \ube48 \uacbd\uc6b0)
+SMTP_UNAVAILABLE = -1
+# \ubc1c\uc1a1 \uc2a4\ub808\ub4dc \uc218(MAIL_SENDER_POOL_SIZE)\uc640 SMTP \ud638\uc2a4\ud2b8\ubcc4 \ub3d9\uc2dc \uc5f0\uacb0 \uc0c1\ud55c(MAIL_MAX_CONNECTIONS_PER_HOST)\uc740 config\uc5d0\uc11c \uc77d\ub294\ub2e4
 
 
 @dataclass
@@ -58,101 +81,180 @@ def _build_message(payload: MailPayload) -> EmailMessage:
     return msg
 
 
-def _send_message(payload: MailPayload) -> None:
-    msg = _build_message(payload)
-    with smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=10) as smtp:
-        smtp.send_message(msg)
+class SmtpConnection:
+    """\ud050\ub97c \ube44\uc6b0\ub294 \ub3d9\uc548 \uc7ac\uc0ac\uc6a9\ud558\ub294 SMTP \uc5f0\uacb0. \uc5f0\uacb0\uc774 \ub04a\uaca8 \uc788\uc73c\uba74 \ud55c \ubc88 \ub2e4\uc2dc \uc5f0\uacb0\ud574\uc11c \uc7ac\uc2dc\ub3c4\ud55c\ub2e4."""
 
+    def __init__(self) -> None:
+        self._smtp: smtplib.SMTP | None = None
+        self._sent = 0
 
-def _cooldown_hit(session: Session, payload: MailPayload, now: datetime) -> bool:
-    cutoff = now - timedelta(seconds=MAIL_COOLDOWN_SECONDS)
-    stmt = (
-        select(MailLog.id)
-        .where(MailLog.recipient_email == payload.recipient_email)
-        .where(MailLog.event_type == payload.event_type)
-        .where(MailLog.ticket_id == payload.ticket_id)
-        .where(MailLog.status == "sent")
-        .where(MailLog.created_at >= cutoff)
-        .limit(1)
+    def _connect(self) -> smtplib.SMTP:
+        self._smtp = smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=SMTP_TIMEOUT_SECONDS)
+        self._sent = 0
+        return self._smtp
+
+    def send(self, msg: EmailMessage) -> None:
+        if self._smtp is not None and self._sent >= MAIL_MAX_MESSAGES_PER_CONNECTION:
+            self.close()
+        smtp = self._smtp or self._connect()
+        try:
+            smtp.send_message(msg)
+        except (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError):
+            # \uc720\ud734 \uc911 \uc11c\ubc84\uac00 \ub04a\uc740 \uc5f0\uacb0. \uc218\uc2e0 \uac70\ubd80 \ub4f1 SMTP \uc751\ub2f5 \uc624\ub958\ub294 \uadf8\ub300\ub85c \uc62c\ub824 \ubcf4\ub0b8\ub2e4
+            self.close()
+            self._connect().send_message(msg)
+        self._sent += 1
+
+    def close(self) -> None:
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except Exception:  # noqa: BLE001 - \uc774\ubbf8 \ub04a\uae34 \uc5f0\uacb0
+            self._smtp.close()
+        self._smtp = None
+
+
+def _send_message(payload: MailPayload, conn: SmtpConnection) -> None:
+    conn.send(_build_message(payload))
+
+
+SKIP_INVALID_EMAIL = "\uc774\uba54\uc77c \uc8fc\uc18c \ud615\uc2dd \uc624\ub958\ub85c \ubc1c\uc1a1 \uc0dd\ub7b5"
+SKIP_COOLDOWN = "\ucfe8\ub2e4\uc6b4 \uae30\uac04 \uc911 \uc911\ubcf5 \ubc1c\uc1a1 \ucc28\ub2e8"
+
+
+def _enqueue_statement(entries: list[tuple[MailPayload, bool]], now: datetime):
+    """\uc218\uc2e0\uc790 \ubaa9\ub85d\uc744 INSERT ... SELECT ... ON CONFLICT (event_key) DO NOTHING \ud55c \ubb38\uc7a5\uc73c\ub85c \ub9cc\ub4e0\ub2e4.
+
+    \ucfe8\ub2e4\uc6b4(\uac19\uc740 \uc218\uc2e0\uc790\u00b7\uc774\ubca4\ud2b8\u00b7\ud2f0\ucf13\uc73c\ub85c \ucd5c\uadfc \ubc1c\uc1a1 \uc644\ub8cc)\uacfc \uc774\uba54\uc77c \ud615\uc2dd \uc624\ub958\ub294 skipped \ud589\uc73c\ub85c,
+    \ub098\uba38\uc9c0\ub294 pending \ud589\uc73c\ub85c \ub123\ub294\ub2e4. \uc774\ubbf8 \uac19\uc740 event_key\uac00 \uc788\uc73c\uba74 \uc544\ubb34\uac83\ub3c4 \ub123\uc9c0 \uc54a\ub294\ub2e4.
+    pending\uc73c\ub85c \ub4e4\uc5b4\uac04 \ud589\uc774 \uc788\uc73c\uba74 \uac19\uc740 \ubb38\uc7a5 \uc548\uc5d0\uc11c NOTIFY mail_queue\ub97c \ubcf4\ub0b8\ub2e4(\ucee4\ubc0b \uc2dc \uc804\ub2ec).
+    """
+    src = values(
+        column("event_key", String),
+        column("event_type", String),
+        column("ticket_id", Integer),
+        column("recipient_emp_no", String),
+        column("recipient_email", String),
+        column("subject", String),
+        column("body_text", Text),
+        column("body_html", Text),
+        column("invalid_email", Boolean),
+        name="src",
+    ).data(
+        [
+            (
+                p.event_key,
+                p.event_type,
+                p.ticket_id,
+                p.recipient_emp_no,
+                p.recipient_email,
+                p.subject,
+                p.body_text,
+                p.body_html,
+                not valid,
+            )
+            for p, valid in entries
+        ]
+    )
+    # VALUES \uc548\uc758 NULL\uc740 \ud0c0\uc785\uc774 \uc5c6\uc5b4 text\ub85c \ucd94\ub860\ub418\ubbc0\ub85c \uceec\ub7fc \ud0c0\uc785\uc73c\ub85c \uba85\uc2dc\ud55c\ub2e4
+    src = select(*[cast(c, c.type).label(c.name) for c in src.c]).subquery("typed_src")
+    sent = aliased(MailLog)
+    cooldown = (
+        select(sent.id)
+        .where(sent.recipient_email == src.c.recipient_email)
+        .where(sent.event_type == src.c.event_type)
+        .where(sent.ticket_id.is_not_distinct_from(src.c.ticket_id))
+        .where(sent.status == "sent")
+        .where(sent.created_at >= now - timedelta(seconds=MAIL_COOLDOWN_SECONDS))
+        .exists()
+    )
+    decided = select(
+        src,
+        case((src.c.invalid_email, SKIP_INVALID_EMAIL), (cooldown, SKIP_COOLDOWN), else_=null()).label("skip_reason"),
+    ).subquery("decided")
+    pending = decided.c.skip_reason.is_(None)
+    columns = [
+        "event_key",
+        "event_type",
+        "ticket_id",
+        "recipient_emp_no",
+        "recipient_email",
+        "subject",
+        "body_text",
+        "body_html",
+        "status",
+        "attempts",
+        "last_attempt_at",
+        "next_attempt_at",
+        "error_message",
+    ]
+    rows = select(
+        decided.c.event_key,
+        decided.c.event_type,
+        decided.c.ticket_id,
+        decided.c.recipient_emp_no,
+        decided.c.recipient_email,
+        decided.c.subject,
+        decided.c.body_text,
+        decided.c.body_html,
+        case((pending, "pending"), else_="skipped"),
+        literal(0),
+        case((pending, null()), else_=literal(now)),
+        case((pending, literal(now)), else_=null()),
+        decided.c.skip_reason,
+    )
+    inserted = (
+        pg_insert(MailLog)
+        .from_select(columns, rows)
+        .on_conflict_do_nothing(index_elements=[MailLog.event_key])
+        .returning(MailLog.event_key, MailLog.status)
+        .cte("inserted")
+    )
+    # \uac19\uc740 \ud2b8\ub79c\uc7ad\uc158\uc758 \ub3d9\uc77c\ud55c NOTIFY\ub294 \ud55c \ubc88\ub9cc \uc804\ub2ec\ub418\ubbc0\ub85c pending \ud589\ub9c8\ub2e4 \ud638\ucd9c\ud574\ub3c4 \ub41c\ub2e4
+    return select(
+        inserted.c.event_key,
+        inserted.c.status,
+        case((inserted.c.status == "pending", func.pg_notify(MAIL_QUEUE_CHANNEL, ""))),
     )
-    return session.execute(stmt).first() is not None
 
 
-def enqueue_mail(payload: MailPayload) -> None:
+def _normalize(payload: MailPayload) -> tuple[MailPayload, bool]:
+    normalized = _validate_email(payload.recipient_email)
+    if not normalized:
+        return payload, False
+    payload.recipient_email = normalized
+    return payload, True
+
+
+def enqueue_mails(payloads: list[MailPayload]) -> None:
+    """\ud55c \uc774\ubca4\ud2b8\uc758 \uc218\uc2e0\uc790 \uc804\uccb4\ub97c \ud55c \ubc88\uc758 INSERT\uc640 \ud55c \ubc88\uc758 \ucee4\ubc0b\uc73c\ub85c \ud050\uc5d0 \ub123\ub294\ub2e4."""
+    if not payloads:
+        return
     if not _is_smtp_ready():
-        logger.info("SMTP \uc124\uc815 \ub204\ub77d\uc73c\ub85c \uba54\uc77c \ubc1c\uc1a1\uc744 \uc0dd\ub7b5\ud569\ub2c8\ub2e4. event_key=%s", payload.event_key)
+        for payload in payloads:
+            logger.info("SMTP \uc124\uc815 \ub204\ub77d\uc73c\ub85c \uba54\uc77c \ubc1c\uc1a1\uc744 \uc0dd\ub7b5\ud569\ub2c8\ub2e4. event_key=%s", payload.event_key)
         return
 
-    normalized = _validate_email(payload.recipient_email)
+    # \ud615\uc2dd \uc624\ub958 \uc8fc\uc18c\ub294 \uc6d0\ubb38 \uadf8\ub300\ub85c skipped\ub85c \ub0a8\uae30\uace0, \uc815\uc0c1 \uc8fc\uc18c\ub294 \uc815\uaddc\ud654\ud574\uc11c \ub123\ub294\ub2e4
+    entries = [_normalize(p) for p in payloads]
     now = datetime.now(timezone.utc)
-
     with SessionLocal() as session:
-        if not normalized:
-            session.add(
-                MailLog(
-                    event_key=payload.event_key,
-                    event_type=payload.event_type,
-                    ticket_id=payload.ticket_id,
-                    recipient_emp_no=payload.recipient_emp_no,
-                    recipient_email=payload.recipient_email,
-                    subject=payload.subject,
-                    body_text=payload.body_text,
-                    body_html=payload.body_html,
-                    status="skipped",
-                    attempts=0,
-                    last_attempt_at=now,
-                    error_message="\uc774\uba54\uc77c \uc8fc\uc18c \ud615\uc2dd \uc624\ub958\ub85c \ubc1c\uc1a1 \uc0dd\ub7b5",
-                )
-            )
-            session.commit()
-            logger.info("\uc774\uba54\uc77c \ud615\uc2dd \uc624\ub958\ub85c \ubc1c\uc1a1 \uc0dd\ub7b5: %s", payload.recipient_email)
-            return
-
-        payload.recipient_email = normalized
-
-        if _cooldown_hit(session, payload, now):
-            session.add(
-                MailLog(
-                    event_key=payload.event_key,
-                    event_type=payload.event_type,
-                    ticket_id=payload.ticket_id,
-                    recipient_emp_no=payload.recipient_emp_no,
-                    recipient_email=payload.recipient_email,
-                    subject=payload.subject,
-                    body_text=payload.body_text,
-                    body_html=payload.body_html,
-                    status="skipped",
-                    attempts=0,
-                    last_attempt_at=now,
-                    error_message="\ucfe8\ub2e4\uc6b4 \uae30\uac04 \uc911 \uc911\ubcf5 \ubc1c\uc1a1 \ucc28\ub2e8",
-                )
-            )
-            session.commit()
-            logger.info("\ucfe8\ub2e4\uc6b4\uc73c\ub85c \uba54\uc77c \ubc1c\uc1a1 \uc0dd\ub7b5: %s", payload.event_key)
-            return
+        inserted = {row.event_key: row.status for row in session.execute(_enqueue_statement(entries, now))}
+        session.commit()
 
-        exists = session.execute(select(MailLog.id).where(MailLog.event_key == payload.event_key)).first()
-        if exists:
+    for payload in payloads:
+        status = inserted.get(payload.event_key)
+        if status == "pending":
+            logger.info("\uba54\uc77c \ubc1c\uc1a1 \ud050 \ub4f1\ub85d: %s", payload.event_key)
+        elif status == "skipped":
+            logger.info("\uba54\uc77c \ubc1c\uc1a1 \uc0dd\ub7b5(%s): %s", payload.recipient_email, payload.event_key)
+        else:
             logger.info("\uc911\ubcf5 \uc774\ubca4\ud2b8\ub85c \uba54\uc77c \ubc1c\uc1a1 \uc0dd\ub7b5: %s", payload.event_key)
-            return
 
-        session.add(
-            MailLog(
-                event_key=payload.event_key,
-                event_type=payload.event_type,
-                ticket_id=payload.ticket_id,
-                recipient_emp_no=payload.recipient_emp_no,
-                recipient_email=payload.recipient_email,
-                subject=payload.subject,
-                body_text=payload.body_text,
-                body_html=payload.body_html,
-                status="pending",
-                attempts=0,
-                next_attempt_at=now,
-            )
-        )
-        session.commit()
-        logger.info("\uba54\uc77c \ubc1c\uc1a1 \ud050 \ub4f1\ub85d: %s", payload.event_key)
+
+def enqueue_mail(payload: MailPayload) -> None:
+    enqueue_mails([payload])
 
 
 def _next_backoff(attempts: int) -> int:
@@ -160,69 +262,226 @@ def _next_backoff(attempts: int) -> int:
     return steps[min(attempts - 1, len(steps) - 1)]
 
 
-def _load_pending(session: Session, now: datetime) -> list[MailLog]:
+def _load_pending(session: Session, now: datetime, limit: int = MAIL_BATCH_SIZE) -> list[MailLog]:
+    """\uc218\uc2e0\uc790\ubcc4\ub85c \uac00\uc7a5 \uc624\ub798\ub41c \ubbf8\ubc1c\uc1a1 \uac74\ub9cc \uac00\uc838\uc628\ub2e4.
+
+    \uac19\uc740 \uc218\uc2e0\uc790\uc758 \ub2e4\uc74c \uba54\uc77c\uc740 \uc55e\uc120 \uba54\uc77c\uc774 \ubc1c\uc1a1(\ub610\ub294 \uc7ac\uc2dc\ub3c4 \uc18c\uc9c4)\ub420 \ub54c\uae4c\uc9c0 \uac00\uc838\uac00\uc9c0 \uc54a\uc73c\ubbc0\ub85c,
+    \ubc1c\uc1a1 \uc2a4\ub808\ub4dc\uac00 \uc5ec\ub7ff\uc774\uac70\ub098 API \ud504\ub85c\uc138\uc2a4\ub9c8\ub2e4 \uc6cc\ucee4\uac00 \ub5a0 \uc788\uc5b4\ub3c4 \uc218\uc2e0\uc790\ubcc4 \uc21c\uc11c\uac00 \uc720\uc9c0\ub41c\ub2e4.
+    \uc55e\uc120 \uba54\uc77c\uc774 \ub2e4\ub978 \uc6cc\ucee4\uc5d0 \uc7a0\uaca8 \uc788\uc73c\uba74 SKIP LOCKED\ub85c \uac74\ub108\ub6f0\uace0, \ub4a4\uc758 \uba54\uc77c\uc740 head\uac00 \uc544\ub2c8\ub77c \uc120\ud0dd\ub418\uc9c0 \uc54a\ub294\ub2e4.
+    """
+    heads = (
+        select(MailLog.id, MailLog.next_attempt_at)
+        .where(MailLog.status.in_(RETRYABLE_STATUSES))
+        .where(MailLog.attempts < MAIL_MAX_ATTEMPTS)
+        .order_by(MailLog.recipient_email, MailLog.id)
+        .distinct(MailLog.recipient_email)
+        .cte("mail_heads")
+    )
     stmt = (
         select(MailLog)
-        .where(MailLog.status.in_(["pending", "failed"]))
-        .where(MailLog.next_attempt_at <= now)
-        .where(MailLog.attempts < MAIL_MAX_ATTEMPTS)
-        .with_for_update(skip_locked=True)
-        .limit(20)
+        .join(heads, heads.c.id == MailLog.id)
+        .where(heads.c.next_attempt_at <= now)
+        # \uc7a0\uae08 \uc9c1\uc804\uc5d0 \ub2e4\ub978 \uc6cc\ucee4\uac00 \ubc1c\uc1a1 \ucc98\ub9ac\ud55c \ud589\uc744 \uac78\ub7ec\ub0b4\uae30 \uc704\ud55c \uc7ac\ud655\uc778
+        .where(MailLog.status.in_(RETRYABLE_STATUSES))
+        .order_by(MailLog.next_attempt_at, MailLog.id)
+        .with_for_update(skip_locked=True, of=MailLog)
+        .limit(limit)
     )
     return list(session.scalars(stmt).all())
 
 
-def _process_once() -> int:
+def _is_connection_error(exc: BaseException) -> bool:
+    return isinstance(
+        exc,
+        (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError, TimeoutError, socket.gaierror),
+    )
+
+
+class SmtpConnectionPool:
+    """SMTP \ud638\uc2a4\ud2b8\ubcc4 \uc5f0\uacb0 \ud480. \ud06c\uae30\uac00 \uace7 \uadf8 \ud638\uc2a4\ud2b8\ub85c\uc758 \ub3d9\uc2dc \ubc1c\uc1a1 \uc0c1\ud55c\uc774\ub2e4."""
+
+    def __init__(self, size: int) -> None:
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: queue.LifoQueue[SmtpConnection] = queue.LifoQueue()
+
+    @contextmanager
+    def connection(self) -> Iterator[SmtpConnection]:
+        with self._slots:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = SmtpConnection()
+            try:
+                yield conn
+            finally:
+                self._idle.put(conn)
+
+    def close_idle(self) -> None:
+        # \uc5f0\uacb0 \uac1d\uccb4\ub294 \ub0a8\uaca8 \ub450\uace0 \uc18c\ucf13\ub9cc \ub2eb\ub294\ub2e4 (\ub2e4\uc74c \ubc1c\uc1a1 \ub54c \ub2e4\uc2dc \uc5f0\uacb0)
+        for conn in list(self._idle.queue):
+            conn.close()
+
+
+_smtp_pools: dict[tuple[str, int], SmtpConnectionPool] = {}
+_smtp_pools_lock = threading.Lock()
+
+
+def _smtp_pool() -> SmtpConnectionPool:
+    key = (settings.smtp_host, settings.smtp_port)
+    with _smtp_pools_lock:
+        pool = _smtp_pools.get(key)
+        if pool is None:
+            pool = _smtp_pools[key] = SmtpConnectionPool(max(1, settings.mail_max_connections_per_host))
+        return pool
+
+
+class _Aborted(Exception):
+    """\uac19\uc740 \ubc30\uce58\uc758 \ub2e4\ub978 \ubc1c\uc1a1\uc5d0\uc11c SMTP \uc5f0\uacb0 \uc7a5\uc560\uac00 \ub098\uc11c \uc2dc\ub3c4\ud558\uc9c0 \uc54a\uc740 \uac74."""
+
+
+def _send_with_pool(payload: MailPayload, pool: SmtpConnectionPool, abort: threading.Event) -> None:
+    with pool.connection() as conn:
+        if abort.is_set():
+            raise _Aborted()
+        try:
+            _send_message(payload, conn)
+        except Exception as exc:
+            if _is_connection_error(exc):
+                conn.close()
+                abort.set()
+            raise
+
+
+def _payload_from_log(log: MailLog) -> MailPayload:
+    return MailPayload(
+        event_key=log.event_key,
+        event_type=log.event_type,
+        subject=log.subject,
+        body_html=log.body_html or "",
+        body_text=log.body_text or "",
+        recipient_email=log.recipient_email,
+        recipient_emp_no=log.recipient_emp_no,
+        ticket_id=log.ticket_id,
+    )
+
+
+def _process_once(executor: ThreadPoolExecutor, limit: int = MAIL_BATCH_SIZE) -> int:
+    """\ub300\uae30 \uba54\uc77c\uc744 \ucd5c\ub300 limit\uac74 \ubc1c\uc1a1 \uc2a4\ub808\ub4dc \ud480\ub85c \ub3d9\uc2dc\uc5d0 \ubcf4\ub0b4\uace0 \ucc98\ub9ac \uac74\uc218\ub97c \ub3cc\ub824\uc900\ub2e4.
+    SMTP \uc11c\ubc84\uc5d0 \uc5f0\uacb0\ud560 \uc218 \uc5c6\uc73c\uba74 \uc544\uc9c1 \uc2dc\ub3c4\ud558\uc9c0 \uc54a\uc740 \uac74\uc740 \uac74\ub4dc\ub9ac\uc9c0 \uc54a\uace0 SMTP_UNAVAILABLE\uc744 \ub3cc\ub824
+    \uc6cc\ucee4\uac00 \ud050\uac00 \ube48 \uacbd\uc6b0\uc640 \uad6c\ubd84\ud574 \uc810\uc810 \uae38\uac8c \uc26c\uac8c \ud55c\ub2e4."""
     if not _is_smtp_ready():
         return 0
 
     now = datetime.now(timezone.utc)
-    processed = 0
+    pool = _smtp_pool()
+    abort = threading.Event()
     with SessionLocal() as session:
-        logs = _load_pending(session, now)
-        for log in logs:
-            processed += 1
-            payload = MailPayload(
-                event_key=log.event_key,
-                event_type=log.event_type,
-                subject=log.subject,
-                body_html=log.body_html or "",
-                body_text=log.body_text or "",
-                recipient_email=log.recipient_email,
-                recipient_emp_no=log.recipient_emp_no,
-                ticket_id=log.ticket_id,
-            )
-            try:
-                _send_message(payload)
+        logs = _load_pending(session, now, limit)
+        # ORM \uac1d\uccb4\ub294 \uc774 \uc2a4\ub808\ub4dc\uc5d0\uc11c\ub9cc \ub2e4\ub8e8\uace0, \ubc1c\uc1a1 \uc2a4\ub808\ub4dc\uc5d0\ub294 MailPayload\ub9cc \ub118\uae34\ub2e4
+        futures = [(log, executor.submit(_send_with_pool, _payload_from_log(log), pool, abort)) for log in logs]
+        for log, future in futures:
+            exc = future.exception()
+            if isinstance(exc, _Aborted):
+                continue
+            # \ubc1c\uc1a1 \uc9c0\uc5f0(created_at \u2192 last_attempt_at) \uc9c0\ud45c\ub97c \uc704\ud574 \ubc30\uce58 \uc2dc\uc791\uc774 \uc544\ub2cc \uc644\ub8cc \uc2dc\uac01\uc744 \ub0a8\uae34\ub2e4
+            done_at = datetime.now(timezone.utc)
+            if exc is None:
                 log.status = "sent"
                 log.attempts += 1
-                log.last_attempt_at = now
+                log.last_attempt_at = done_at
                 log.next_attempt_at = None
                 log.error_message = None
                 logger.info("\uba54\uc77c \ubc1c\uc1a1 \uc131\uacf5: %s", log.event_key)
-            except Exception as exc:  # noqa: BLE001 - \uc6b4\uc601 \ub85c\uadf8\uc6a9 \uc608\uc678 \ucc98\ub9ac
+            else:
                 log.attempts += 1
                 log.status = "failed"
-                log.last_attempt_at = now
-                log.next_attempt_at = now + timedelta(seconds=_next_backoff(log.attempts))
+                log.last_attempt_at = done_at
+                log.next_attempt_at = done_at + timedelta(seconds=_next_backoff(log.attempts))
                 log.error_message = str(exc)
-                logger.exception("\uba54\uc77c \ubc1c\uc1a1 \uc2e4\ud328: %s", log.event_key)
+                logger.error("\uba54\uc77c \ubc1c\uc1a1 \uc2e4\ud328: %s", log.event_key, exc_info=exc)
         session.commit()
-    return processed
+    return SMTP_UNAVAILABLE if abort.is_set() else len(logs)
 
 
-def _worker_loop() -> None:
-    while True:
-        try:
-            _process_once()
-        except Exception:
-            logger.exception("\uba54\uc77c \ubc1c\uc1a1 \uc6cc\ucee4 \uc624\ub958")
+def _next_smtp_retry(delay: float) -> float:
+    return min(delay * 2, MAIL_SMTP_MAX_RETRY_SECONDS)
+
+
+def _next_batch_size(limit: int, processed: int) -> int:
+    if processed >= limit:
+        return min(limit * 2, MAIL_MAX_BATCH_SIZE)
+    return MAIL_BATCH_SIZE
+
+
+def _wait_for_mail(waiter: ChannelWaiter) -> None:
+    try:
+        waiter.wait(MAIL_LISTEN_FALLBACK_SECONDS)
+    except Exception:
+        # LISTEN\uc744 \uc4f8 \uc218 \uc5c6\uc73c\uba74 \uc608\uc804\ucc98\ub7fc \uc8fc\uae30\uc801\uc73c\ub85c \ud3f4\ub9c1
+        logger.exception("\uba54\uc77c \ud050 LISTEN \uc2e4\ud328, %s\ucd08 \ud3f4\ub9c1\uc73c\ub85c \ub300\uccb4", MAIL_POLL_SECONDS)
+        waiter.close()
         time.sleep(MAIL_POLL_SECONDS)
 
 
-def start_mail_worker_thread() -> None:
+def _worker_loop(stop: threading.Event) -> None:
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, settings.mail_sender_pool_size),
+        thread_name_prefix="mail-sender",
+    )
+    waiter = ChannelWaiter(MAIL_QUEUE_CHANNEL)
+    limit = MAIL_BATCH_SIZE
+    smtp_retry = MAIL_SMTP_RETRY_SECONDS
+    try:
+        while not stop.is_set():
+            processed = 0
+            try:
+                processed = _process_once(executor, limit)
+            except Exception:
+                logger.exception("\uba54\uc77c \ubc1c\uc1a1 \uc6cc\ucee4 \uc624\ub958")
+            if processed == SMTP_UNAVAILABLE:
+                # \ud050\uac00 \ube48 \uac83\uc774 \uc544\ub2c8\ubbc0\ub85c NOTIFY\ub97c \uae30\ub2e4\ub9ac\uc9c0 \uc54a\uace0, SMTP\uac00 \ub3cc\uc544\uc62c \ub54c\uae4c\uc9c0 \uac04\uaca9\uc744 \ub298\ub824 \uac00\uba70 \ub2e4\uc2dc \uc2dc\ub3c4\ud55c\ub2e4
+                logger.warning("SMTP \uc11c\ubc84\uc5d0 \uc5f0\uacb0\ud560 \uc218 \uc5c6\uc5b4 %s\ucd08 \ud6c4 \ub2e4\uc2dc \ubc1c\uc1a1\ud569\ub2c8\ub2e4", smtp_retry)
+                _smtp_pool().close_idle()
+                stop.wait(smtp_retry)
+                smtp_retry = _next_smtp_retry(smtp_retry)
+                limit = MAIL_BATCH_SIZE
+                continue
+            smtp_retry = MAIL_SMTP_RETRY_SECONDS
+            limit = _next_batch_size(limit, processed)
+            if processed:
+                # \ub300\uae30 \uc911\uc778 \uba54\uc77c\uc774 \ub0a8\uc544 \uc788\uc744 \uc218 \uc788\uc73c\ubbc0\ub85c \uc26c\uc9c0 \uc54a\uace0 \ub2e4\uc74c \ubc30\uce58\ub97c \uac00\uc838\uc628\ub2e4
+                continue
+            # \ud050\uac00 \ube44\uba74 \uc5f0\uacb0\uc744 \ub2eb\uace0 NOTIFY(\ub610\ub294 \uc7ac\uc2dc\ub3c4 \uc2dc\uac01)\ub97c \uae30\ub2e4\ub9b0\ub2e4
+            _smtp_pool().close_idle()
+            _wait_for_mail(waiter)
+    finally:
+        # \uc2a4\ucf00\uc904\ub7ec\uac00 \ub9ac\ub354\ub97c \ub0b4\ub824\ub193\uc73c\uba74 \uc9c4\ud589 \uc911\uc778 \ubc1c\uc1a1\ub9cc \ub9c8\uce58\uace0 \uc5f0\uacb0\uc744 \uc815\ub9ac\ud55c\ub2e4
+        waiter.close()
+        executor.shutdown(wait=True)
+        _smtp_pool().close_idle()
+
+
+_worker_thread: threading.Thread | None = None
+
+
+def wake_mail_worker() -> None:
+    """LISTEN\uc73c\ub85c \ub300\uae30 \uc911\uc778 \uc6cc\ucee4\ub97c \uae68\uc6b4\ub2e4 (\uba48\ucd9c \ub54c MAIL_LISTEN_FALLBACK_SECONDS\ub97c \uae30\ub2e4\ub9ac\uc9c0 \uc54a\ub3c4\ub85d)."""
+    with SessionLocal() as session:
+        notify(session, MAIL_QUEUE_CHANNEL)
+        session.commit()
+
+
+def start_mail_worker_thread(stop: threading.Event | None = None) -> threading.Thread | None:
+    """\ud504\ub85c\uc138\uc2a4\ub2f9 \ud558\ub098\ub9cc \ub3cc\ub9b0\ub2e4. \uc5ec\ub7ec \ud504\ub85c\uc138\uc2a4\uac00 \uac01\uc790 \ub3cc\ub824\ub3c4 \ud589 \uc7a0\uae08\uc73c\ub85c \uac19\uc740 \uba54\uc77c\uc744 \uc911\ubcf5 \ubc1c\uc1a1\ud558\uc9c0 \uc54a\uc9c0\ub9cc,
+    API \ud504\ub85c\uc138\uc2a4\uc5d0\uc11c\ub294 \uc2a4\ucf00\uc904\ub7ec(services/scheduler.py)\uac00 \ub9ac\ub354 \ud504\ub85c\uc138\uc2a4\uc5d0\uc11c\ub9cc \uc2dc\uc791\ud55c\ub2e4. stop\uc774 set\ub418\uba74 \uba48\ucd98\ub2e4."""
+    global _worker_thread
     if not _is_smtp_ready():
         logger.info("SMTP \uc124\uc815 \ubbf8\uc644\ub8cc\ub85c \uba54\uc77c \uc6cc\ucee4\ub97c \uc2dc\uc791\ud558\uc9c0 \uc54a\uc2b5\ub2c8\ub2e4.")
-        return
-    t = threading.Thread(target=_worker_loop, name="mail-worker", daemon=True)
-    t.start()
+        return None
+    if _worker_thread is not None and _worker_thread.is_alive():
+        return None
+    _worker_thread = threading.Thread(
+        target=_worker_loop, args=(stop or threading.Event(),), name="mail-worker", daemon=True
+    )
+    _worker_thread.start()
+    return _worker_thread
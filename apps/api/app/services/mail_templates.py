@@ -0,0 +1,209 @@
+"""알림 메일 본문 템플릿.
+
+레이아웃은 모듈 로드 시 string.Template($name)으로 한 번만 만들어 두고, 렌더링은 두 단계로 나눈다.
+- 공통 본문: 알림 종류·요약·필드·상태가 같으면 수신자가 달라도 같으므로 한 번 렌더링해 캐시한다
+  (한 이벤트를 담당자 여러 명에게 보낼 때 두 번째 수신자부터는 캐시를 그대로 쓴다).
+- 수신자별 부분: 링크만 수신자(관리자/요청자 화면)에 따라 달라지므로, 공통 본문을 링크 위치에서
+  잘라 둔 조각 사이에 끼워 넣기만 한다.
+
+렌더링 벤치마크: `python -m app.services.mail_templates bench [--events 50] [--recipients 20]`
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from functools import lru_cache
+import html
+from string import Template
+import time
+
+MAIL_TEMPLATE_CACHE_SIZE = 256
+# 공통 본문을 렌더링할 때 링크 자리에 넣는 표식 (escape 대상 문자가 없어 결과에 그대로 남는다)
+_LINK_SLOT = "\x00link\x00"
+
+_STATUS_BADGE_STYLES = {
+    "접수": ("#e0f2fe", "#075985", "#bae6fd"),
+    "진행": ("#fef9c3", "#854d0e", "#fde68a"),
+    "완료": ("#dcfce7", "#166534", "#bbf7d0"),
+    "사업 검토": ("#fef3c7", "#92400e", "#fcd34d"),
+}
+_DEFAULT_BADGE_STYLE = ("#f3f4f6", "#374151", "#e5e7eb")
+
+_BADGE = Template(
+    '<span style="display:inline-block;padding:4px 10px;border-radius:999px;'
+    'background:$bg;color:$fg;border:1px solid $border;font-size:12px;font-weight:600;">'
+    "$label"
+    "</span>"
+)
+
+_HTML_ROW = Template(
+    """
+        <tr>
+          <td style="padding:8px 0;color:#6b7280;font-size:13px;width:140px;">$label</td>
+          <td style="padding:8px 0;color:#111827;font-size:14px;font-weight:600;">$value</td>
+        </tr>
+        """
+)
+
+_HTML_LAYOUT = Template(
+    """<!DOCTYPE html>
+<html lang="ko">
+  <body style="margin:0;padding:24px;background:#ffffff;">
+    <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="background:#ffffff;">
+      <tr>
+        <td align="center">
+          <table role="presentation" width="680" cellspacing="0" cellpadding="0" style="width:680px;margin:0;background:#ffffff;border-radius:14px;overflow:hidden;border:1px solid #e5e7eb;">
+            <tr>
+              <td style="padding:20px 24px;border-bottom:1px solid #e5e7eb;">
+                <div style="margin-bottom:4px;"><span style="font-size:22px;font-weight:900;letter-spacing:-0.025em;color:#111827;">IT DESK</span><span style="font-size:12px;color:#6b7280;font-weight:600;letter-spacing:0.04em;margin-left:6px;">| $alert_type</span></div>
+                <div style="margin-top:6px;font-size:20px;font-weight:700;color:#111827;">$summary</div>
+              </td>
+            </tr>
+            <tr>
+              <td style="padding:20px 24px;">
+                <div style="margin-top:12px;">
+                  $status_badge
+                </div>
+                <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="margin-top:16px;border-collapse:collapse;">
+                  $rows
+                </table>
+                <div style="margin-top:18px;">
+                  <a href="$link_url" style="display:inline-block;padding:12px 20px;background:#1d4ed8;color:#ffffff;text-decoration:none;border-radius:8px;font-weight:700;font-size:14px;">요청 상세 보기</a>
+                </div>
+              </td>
+            </tr>
+            <tr>
+              <td style="padding:16px 24px;border-top:1px solid #e5e7eb;font-size:12px;color:#6b7280;line-height:1.6;">
+                <div>본 메일은 시스템 알림용으로 발송되었습니다.</div>
+                <div>발신 전용 메일입니다(회신 불가).</div>
+              </td>
+            </tr>
+          </table>
+        </td>
+      </tr>
+    </table>
+  </body>
+</html>"""
+)
+
+_TEXT_HEADER = Template("IT DESK | $alert_type\n\n$summary\n\n요청 정보")
+_TEXT_FIELD = Template("- $label: $value")
+_TEXT_FOOTER = Template(
+    "- 상태: $status_label\n\n요청 상세 보기: $link_url\n\n"
+    "본 메일은 시스템 알림용으로 발송되었습니다.\n발신 전용 메일입니다(회신 불가)."
+)
+
+
+@dataclass(frozen=True)
+class MailBody:
+    text: str
+    html: str
+
+
+def _esc(value: str | None) -> str:
+    return html.escape(value or "-")
+
+
+def _status_badge(status_label: str) -> str:
+    bg, fg, border = _STATUS_BADGE_STYLES.get(status_label, _DEFAULT_BADGE_STYLE)
+    return _BADGE.substitute(bg=bg, fg=fg, border=border, label=_esc(status_label))
+
+
+def _render_text(
+    alert_type: str, summary: str, fields: tuple[tuple[str, str], ...], status_label: str, link_url: str
+) -> str:
+    lines = [_TEXT_HEADER.substitute(alert_type=alert_type, summary=summary)]
+    lines.extend(_TEXT_FIELD.substitute(label=label, value=value) for label, value in fields)
+    lines.append(_TEXT_FOOTER.substitute(status_label=status_label, link_url=link_url))
+    return "\n".join(lines)
+
+
+def _render_html(
+    alert_type: str, summary: str, fields: tuple[tuple[str, str], ...], status_label: str, link_url: str
+) -> str:
+    rows = "".join(_HTML_ROW.substitute(label=_esc(label), value=_esc(value)) for label, value in fields)
+    return _HTML_LAYOUT.substitute(
+        alert_type=_esc(alert_type),
+        summary=_esc(summary),
+        status_badge=_status_badge(status_label),
+        rows=rows,
+        link_url=link_url,
+    )
+
+
+@lru_cache(maxsize=MAIL_TEMPLATE_CACHE_SIZE)
+def _render_shared(
+    alert_type: str, summary: str, fields: tuple[tuple[str, str], ...], status_label: str
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """링크를 뺀 공통 본문을 링크 위치에서 자른 조각 (text, html)."""
+    text = _render_text(alert_type, summary, fields, status_label, _LINK_SLOT)
+    body = _render_html(alert_type, summary, fields, status_label, _LINK_SLOT)
+    # 캐시된 조각은 여러 스레드가 함께 쓰므로 tuple로 둔다
+    return tuple(text.split(_LINK_SLOT)), tuple(body.split(_LINK_SLOT))
+
+
+def render_mail_body(
+    *,
+    alert_type: str,
+    summary: str,
+    fields: list[tuple[str, str]],
+    status_label: str,
+    link_url: str,
+) -> MailBody:
+    text_parts, html_parts = _render_shared(alert_type, summary, tuple(fields), status_label)
+    return MailBody(text=link_url.join(text_parts), html=_esc(link_url).join(html_parts))
+
+
+def clear_template_cache() -> None:
+    _render_shared.cache_clear()
+
+
+def _bench(events: int, recipients: int) -> None:
+    def render_all(cached: bool) -> float:
+        started = time.perf_counter()
+        for event in range(events):
+            fields = (
+                ("요청 제목", f"프린터 연결 오류 <{event}>"),
+                ("카테고리", "하드웨어"),
+                ("작업 구분", "장애"),
+                ("요청자", "홍길동 / 책임전문원 / 전산팀"),
+            )
+            link_url = f"https://desk.example.com/admin/tickets/{event}"
+            for _ in range(recipients):
+                if cached:
+                    render_mail_body(
+                        alert_type="신규 요청 접수",
+                        summary="신규 요청이 접수되었습니다.",
+                        fields=list(fields),
+                        status_label="접수",
+                        link_url=link_url,
+                    )
+                else:
+                    args = ("신규 요청 접수", "신규 요청이 접수되었습니다.", fields, "접수", link_url)
+                    MailBody(text=_render_text(*args), html=_render_html(*args))
+        return time.perf_counter() - started
+
+    total = events * recipients
+    uncached = render_all(cached=False)
+    clear_template_cache()
+    cached = render_all(cached=True)
+    info = _render_shared.cache_info()
+    print(f"{total} notifications ({events} events x {recipients} recipients)")
+    print(f"  render per recipient: {uncached * 1000:.1f} ms ({uncached / total * 1e6:.1f} us/mail)")
+    print(f"  shared body cached:   {cached * 1000:.1f} ms ({cached / total * 1e6:.1f} us/mail)")
+    print(f"  cache hits={info.hits} misses={info.misses}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="알림 메일 템플릿")
+    parser.add_argument("command", choices=["bench"])
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--recipients", type=int, default=20)
+    args = parser.parse_args()
+    if args.command == "bench":
+        _bench(args.events, args.recipients)
+
+
+if __name__ == "__main__":
+    main()
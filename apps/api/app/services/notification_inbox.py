@@ -0,0 +1,195 @@
+"""사용자별 인앱 알림함(notifications) 팬아웃 및 조회.
+
+메일 알림(mail_events)과 같은 지점에서, 같은 트랜잭션 안에서 수신자별 행을 만든다.
+수신 조건은 기존 GET /notifications가 매번 조인으로 계산하던 규칙과 동일하다.
+"""
+
+from __future__ import annotations
+
+import json
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from ..models.comment import TicketComment
+from ..models.contact_assignment_member import ContactAssignmentMember
+from ..models.event import TicketEvent
+from ..models.notification import Notification, NotificationCursor
+from ..models.ticket import Ticket, TicketAssignee
+from ..models.user import User
+from .notification_stream import notify_recipients
+
+INBOX_LIMIT = 50
+# 요청자에게 알리는 상태 변경 (SMTP notify_requester_status_changed와 동일)
+NOTIFY_STATUSES = ("resolved", "closed", "in_progress")
+
+STATUS_LABELS = {
+    "open": "접수",
+    "in_progress": "진행",
+    "resolved": "완료",
+    "closed": "사업 검토",
+}
+
+
+def _status_label(value: str | None) -> str:
+    if not value:
+        return "-"
+    s = value.lower()
+    if s in ("open", "new", "pending"):
+        return STATUS_LABELS["open"]
+    if s in ("in_progress", "processing", "assigned", "working", "progress"):
+        return STATUS_LABELS["in_progress"]
+    if s in ("resolved", "done", "completed"):
+        return STATUS_LABELS["resolved"]
+    if s in ("closed", "review", "business_review"):
+        return STATUS_LABELS["closed"]
+    return value
+
+
+def event_message(event: TicketEvent) -> str:
+    if event.type == "ticket_created":
+        return "요청이 접수되었습니다."
+    if event.type == "reopened":
+        return "재요청이 접수되었습니다."
+    if event.type == "status_changed":
+        if event.from_value or event.to_value:
+            before = _status_label(event.from_value)
+            after = _status_label(event.to_value)
+            return f"{before} -> {after}"
+    if event.type == "requester_updated" and event.note:
+        try:
+            payload = json.loads(event.note)
+            summary = payload.get("summary")
+            if isinstance(summary, str) and summary.strip():
+                return summary
+        except Exception:
+            return event.note
+    return event.note or ""
+
+
+def _row(recipient_emp_no: str, source_key: str, type_: str, ticket: Ticket, message: str) -> dict:
+    return {
+        "recipient_emp_no": recipient_emp_no,
+        "source_key": source_key,
+        "type": type_,
+        "ticket_id": ticket.id,
+        "ticket_title": ticket.title,
+        "message": message[:255],
+    }
+
+
+def _insert(session: Session, rows: list[dict]) -> None:
+    if not rows:
+        return
+    stmt = pg_insert(Notification).values(rows)
+    session.execute(stmt.on_conflict_do_nothing(constraint="uq_notifications_recipient_source"))
+    # SSE 구독자 깨우기 (커밋될 때 전달)
+    notify_recipients(session, {row["recipient_emp_no"] for row in rows})
+
+
+def _admin_emp_nos(session: Session, emp_nos: set[str]) -> list[str]:
+    if not emp_nos:
+        return []
+    stmt = select(User.emp_no).where(User.emp_no.in_(emp_nos), User.role == "admin").order_by(User.emp_no)
+    return list(session.scalars(stmt).all())
+
+
+def add_ticket_created_notifications(session: Session, ticket: Ticket, event: TicketEvent) -> None:
+    """요청자: 요청 접수 / 카테고리 담당자(관리자): 새 요청. event는 flush되어 id가 있어야 한다."""
+    rows = [_row(ticket.requester_emp_no, f"event:{event.id}", event.type, ticket, event_message(event))]
+    if ticket.category_id is not None:
+        members = session.scalars(
+            select(ContactAssignmentMember.emp_no)
+            .join(User, User.emp_no == ContactAssignmentMember.emp_no)
+            .where(ContactAssignmentMember.category_id == ticket.category_id)
+            .where(User.role == "admin")
+        ).all()
+        rows.extend(_row(emp_no, f"ticket:{ticket.id}", "new_ticket", ticket, "새 요청이 등록되었습니다.") for emp_no in members)
+    _insert(session, rows)
+
+
+def add_status_changed_notifications(session: Session, ticket: Ticket, event: TicketEvent) -> None:
+    if event.to_value not in NOTIFY_STATUSES:
+        return
+    _insert(session, [_row(ticket.requester_emp_no, f"event:{event.id}", event.type, ticket, event_message(event))])
+
+
+def add_reopened_notifications(session: Session, ticket: Ticket, event: TicketEvent) -> None:
+    """재요청 접수: 담당자(관리자)들에게."""
+    emp_nos = set(session.scalars(select(TicketAssignee.emp_no).where(TicketAssignee.ticket_id == ticket.id)).all())
+    if ticket.assignee_emp_no:
+        emp_nos.add(ticket.assignee_emp_no)
+    rows = [
+        _row(emp_no, f"event:{event.id}", "reopened", ticket, "재요청이 접수되었습니다")
+        for emp_no in _admin_emp_nos(session, emp_nos)
+    ]
+    _insert(session, rows)
+
+
+def add_comment_notifications(session: Session, ticket: Ticket, comment: TicketComment, author: User) -> None:
+    """요청자 답변 → 담당자(관리자), 관리자 답변 → 요청자(관리자가 아닌 경우)."""
+    message = comment.title or "답변이 등록되었습니다."
+    source_key = f"comment:{comment.id}"
+    if author.role == "requester":
+        recipients = _admin_emp_nos(session, {ticket.assignee_emp_no} if ticket.assignee_emp_no else set())
+        _insert(session, [_row(emp_no, source_key, "requester_commented", ticket, message) for emp_no in recipients])
+    elif author.role == "admin":
+        requester = session.get(User, ticket.requester_emp_no)
+        if requester and requester.role != "admin":
+            _insert(session, [_row(requester.emp_no, source_key, "staff_commented", ticket, message)])
+
+
+def list_inbox(
+    session: Session,
+    emp_no: str,
+    since: int | None = None,
+    limit: int = INBOX_LIMIT,
+) -> list[Notification]:
+    """최근 알림(최신순). since(seq)를 주면 그 이후에 생긴 알림만 돌려준다."""
+    stmt = select(Notification).where(Notification.recipient_emp_no == emp_no)
+    if since is not None:
+        stmt = stmt.where(Notification.id > since)
+    stmt = stmt.order_by(Notification.id.desc()).limit(limit)
+    return list(session.scalars(stmt).all())
+
+
+def get_latest_id(session: Session, emp_no: str) -> int:
+    value = session.scalar(select(func.max(Notification.id)).where(Notification.recipient_emp_no == emp_no))
+    return int(value or 0)
+
+
+def get_last_read_id(session: Session, emp_no: str) -> int:
+    value = session.scalar(select(NotificationCursor.last_read_id).where(NotificationCursor.emp_no == emp_no))
+    return int(value or 0)
+
+
+def count_unread(session: Session, emp_no: str) -> int:
+    last_read_id = get_last_read_id(session, emp_no)
+    stmt = (
+        select(func.count())
+        .select_from(Notification)
+        .where(Notification.recipient_emp_no == emp_no, Notification.id > last_read_id)
+    )
+    return int(session.scalar(stmt) or 0)
+
+
+def mark_read(session: Session, emp_no: str, up_to_id: int | None = None) -> int:
+    """읽음 위치를 up_to_id(없으면 최신 알림)까지 앞으로 옮긴다. 뒤로는 돌아가지 않는다.
+    up_to_id는 본인의 최신 알림 id를 넘지 않게 자른다(큰 값이 저장되면 이후 알림이 모두 읽음으로 보이므로)."""
+    latest_id = get_latest_id(session, emp_no)
+    up_to_id = latest_id if up_to_id is None else max(0, min(up_to_id, latest_id))
+    stmt = pg_insert(NotificationCursor).values(emp_no=emp_no, last_read_id=up_to_id)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[NotificationCursor.emp_no],
+        set_={
+            # 예전에 최신 id보다 크게 저장된 위치도 여기서 바로잡힌다
+            "last_read_id": func.greatest(
+                func.least(NotificationCursor.last_read_id, latest_id), stmt.excluded.last_read_id
+            ),
+            "updated_at": func.now(),
+        },
+    )
+    session.execute(stmt)
+    session.commit()
+    return get_last_read_id(session, emp_no)
@@ -0,0 +1,93 @@
+"""알림 실시간 전달(SSE) 허브.
+
+notifications 행을 넣는 트랜잭션이 pg_notify(NOTIFY_CHANNEL, 수신자 사번)를 함께 보내고,
+프로세스마다 하나인 리스너 스레드가 LISTEN으로 받아 해당 사번의 SSE 구독자를 깨운다.
+NOTIFY는 커밋 시점에만 전달되므로 롤백된 알림은 전달되지 않으며,
+API 프로세스가 여러 개여도 모든 프로세스의 구독자가 깨어난다.
+구독자는 깨어나면 마지막으로 보낸 seq 이후의 알림을 DB에서 다시 읽어 보낸다(신호만 전달, 내용은 DB 기준).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+
+from sqlalchemy.orm import Session
+
+from ..core.pg_notify import connect_listener, notify
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "notifications"
+LISTEN_TIMEOUT_SECONDS = 30
+LISTEN_RETRY_SECONDS = 5
+
+_lock = threading.Lock()
+_subscribers: dict[str, set[tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+_listener_started = False
+
+
+def notify_recipients(session: Session, emp_nos: set[str]) -> None:
+    """현재 트랜잭션이 커밋되면 수신자별로 NOTIFY가 전달된다."""
+    for emp_no in sorted(emp_nos):
+        notify(session, NOTIFY_CHANNEL, emp_no)
+
+
+def subscribe(emp_no: str) -> asyncio.Event:
+    event = asyncio.Event()
+    with _lock:
+        _subscribers.setdefault(emp_no, set()).add((asyncio.get_running_loop(), event))
+    return event
+
+
+def unsubscribe(emp_no: str, event: asyncio.Event) -> None:
+    with _lock:
+        subs = _subscribers.get(emp_no)
+        if not subs:
+            return
+        subs.difference_update({s for s in subs if s[1] is event})
+        if not subs:
+            _subscribers.pop(emp_no, None)
+
+
+def publish(emp_no: str) -> None:
+    with _lock:
+        targets = list(_subscribers.get(emp_no, ()))
+    for loop, event in targets:
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힌 구독자
+            pass
+
+
+def _listen_loop() -> None:
+    while True:
+        try:
+            with connect_listener(NOTIFY_CHANNEL) as conn:
+                logger.info("알림 리스너 연결됨: channel=%s", NOTIFY_CHANNEL)
+                while True:
+                    # timeout마다 빠져나와 연결 상태를 다시 확인한다
+                    for n in conn.notifies(timeout=LISTEN_TIMEOUT_SECONDS):
+                        publish(n.payload)
+                    conn.execute("SELECT 1")
+        except Exception:
+            logger.exception("알림 리스너 오류, %s초 후 재연결", LISTEN_RETRY_SECONDS)
+        # 재연결 사이에 놓친 알림은 구독자가 깨어날 때 seq 기준으로 다시 읽으므로 모두 깨운다
+        with _lock:
+            emp_nos = list(_subscribers)
+        for emp_no in emp_nos:
+            publish(emp_no)
+        time.sleep(LISTEN_RETRY_SECONDS)
+
+
+def start_notification_listener_thread() -> None:
+    global _listener_started
+    with _lock:
+        if _listener_started:
+            return
+        _listener_started = True
+    t = threading.Thread(target=_listen_loop, name="notification-listener", daemon=True)
+    t.start()
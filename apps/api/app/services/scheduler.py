@@ -0,0 +1,179 @@
+"""백그라운드 주기 작업의 단일 리더 스케줄러.
+
+on_startup은 uvicorn/gunicorn 워커 프로세스마다 돌지만, 사용자 동기화·메일 발송 워커·mail_logs 보존 작업은
+Postgres advisory lock(pg_try_advisory_lock)을 잡은 프로세스 하나(리더)만 실행한다.
+- 잠금은 풀과 별도의 autocommit 연결(세션)에 걸리므로, 리더 프로세스가 죽거나 연결이 끊기면 서버가 바로 풀어 주고
+  다른 프로세스가 SCHEDULER_ELECTION_SECONDS 안에 이어받는다.
+- 리더는 같은 연결로 주기적으로 확인(SELECT 1)하며, 연결이 끊기면 작업을 멈추고 다시 선출에 참여한다.
+- 잠금이 풀리는 것과 작업이 멈추는 것은 동시가 아니다. 연결 끊김은 다음 확인 때(최대 SCHEDULER_ELECTION_SECONDS 뒤)에야
+  알 수 있고, 작업은 진행 중인 단위(사용자 동기화는 청크, 메일은 배치, 보존 작업은 배치)를 마친 뒤 멈추므로
+  그동안 새 리더와 잠시 겹쳐 돌 수 있다. 그래서 각 작업은 겹쳐 돌아도 안전하게 만든다
+  (동기화 upsert는 멱등이고 체크포인트는 청크마다 커밋, 메일은 FOR UPDATE SKIP LOCKED, 보존 작업은 DELETE ... RETURNING).
+
+SCHEDULER_MODE:
+- embedded(기본): API 프로세스들이 리더 선출에 참여한다.
+- off: API 프로세스에서는 주기 작업을 돌리지 않는다. 작업은 `python -m app.worker`(app/worker.py)로 따로 띄운다.
+
+요청 처리 경로에 붙은 스레드(메일 디스패처, 데이터 추출 워커, 알림 LISTEN)는 프로세스마다 그대로 돈다.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable
+
+import psycopg
+
+from ..core.config import settings
+from ..core.pg_notify import listen_dsn
+from ..core.user_sync import start_user_sync_thread
+from .mail_retention import start_mail_retention_thread
+from .mail_service import start_mail_worker_thread, wake_mail_worker
+
+logger = logging.getLogger(__name__)
+
+# pg advisory lock 키 (같은 DB를 쓰는 다른 서비스와 겹치지 않는 임의의 bigint)
+SCHEDULER_LOCK_KEY = 7_331_020_501
+SCHEDULER_STOP_TIMEOUT_SECONDS = 30.0
+
+StartJob = Callable[[threading.Event], "threading.Thread | None"]
+WakeJob = Callable[[], None]
+
+# (이름, 시작 함수(stop 이벤트를 받음), 멈출 때 대기 중인 스레드를 깨우는 함수)
+LEADER_JOBS: tuple[tuple[str, StartJob, WakeJob | None], ...] = (
+    ("user-sync", start_user_sync_thread, None),
+    ("mail-worker", start_mail_worker_thread, wake_mail_worker),
+    ("mail-retention", start_mail_retention_thread, None),
+)
+
+
+class LeaderScheduler:
+    def __init__(
+        self,
+        jobs: tuple[tuple[str, StartJob, WakeJob | None], ...] = LEADER_JOBS,
+        lock_key: int = SCHEDULER_LOCK_KEY,
+        election_seconds: float | None = None,
+    ) -> None:
+        self.jobs = jobs
+        self.lock_key = lock_key
+        self.election_seconds = max(1.0, election_seconds or settings.scheduler_election_seconds)
+        self.stopping = threading.Event()
+        self._conn: psycopg.Connection | None = None
+        self._job_stop: threading.Event | None = None
+        self._threads: list[tuple[str, threading.Thread]] = []
+
+    @property
+    def is_leader(self) -> bool:
+        return self._job_stop is not None
+
+    def _close_conn(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except psycopg.Error:
+                pass
+
+    def _try_lead(self) -> bool:
+        if self._conn is None:
+            self._conn = psycopg.connect(listen_dsn(), autocommit=True, connect_timeout=10)
+        row = self._conn.execute("SELECT pg_try_advisory_lock(%s)", (self.lock_key,)).fetchone()
+        return bool(row and row[0])
+
+    def _heartbeat(self) -> None:
+        assert self._conn is not None
+        self._conn.execute("SELECT 1")
+
+    def _start_jobs(self) -> None:
+        self._job_stop = threading.Event()
+        for name, start, _ in self.jobs:
+            try:
+                t = start(self._job_stop)
+            except Exception:
+                logger.exception("주기 작업 시작 실패: %s", name)
+                continue
+            if t is not None:
+                self._threads.append((name, t))
+        logger.info("스케줄러 리더가 됨: %s", [name for name, _ in self._threads])
+
+    def _stop_jobs(self) -> None:
+        if self._job_stop is None:
+            return
+        self._job_stop.set()
+        for name, _, wake in self.jobs:
+            if wake is None:
+                continue
+            try:
+                wake()
+            except Exception:  # noqa: BLE001 - 깨우지 못하면 대기 시간이 지나 스스로 멈춘다
+                logger.warning("주기 작업을 깨우지 못함: %s", name, exc_info=True)
+        for name, t in self._threads:
+            t.join(SCHEDULER_STOP_TIMEOUT_SECONDS)
+            if t.is_alive():
+                logger.warning("주기 작업이 제때 멈추지 않음: %s", name)
+        self._threads = []
+        self._job_stop = None
+
+    def _tick(self) -> None:
+        try:
+            if self.is_leader:
+                self._heartbeat()
+            elif self._try_lead():
+                self._start_jobs()
+        except psycopg.Error:
+            if self.is_leader:
+                # 서버 쪽 잠금은 이미 풀렸을 수 있어 새 리더가 먼저 시작했을 수도 있다 (모듈 docstring 참고).
+                # 진행 중인 단위만 마치고 멈추도록 stop을 set하고 기다린다
+                logger.exception("스케줄러 잠금 연결이 끊겨 리더를 내려놓음")
+                self._stop_jobs()
+            else:
+                logger.warning("스케줄러 리더 선출 실패 (%s초 후 재시도)", self.election_seconds, exc_info=True)
+            self._close_conn()
+
+    def run(self) -> None:
+        """stop()이 호출될 때까지 선출·확인을 반복한다 (블로킹)."""
+        try:
+            while not self.stopping.is_set():
+                self._tick()
+                self.stopping.wait(self.election_seconds)
+        finally:
+            self._stop_jobs()
+            # 연결을 닫으면 잠금이 풀려 대기 중인 다른 프로세스가 바로 이어받는다
+            self._close_conn()
+            logger.info("스케줄러 종료")
+
+    def stop(self) -> None:
+        self.stopping.set()
+
+
+_scheduler: LeaderScheduler | None = None
+_scheduler_thread: threading.Thread | None = None
+_lock = threading.Lock()
+
+
+def start_scheduler() -> None:
+    """API 프로세스 startup에서 호출. SCHEDULER_MODE=off이면 아무것도 하지 않는다."""
+    global _scheduler, _scheduler_thread
+    if settings.scheduler_mode == "off":
+        logger.info("SCHEDULER_MODE=off: 이 프로세스에서는 주기 작업을 실행하지 않습니다 (python -m app.worker 사용)")
+        return
+    with _lock:
+        if _scheduler_thread is not None:
+            return
+        _scheduler = LeaderScheduler()
+        _scheduler_thread = threading.Thread(target=_scheduler.run, name="scheduler", daemon=True)
+        _scheduler_thread.start()
+
+
+def stop_scheduler(timeout: float = SCHEDULER_STOP_TIMEOUT_SECONDS + 5) -> None:
+    """종료 시 작업을 멈추고 잠금을 풀어 다른 프로세스가 바로 이어받게 한다."""
+    global _scheduler, _scheduler_thread
+    with _lock:
+        scheduler, thread = _scheduler, _scheduler_thread
+        _scheduler = _scheduler_thread = None
+    if scheduler is None or thread is None:
+        return
+    scheduler.stop()
+    thread.join(timeout)
+
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import argparse
+import logging
+
+from sqlalchemy import Date, cast, delete, func, insert, literal_column, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from ..models.ticket import Ticket
+from ..models.ticket_daily_stat import TicketDailyStat
+
+logger = logging.getLogger(__name__)
+
+STAT_KEY_COLUMNS = ("day", "status", "work_type", "category_id", "department", "requester_title")
+
+
+def _snapshot_key(col):
+    return func.coalesce(func.nullif(func.trim(col), literal_column("''")), literal_column("''"))
+
+
+def _stat_key_select():
+    """티켓 컬럼만으로 만든 롤업 키. 부서/직급은 요청 시점 스냅샷을 쓰므로 사용자 동기화로 바뀌지 않는다
+    (스냅샷이 없던 예전 티켓은 r5b6c7d8e9f0 마이그레이션에서 채움)."""
+    # SELECT/GROUP BY 식이 동일해야 하므로 바인드 파라미터 대신 리터럴 사용
+    return select(
+        cast(func.timezone(literal_column("'Asia/Seoul'"), Ticket.created_at), Date).label("day"),
+        Ticket.status.label("status"),
+        func.coalesce(Ticket.work_type, literal_column("''")).label("work_type"),
+        func.coalesce(Ticket.category_id, literal_column("0")).label("category_id"),
+        _snapshot_key(Ticket.requester_department).label("department"),
+        _snapshot_key(Ticket.requester_title).label("requester_title"),
+    )
+
+
+def ticket_stat_key(session: Session, ticket_id: int) -> dict | None:
+    """티켓의 현재(DB 기준) 롤업 키. 변경 전 키를 얻으려면 속성을 바꾸기 전에 호출한다."""
+    row = session.execute(_stat_key_select().where(Ticket.id == ticket_id)).mappings().first()
+    return dict(row) if row else None
+
+
+def apply_ticket_stat_delta(session: Session, key: dict, delta: int) -> None:
+    """delta > 0이면 upsert. delta < 0이면 기존 행에서만 빼고 음수 행은 만들지 않는다.
+    키는 티켓 컬럼만으로 정해지므로 감소 대상 행이 없으면 롤업이 이미 어긋난 것이다(경고 후 rebuild로 복구)."""
+    if delta < 0:
+        result = session.execute(
+            update(TicketDailyStat)
+            .where(*[getattr(TicketDailyStat, name) == key[name] for name in STAT_KEY_COLUMNS])
+            .where(TicketDailyStat.ticket_count >= -delta)
+            .values(ticket_count=TicketDailyStat.ticket_count + delta)
+        )
+        if not result.rowcount:
+            logger.warning("ticket_daily_stats 감소 대상 행 없음, 건너뜀 (rebuild 필요): %s", key)
+        return
+    stmt = pg_insert(TicketDailyStat).values(**key, ticket_count=delta)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(STAT_KEY_COLUMNS),
+        set_={"ticket_count": TicketDailyStat.ticket_count + stmt.excluded.ticket_count},
+    )
+    session.execute(stmt)
+
+
+def record_ticket_created(session: Session, ticket_id: int) -> None:
+    """flush된 신규 티켓을 롤업에 반영한다. 티켓 INSERT와 같은 트랜잭션에서 호출."""
+    key = ticket_stat_key(session, ticket_id)
+    if key:
+        apply_ticket_stat_delta(session, key, 1)
+
+
+def record_ticket_changed(session: Session, ticket_id: int, before: dict | None) -> None:
+    """상태/작업구분/카테고리 변경 후(flush 이후) 호출. 키가 바뀐 경우에만 -1/+1 한다."""
+    session.flush()
+    after = ticket_stat_key(session, ticket_id)
+    if before == after:
+        return
+    if before:
+        apply_ticket_stat_delta(session, before, -1)
+    if after:
+        apply_ticket_stat_delta(session, after, 1)
+
+
+def record_ticket_deleted(session: Session, before: dict | None) -> None:
+    if before:
+        apply_ticket_stat_delta(session, before, -1)
+
+
+def rebuild_ticket_daily_stats(session: Session) -> int:
+    """롤업 테이블을 tickets 기준으로 다시 계산한다 (백필/정합성 복구용). 생성된 행 수를 반환."""
+    keys = _stat_key_select().subquery()
+    grouped = select(*[keys.c[name] for name in STAT_KEY_COLUMNS], func.count().label("ticket_count")).group_by(
+        *[keys.c[name] for name in STAT_KEY_COLUMNS]
+    )
+    session.execute(delete(TicketDailyStat))
+    result = session.execute(
+        insert(TicketDailyStat).from_select([*STAT_KEY_COLUMNS, "ticket_count"], grouped)
+    )
+    session.commit()
+    return result.rowcount or 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ticket_daily_stats 롤업 관리")
+    parser.add_argument("command", choices=["rebuild"])
+    args = parser.parse_args()
+
+    import app.models.ticket_category  # noqa: F401
+    import app.models.project  # noqa: F401
+    from ..db import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    if args.command == "rebuild":
+        with SessionLocal() as session:
+            rows = rebuild_ticket_daily_stats(session)
+        logger.info("ticket_daily_stats rebuilt; rows=%d", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""주기 작업 전용 워커 프로세스.
+
+API 프로세스에서 사용자 동기화·메일 발송 워커·mail_logs 보존 작업을 빼고 따로 돌릴 때 쓴다.
+
+    SCHEDULER_MODE=off uvicorn app.main:app ...   # API 프로세스는 주기 작업을 돌리지 않음
+    python -m app.worker                          # 리더 선출 후 주기 작업 실행 (SIGTERM/SIGINT로 종료)
+
+여러 개 띄워도 advisory lock(services/scheduler.py)으로 한 프로세스만 작업하고,
+나머지는 대기하다가 리더가 죽으면 이어받는다.
+"""
+
+from __future__ import annotations
+
+import logging
+import signal
+
+# 모든 모델을 메타데이터에 등록
+import app.main  # noqa: F401
+from .core.user_sync import dispose_source_engine
+from .services.scheduler import LeaderScheduler
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    scheduler = LeaderScheduler()
+
+    def handle_signal(signum, _frame) -> None:
+        logger.info("종료 신호 수신 (%s), 주기 작업을 멈춥니다", signal.Signals(signum).name)
+        scheduler.stop()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+    logger.info("주기 작업 워커 시작 (리더 선출 주기 %ss)", scheduler.election_seconds)
+    try:
+        scheduler.run()
+    finally:
+        dispose_source_engine()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""메일 파이프라인 부하 측정 도구 (실제 SMTP 서버 없이).
+
+프로세스 안에 SMTP 싱크(받기만 하는 최소 SMTP 서버)를 띄우고, 지정한 Postgres DB에 임시 스키마를 만들어
+mail_logs를 새로 생성한 뒤 MailPayload 수만 건을 enqueue_mails로 넣고 실제 메일 워커(start_mail_worker_thread)로
+모두 보낼 때까지의 처리량과 지연을 출력한다. 워커·연결 풀·배치 크기 변경 전후 비교용.
+
+    cd apps/api
+    python -m tests.perf.mail_loadtest --database-url postgresql+psycopg://... \\
+        --messages 20000 --recipients 1000 --sender-pool 4 --smtp-delay-ms 5
+
+- backlog 모드(기본): 전부 넣은 뒤 워커를 시작해 쌓인 큐를 비우는 시간을 잰다.
+- live 모드: 워커를 먼저 시작하고 넣는 동안 함께 발송한다(등록 → 발송 지연 측정).
+임시 스키마(mail_loadtest_<pid>)는 끝나면 삭제한다(--keep-schema로 남길 수 있음). 운영 DB에는 쓰지 말 것.
+--timeout 안에 모두 보내지 못하면 종료 코드 1로 끝난다(tests/perf/test_loadtests.py가 작은 규모로 실행).
+
+설정(SMTP_*, MAIL_SENDER_POOL_SIZE 등)은 app 모듈을 읽을 때 정해지므로, app 모듈은 환경변수를 맞춘 뒤에 import한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import socketserver
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class _SinkHandler(socketserver.StreamRequestHandler):
+    """EHLO/MAIL/RCPT/DATA/RSET/NOOP/QUIT만 받아 250으로 응답하는 SMTP 싱크."""
+
+    def handle(self) -> None:
+        server: SmtpSink = self.server  # type: ignore[assignment]
+        self.wfile.write(b"220 mail-loadtest sink\r\n")
+        in_data = False
+        for line in self.rfile:
+            if in_data:
+                if line == b".\r\n":
+                    in_data = False
+                    if server.delay:
+                        time.sleep(server.delay)
+                    server.received()
+                    self.wfile.write(b"250 2.0.0 queued\r\n")
+                continue
+            command = line[:4].upper()
+            if command == b"DATA":
+                in_data = True
+                self.wfile.write(b"354 end data with <CR><LF>.<CR><LF>\r\n")
+            elif command == b"QUIT":
+                self.wfile.write(b"221 2.0.0 bye\r\n")
+                return
+            elif command in (b"EHLO", b"HELO"):
+                self.wfile.write(b"250 mail-loadtest\r\n")
+            else:
+                self.wfile.write(b"250 2.0.0 ok\r\n")
+
+
+class SmtpSink(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, delay: float = 0.0) -> None:
+        super().__init__((host, port), _SinkHandler)
+        self.delay = delay
+        self.count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def received(self) -> None:
+        with self._lock:
+            self.count += 1
+
+    def start(self) -> "SmtpSink":
+        threading.Thread(target=self.serve_forever, name="smtp-sink", daemon=True).start()
+        return self
+
+
+def _with_search_path(database_url: str, schema: str) -> str:
+    from sqlalchemy.engine import make_url
+
+    url = make_url(database_url)
+    options = " ".join(filter(None, [url.query.get("options"), f"-csearch_path={schema}"]))
+    return url.update_query_dict({"options": options}).render_as_string(hide_password=False)
+
+
+def _percentiles(values: list[float]) -> dict[str, float | None]:
+    if not values:
+        return {"p50": None, "p95": None, "p99": None, "max": None}
+    values = sorted(values)
+
+    def pick(q: float) -> float:
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+    return {"p50": pick(0.5), "p95": pick(0.95), "p99": pick(0.99), "max": values[-1]}
+
+
+def _fmt(stats: dict[str, float | None]) -> str:
+    return " ".join(f"{k}={'-' if v is None else f'{v:.3f}s'}" for k, v in stats.items())
+
+
+def run(args: argparse.Namespace) -> bool:
+    sink = SmtpSink(delay=args.smtp_delay_ms / 1000).start()
+    schema = args.schema or f"mail_loadtest_{os.getpid()}"
+    os.environ.update(
+        DATABASE_URL=_with_search_path(args.database_url, schema),
+        SMTP_HOST="127.0.0.1",
+        SMTP_PORT=str(sink.port),
+        SMTP_FROM="loadtest@example.com",
+        MAIL_SENDER_POOL_SIZE=str(args.sender_pool),
+        MAIL_MAX_CONNECTIONS_PER_HOST=str(args.max_connections or args.sender_pool),
+    )
+
+    from sqlalchemy import create_engine, func, select, text
+
+    admin_engine = create_engine(args.database_url, isolation_level="AUTOCOMMIT")
+    with admin_engine.connect() as conn:
+        conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{schema}"'))
+
+    # 모든 모델을 메타데이터에 등록
+    import app.main  # noqa: F401
+    from app.db import SessionLocal, engine
+    from app.models.mail_log import MailLog
+    from app.models.user import Base
+    from app.services.mail_service import (
+        MAIL_MAX_ATTEMPTS,
+        RETRYABLE_STATUSES,
+        MailPayload,
+        enqueue_mails,
+        start_mail_worker_thread,
+    )
+    from app.services.mail_templates import render_mail_body
+
+    # 건별 INFO 로그는 측정을 왜곡하므로 끈다
+    logging.getLogger("app.services.mail_service").setLevel(logging.WARNING)
+
+    try:
+        Base.metadata.create_all(engine)
+        body = render_mail_body(
+            alert_type="부하 측정",
+            summary="메일 파이프라인 부하 측정용 메일입니다.",
+            fields=[("요청 제목", "부하 측정"), ("카테고리", "-"), ("작업 구분", "-"), ("요청자", "-")],
+            status_label="접수",
+            link_url="http://localhost:3000/tickets/0",
+        )
+        run_id = time.time_ns()
+
+        def payload(n: int) -> MailPayload:
+            return MailPayload(
+                event_key=f"loadtest:{run_id}:{n}",
+                # 같은 수신자·이벤트 종류·티켓의 60초 쿨다운에 걸리지 않도록 건마다 다르게 둔다
+                event_type=f"loadtest_{n}",
+                ticket_id=None,
+                recipient_emp_no=None,
+                recipient_email=f"user{n % args.recipients}@example.com",
+                subject=f"[IT DESK] 부하 측정 {n}",
+                body_text=body.text,
+                body_html=body.html,
+            )
+
+        if args.mode == "live":
+            start_mail_worker_thread()
+        started = time.perf_counter()
+        for offset in range(0, args.messages, args.enqueue_batch):
+            enqueue_mails([payload(n) for n in range(offset, min(offset + args.enqueue_batch, args.messages))])
+        enqueue_seconds = time.perf_counter() - started
+        if args.mode == "backlog":
+            drain_started = time.perf_counter()
+            start_mail_worker_thread()
+        else:
+            drain_started = started
+
+        undelivered = (
+            select(func.count())
+            .select_from(MailLog)
+            .where(MailLog.status.in_(RETRYABLE_STATUSES), MailLog.attempts < MAIL_MAX_ATTEMPTS)
+        )
+        deadline = time.monotonic() + args.timeout
+        last_report = 0.0
+        remaining = args.messages
+        while remaining and time.monotonic() < deadline:
+            time.sleep(0.2)
+            with SessionLocal() as session:
+                remaining = session.scalar(undelivered) or 0
+            if time.monotonic() - last_report >= 5:
+                last_report = time.monotonic()
+                print(f"  ... sent {sink.count}, remaining {remaining}", flush=True)
+        drain_seconds = time.perf_counter() - drain_started
+
+        with SessionLocal() as session:
+            by_status = dict(session.execute(select(MailLog.status, func.count()).group_by(MailLog.status)).all())
+            latency = func.extract("epoch", MailLog.last_attempt_at - MailLog.created_at)
+            latencies = [float(v) for v in session.scalars(select(latency).where(MailLog.status == "sent"))]
+
+        print(f"mode={args.mode} messages={args.messages} recipients={args.recipients} "
+              f"enqueue_batch={args.enqueue_batch} sender_pool={args.sender_pool} smtp_delay={args.smtp_delay_ms}ms")
+        print(f"  enqueue: {enqueue_seconds:.2f}s ({args.messages / enqueue_seconds:.0f} msg/s)")
+        print(f"  send:    {sink.count} received by sink in {drain_seconds:.2f}s "
+              f"({sink.count / drain_seconds:.0f} msg/s end-to-end)")
+        print(f"  status:  {by_status}")
+        print(f"  latency (created_at -> sent): {_fmt(_percentiles(latencies))}")
+        if remaining:
+            print(f"  TIMEOUT after {args.timeout}s: {remaining} undelivered")
+        return not remaining
+    finally:
+        sink.shutdown()
+        engine.dispose()
+        if args.keep_schema:
+            print(f"  schema kept: {schema}")
+        else:
+            with admin_engine.connect() as conn:
+                conn.execute(text("SET lock_timeout = '10s'"))
+                conn.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        admin_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="메일 파이프라인 부하 측정 (SMTP 싱크 + 임시 스키마)")
+    parser.add_argument("--database-url", default=os.getenv("MAIL_LOADTEST_DATABASE_URL") or os.getenv("DATABASE_URL"))
+    parser.add_argument("--schema", default=None, help="임시 스키마 이름 (기본 mail_loadtest_<pid>)")
+    parser.add_argument("--keep-schema", action="store_true")
+    parser.add_argument("--mode", choices=["backlog", "live"], default="backlog")
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--recipients", type=int, default=1000, help="서로 다른 수신자 수 (수신자별 순서 보장 때문에 처리량에 영향)")
+    parser.add_argument("--enqueue-batch", type=int, default=20, help="enqueue_mails 한 번에 넣는 건수 (이벤트당 수신자 수)")
+    parser.add_argument("--sender-pool", type=int, default=4, help="MAIL_SENDER_POOL_SIZE")
+    parser.add_argument("--max-connections", type=int, default=None, help="MAIL_MAX_CONNECTIONS_PER_HOST (기본: sender-pool)")
+    parser.add_argument("--smtp-delay-ms", type=float, default=0.0, help="싱크가 메일 한 건을 받을 때마다 지연")
+    parser.add_argument("--timeout", type=float, default=600.0)
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("--database-url 또는 MAIL_LOADTEST_DATABASE_URL/DATABASE_URL이 필요합니다")
+
+    logging.basicConfig(level=logging.WARNING)
+    sys.exit(0 if run(args) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""부하 측정 도구 스모크 테스트.
+
+각 도구를 작은 규모로 별도 프로세스에서 실행해 끝까지 돌고 자체 검증을 통과하는지(종료 코드 0) 확인한다.
+도구는 app 설정을 환경변수로 정하므로 pytest 프로세스가 이미 읽은 app 모듈과 섞이지 않게 subprocess로 띄운다.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "")
+
+API_DIR = Path(__file__).resolve().parents[2]
+
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL이 없어 DB 테스트를 건너뜁니다")
+
+
+def _run(module: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", module, "--database-url", TEST_DATABASE_URL, *args],
+        cwd=API_DIR,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+
+
+def test_mail_loadtest_delivers_every_message():
+    result = _run("tests.perf.mail_loadtest", "--messages", "300", "--recipients", "50", "--timeout", "120")
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "received by sink" in result.stdout
+
+
+def test_user_sync_loadtest_checks_pass():
+    result = _run("tests.perf.user_sync_loadtest", "--rows", "3000", "--chunk-size", "500", "--changed", "100")
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "FAIL" not in result.stdout
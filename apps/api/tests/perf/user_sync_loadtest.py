@@ -0,0 +1,184 @@
+"""사용자 동기화 부하·메모리 측정 도구 (실제 MIS DB 없이).
+
+지정한 Postgres DB에 임시 스키마 두 개를 만든다.
+- user_sync_loadtest_<pid>_hr: MIS 원본과 같은 모양의 합성 인사 스키마
+  (gp_master, ca_user_m, ca_code_c, gp_dept, v_gp_mail_user) N명
+- user_sync_loadtest_<pid>: 앱 테이블(users, sync_state 등)
+그 뒤 실제 sync_profile_once / sync_password_once를 돌려 처리량과 프로세스 최대 RSS 증가량을 출력하고,
+결과(사용자 수·변경 감지 건수·체크포인트)를 검증해 어긋나면 종료 코드 1로 끝난다.
+
+    cd apps/api
+    python -m tests.perf.user_sync_loadtest --database-url postgresql+psycopg://... --rows 100000
+
+원본 조회는 서버 측 커서로 청크씩 읽으므로 RSS 증가량은 --rows와 관계없이 거의 일정해야 한다
+(--rows를 바꿔 가며 비교). 임시 스키마는 끝나면 삭제한다(--keep-schema로 남길 수 있음). 운영 DB에는 쓰지 말 것.
+
+설정(SYNC_*)은 app 모듈을 읽을 때 정해지므로, app 모듈은 환경변수를 맞춘 뒤에 import한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import resource
+import sys
+import time
+
+from tests.perf.mail_loadtest import _with_search_path
+
+logger = logging.getLogger(__name__)
+
+EMP_NO_PREFIX = "3"
+
+_HR_SCHEMA_SQL = [
+    "CREATE TABLE {s}.gp_master (emp_no varchar PRIMARY KEY, kor_name varchar, eng_name varchar, grade_cd varchar,"
+    " dept_cd varchar, work_tp varchar, emp_tp varchar, update_dtime timestamp)",
+    "CREATE TABLE {s}.ca_user_m (user_id varchar PRIMARY KEY, password varchar, update_dtime timestamp)",
+    "CREATE TABLE {s}.ca_code_c (gb_cd varchar, code varchar, name varchar, update_dtime timestamp)",
+    "CREATE TABLE {s}.gp_dept (dept_cd varchar PRIMARY KEY, dept_kname varchar, update_dtime timestamp)",
+    "CREATE TABLE {s}.v_gp_mail_user (emp_no varchar, email varchar)",
+    "INSERT INTO {s}.ca_code_c SELECT 'GE11', g::text, '직급' || g, TIMESTAMP '2025-01-01'"
+    " FROM generate_series(1, 10) g",
+    "INSERT INTO {s}.gp_dept SELECT d::text, '부서' || d, TIMESTAMP '2025-01-01' FROM generate_series(1, 200) d",
+    # 같은 update_dtime을 가진 행이 많도록(청크 경계 체크포인트 확인) 분 단위로 겹치게 둔다
+    "INSERT INTO {s}.gp_master SELECT '3' || lpad(n::text, 7, '0'), '직원' || n, 'Employee ' || n,"
+    " (1 + n % 10)::text, (1 + n % 200)::text, '1', '1',"
+    " TIMESTAMP '2025-06-01' + (n % 5000) * INTERVAL '1 minute' FROM generate_series(1, :rows) n",
+    "INSERT INTO {s}.ca_user_m SELECT '3' || lpad(n::text, 7, '0'), md5(n::text),"
+    " TIMESTAMP '2025-06-01' + (n % 7000) * INTERVAL '1 minute' FROM generate_series(1, :rows) n",
+    "INSERT INTO {s}.v_gp_mail_user SELECT '3' || lpad(n::text, 7, '0'), 'emp' || n || '@example.com'"
+    " FROM generate_series(1, :rows) n",
+    "ANALYZE {s}.gp_master",
+    "ANALYZE {s}.ca_user_m",
+    "ANALYZE {s}.v_gp_mail_user",
+]
+
+
+def _max_rss_mb() -> float:
+    # Linux의 ru_maxrss 단위는 KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run(args: argparse.Namespace) -> bool:
+    schema = args.schema or f"user_sync_loadtest_{os.getpid()}"
+    hr_schema = f"{schema}_hr"
+    os.environ.update(
+        DATABASE_URL=_with_search_path(args.database_url, schema),
+        SYNC_ENABLED="true",
+        SYNC_SOURCE_DATABASE_URL=args.source_url or args.database_url,
+        SYNC_SOURCE_SCHEMA=hr_schema,
+        SYNC_EMP_NO_PREFIX=EMP_NO_PREFIX,
+        SYNC_CHUNK_SIZE=str(args.chunk_size),
+        SYNC_FORCE_FULL="false",
+    )
+
+    from sqlalchemy import create_engine, text
+
+    admin_engine = create_engine(args.source_url or args.database_url, isolation_level="AUTOCOMMIT")
+    app_admin_engine = create_engine(args.database_url, isolation_level="AUTOCOMMIT")
+    with app_admin_engine.connect() as conn:
+        conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{schema}"'))
+
+    # 모든 모델을 메타데이터에 등록
+    import app.main  # noqa: F401
+    from app.core import user_sync
+    from app.db import SessionLocal, engine
+    from app.models.user import Base
+
+    ok = True
+
+    def check(label: str, condition: bool) -> None:
+        nonlocal ok
+        ok = ok and condition
+        print(f"  [{'ok' if condition else 'FAIL'}] {label}")
+
+    try:
+        started = time.perf_counter()
+        with admin_engine.connect() as conn:
+            conn.execute(text(f'CREATE SCHEMA "{hr_schema}"'))
+            for sql in _HR_SCHEMA_SQL:
+                conn.execute(text(sql.format(s=f'"{hr_schema}"')), {"rows": args.rows})
+        Base.metadata.create_all(engine)
+        print(f"rows={args.rows} chunk_size={args.chunk_size} (setup {time.perf_counter() - started:.1f}s)")
+
+        def measure(label: str, fn):
+            rss_before = _max_rss_mb()
+            t = time.perf_counter()
+            result = fn()
+            elapsed = time.perf_counter() - t
+            print(
+                f"  {label:<16} {elapsed:6.2f}s {result.rows / elapsed if elapsed else 0:8.0f} rows/s  "
+                f"inserted={result.inserted} updated={result.updated} unchanged={result.unchanged}  "
+                f"max RSS +{_max_rss_mb() - rss_before:.1f} MB"
+            )
+            return result
+
+        first = measure("profile (new)", user_sync.sync_profile_once)
+        with engine.begin() as conn:
+            conn.execute(text("DELETE FROM sync_state"))
+            conn.execute(
+                text(
+                    f'UPDATE "{hr_schema}".gp_master SET kor_name = kor_name || \'*\''
+                    f" WHERE emp_no IN (SELECT emp_no FROM \"{hr_schema}\".gp_master ORDER BY emp_no LIMIT :n)"
+                ),
+                {"n": args.changed},
+            )
+        second = measure("profile (full)", user_sync.sync_profile_once)
+        password = measure("password", user_sync.sync_password_once)
+        print(f"  source pool: {user_sync.source_pool_stats()}")
+
+        with SessionLocal() as session:
+            users = session.scalar(text("SELECT count(*) FROM users WHERE sync_hash IS NOT NULL"))
+            # 원본 timestamp와 sync_state의 timestamptz는 같은 세션 시간대로 DB에서 비교한다
+            checkpoint_ok = session.scalar(
+                text(
+                    f'SELECT s.last_synced_at >= max(GREATEST(gm.update_dtime, cu.update_dtime))::timestamptz'
+                    f' FROM "{hr_schema}".gp_master gm JOIN "{hr_schema}".ca_user_m cu ON cu.user_id = gm.emp_no'
+                    f" CROSS JOIN sync_state s WHERE s.key = :key GROUP BY s.last_synced_at"
+                ),
+                {"key": user_sync.SYNC_KEY_PROFILE},
+            )
+        check(f"all {args.rows} source rows synced", first.rows == args.rows and first.inserted == args.rows)
+        check(f"users with sync_hash = {args.rows}", users == args.rows)
+        check(
+            f"full re-sync rewrote only the {args.changed} changed rows",
+            second.updated == args.changed and second.unchanged == args.rows - args.changed,
+        )
+        check("password sync found no changed passwords", password.updated == 0 and password.rows == args.rows)
+        check("profile checkpoint reached the newest source row", bool(checkpoint_ok))
+    finally:
+        user_sync.dispose_source_engine()
+        engine.dispose()
+        if args.keep_schema:
+            print(f"  schemas kept: {schema}, {hr_schema}")
+        else:
+            with admin_engine.connect() as conn:
+                conn.execute(text(f'DROP SCHEMA IF EXISTS "{hr_schema}" CASCADE'))
+            with app_admin_engine.connect() as conn:
+                conn.execute(text(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE'))
+        admin_engine.dispose()
+        app_admin_engine.dispose()
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="사용자 동기화 부하·메모리 측정 (합성 인사 스키마 + 임시 스키마)")
+    parser.add_argument("--database-url", default=os.getenv("USER_SYNC_LOADTEST_DATABASE_URL") or os.getenv("DATABASE_URL"))
+    parser.add_argument("--source-url", default=None, help="합성 인사 스키마를 만들 DB (기본: --database-url)")
+    parser.add_argument("--schema", default=None, help="임시 스키마 이름 (기본 user_sync_loadtest_<pid>)")
+    parser.add_argument("--keep-schema", action="store_true")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--chunk-size", type=int, default=1000, help="SYNC_CHUNK_SIZE")
+    parser.add_argument("--changed", type=int, default=500, help="두 번째 실행 전에 이름을 바꿀 인원 수")
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("--database-url 또는 USER_SYNC_LOADTEST_DATABASE_URL/DATABASE_URL이 필요합니다")
+    args.changed = min(args.changed, args.rows)
+
+    logging.basicConfig(level=logging.WARNING)
+    sys.exit(0 if run(args) else 1)
+
+
+if __name__ == "__main__":
+    main()
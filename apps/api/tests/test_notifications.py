@@ -0,0 +1,100 @@
+"""GET /notifications 쿼리 수 회귀 테스트.
+
+알림마다 티켓/담당자를 다시 조회하던 N+1이 돌아오지 않도록, 알림 수와 관계없이 같은 수의 쿼리로 끝나는지 확인한다.
+"""
+
+from __future__ import annotations
+
+from app.core.user_cache import invalidate_users
+from app.models.notification import Notification
+from app.models.ticket import Ticket
+from app.models.user import User
+
+# 현재 사용자 조회 + 읽음 위치 + 알림 목록
+MAX_LIST_QUERIES = 3
+
+
+def _seed(session, notifications: int) -> None:
+    session.add_all(
+        [
+            User(emp_no="a1", kor_name="관리자", role="admin", is_verified=True, password="x"),
+            User(emp_no="u1", kor_name="요청자", role="requester", is_verified=True, password="x"),
+        ]
+    )
+    session.flush()
+    tickets = [Ticket(title=f"요청 {n}", description="-", requester_emp_no="u1") for n in range(notifications)]
+    session.add_all(tickets)
+    session.flush()
+    session.add_all(
+        [
+            Notification(
+                recipient_emp_no="a1",
+                source_key=f"ticket:{t.id}",
+                type="new_ticket",
+                ticket_id=t.id,
+                ticket_title=t.title,
+                message="새 요청이 접수되었습니다.",
+            )
+            for t in tickets
+        ]
+    )
+    session.commit()
+
+
+def _list_query_count(client, auth_headers, count_queries, **params) -> tuple[int, list]:
+    # 인증 사용자 캐시 적중 여부로 쿼리 수가 달라지지 않도록 비우고 잰다
+    invalidate_users()
+    with count_queries() as statements:
+        response = client.get("/notifications", params=params, headers=auth_headers("a1"))
+    assert response.status_code == 200, response.text
+    return len(statements), response.json()
+
+
+def test_list_notifications_query_count_is_constant(session, client, auth_headers, count_queries):
+    _seed(session, 3)
+    few, items = _list_query_count(client, auth_headers, count_queries)
+    assert len(items) == 3
+
+    _seed_more = [
+        Notification(recipient_emp_no="a1", source_key=f"extra:{n}", type="new_ticket", message="-")
+        for n in range(27)
+    ]
+    session.add_all(_seed_more)
+    session.commit()
+    many, items = _list_query_count(client, auth_headers, count_queries)
+    assert len(items) == 30
+
+    assert few == many
+    assert many <= MAX_LIST_QUERIES
+
+
+def test_list_notifications_since_query_count(session, client, auth_headers, count_queries):
+    _seed(session, 20)
+    count, items = _list_query_count(client, auth_headers, count_queries, since=10)
+    assert [item["seq"] for item in items] == list(range(20, 10, -1))
+    assert count <= MAX_LIST_QUERIES
+
+
+def test_stream_rejects_access_token_in_query(session, client, auth_headers):
+    _seed(session, 1)
+    access_token = auth_headers("a1")["Authorization"].removeprefix("Bearer ")
+    response = client.get("/notifications/stream", params={"token": access_token})
+    assert response.status_code == 401
+
+
+def test_stream_token_is_not_an_access_token(session, client, auth_headers):
+    _seed(session, 1)
+    issued = client.post("/notifications/stream-token", headers=auth_headers("a1"))
+    assert issued.status_code == 200, issued.text
+    stream_token = issued.json()["token"]
+    response = client.get("/notifications", headers={"Authorization": f"Bearer {stream_token}"})
+    assert response.status_code == 401
+
+
+def test_stream_accepts_stream_token(session, client, auth_headers):
+    # SSE 본문은 끝나지 않으므로 연결 인증(get_stream_user)만 직접 확인한다
+    from app.core.current_user import get_stream_user
+
+    _seed(session, 1)
+    stream_token = client.post("/notifications/stream-token", headers=auth_headers("a1")).json()["token"]
+    assert get_stream_user(token=stream_token, session=session).emp_no == "a1"
@@ -0,0 +1,61 @@
+"""ticket_daily_stats 증분 롤업 회귀 테스트.
+
+롤업 키는 티켓의 요청자 스냅샷으로 고정되므로, 사용자 동기화로 부서·직급이 바뀐 뒤 상태를 바꿔도
+증분 결과가 tickets에서 다시 계산한 결과(rebuild)와 같아야 한다.
+"""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import select, update
+
+from app.models.ticket import Ticket
+from app.models.ticket_daily_stat import TicketDailyStat
+from app.models.user import User
+from app.services.ticket_stats import (
+    STAT_KEY_COLUMNS,
+    record_ticket_changed,
+    record_ticket_created,
+    rebuild_ticket_daily_stats,
+    ticket_stat_key,
+)
+
+
+def _rollup(session) -> set[tuple]:
+    rows = session.execute(
+        select(*[getattr(TicketDailyStat, name) for name in STAT_KEY_COLUMNS], TicketDailyStat.ticket_count).where(
+            TicketDailyStat.ticket_count != 0
+        )
+    ).all()
+    return {tuple(row) for row in rows}
+
+
+# 스냅샷이 없는 티켓(마이그레이션 전 데이터)도 현재 사용자 정보를 따라가지 않고 빈 키로 고정된다
+@pytest.mark.parametrize(
+    ("snapshot", "expected_department"),
+    [
+        ({"requester_kor_name": "요청자", "requester_title": "선임", "requester_department": "전산팀"}, "전산팀"),
+        ({}, ""),
+    ],
+)
+def test_status_change_after_department_change_keeps_rollup_consistent(session, snapshot, expected_department):
+    session.add(User(emp_no="u1", kor_name="요청자", title="선임", department="전산팀", role="requester", password="x"))
+    session.flush()
+    ticket = Ticket(title="프린터 오류", description="-", requester_emp_no="u1", **snapshot)
+    session.add(ticket)
+    session.flush()
+    record_ticket_created(session, ticket.id)
+    session.commit()
+
+    # 사용자 동기화가 부서·직급을 바꾼 뒤 상태 변경
+    session.execute(update(User).where(User.emp_no == "u1").values(department="기획팀", title="책임"))
+    before = ticket_stat_key(session, ticket.id)
+    ticket.status = "in_progress"
+    record_ticket_changed(session, ticket.id, before)
+    session.commit()
+
+    incremental = _rollup(session)
+    assert all(count > 0 for *_, count in incremental)
+    rebuild_ticket_daily_stats(session)
+    assert incremental == _rollup(session)
+    assert {(row[1], row[4], row[6]) for row in incremental} == {("in_progress", expected_department, 1)}
@@ -4,16 +4,15 @@ import { useMemo, useState, useEffect, useCallback } from "react";
 import Link from "next/link";
 import { useQuery } from "@tanstack/react-query";
 import { api } from "@/lib/api";
+import { getToken } from "@/lib/auth";
 import { useTicketCategories } from "@/lib/use-ticket-categories";
 import PageHeader from "@/components/PageHeader";
 import { Card } from "@/components/ui";
 import { Download, BarChart3, ArrowLeft, FileSpreadsheet } from "lucide-react";
-import * as XLSX from "xlsx";
 import {
   COLUMN_DEFS,
   getValue,
   dayOfYear,
-  escapeCsvCell,
   loadPresetsFromStorage,
   savePresetsToStorage,
   STATUS_LABELS,
@@ -28,6 +27,13 @@ import { ColumnConfig } from "./ColumnConfig";
 
 const defaultColumnOrder = COLUMN_DEFS.map((c) => c.key);
 
+type ExportJob = {
+  id: number;
+  status: "queued" | "running" | "done" | "failed";
+  progress: number | null;
+  error_message?: string | null;
+};
+
 function applyFilters(
   tickets: Ticket[],
   opts: {
@@ -86,7 +92,7 @@ export default function AdminDataPage() {
 
   const { data: tickets = [], isLoading, error } = useQuery({
     queryKey: ["tickets", "all", 1000],
-    queryFn: () => api<Ticket[]>("/tickets?scope=all&limit=1000"),
+    queryFn: () => api<Ticket[]>("/tickets?scope=all&limit=1000&fields=summary"),
   });
 
   const distinctValues = useMemo(() => {
@@ -187,33 +193,65 @@ export default function AdminDataPage() {
     ]
   );
 
-  const handleExportCsv = () => {
-    const cols = visibleColDefs;
-    const headers = cols.map((c) => c.label);
-    const rows = filteredTickets.map((t) =>
-      cols.map((c) => escapeCsvCell(getValue(t, c.key, { categoryMap }))).join(",")
-    );
-    const csv = "\uFEFF" + [headers.join(","), ...rows].join("\n");
-    const blob = new Blob([csv], { type: "text/csv;charset=utf-8" });
-    const url = URL.createObjectURL(blob);
-    const a = document.createElement("a");
-    a.href = url;
-    a.download = `it-desk-tickets-${new Date().toISOString().slice(0, 10)}.csv`;
-    a.click();
-    URL.revokeObjectURL(url);
-  };
+  const [exporting, setExporting] = useState<"csv" | "xlsx" | null>(null);
+  const [exportProgress, setExportProgress] = useState<number | null>(null);
+
+  /**
+   * 서버 추출 작업을 등록하고 완료될 때까지 진행률을 조회한 뒤 내려받는다.
+   * 파일은 워커가 전체 티켓을 대상으로 동일한 컬럼/필터 조건으로 생성한다.
+   */
+  const handleExport = async (format: "csv" | "xlsx") => {
+    setExporting(format);
+    setExportProgress(null);
+    try {
+      let job = await api<ExportJob>("/admin/exports", {
+        method: "POST",
+        body: {
+          format,
+          columns: visibleColDefs.map((c) => c.key),
+          created_year_include: createdYearInclude,
+          created_day_range_percent: createdDayRangePercent,
+          filter_rules: filterRules.map(({ field, mode, values }) => ({ field, mode, values })),
+        },
+      });
+      while (job.status === "queued" || job.status === "running") {
+        await new Promise((resolve) => setTimeout(resolve, 1000));
+        job = await api<ExportJob>(`/admin/exports/${job.id}`);
+        setExportProgress(job.progress);
+      }
+      if (job.status !== "done") throw new Error(job.error_message ?? "Export failed");
 
-  const handleExportXlsx = () => {
-    const cols = visibleColDefs;
-    const headers = cols.map((c) => c.label);
-    const rows = filteredTickets.map((t) =>
-      cols.map((c) => getValue(t, c.key, { categoryMap }))
-    );
-    const data = [headers, ...rows];
-    const ws = XLSX.utils.aoa_to_sheet(data);
-    const wb = XLSX.utils.book_new();
-    XLSX.utils.book_append_sheet(wb, ws, "티켓");
-    XLSX.writeFile(wb, `it-desk-tickets-${new Date().toISOString().slice(0, 10)}.xlsx`);
+      const { url, filename } = await api<{ url: string; filename?: string | null }>(
+        `/admin/exports/${job.id}/download-url`
+      );
+      const a = document.createElement("a");
+      if (/^https?:\/\//i.test(url)) {
+        // object storage: presigned URL로 브라우저가 직접 내려받음
+        a.href = url;
+      } else {
+        const apiBase = process.env.NEXT_PUBLIC_API_BASE_URL ?? "http://localhost:8000";
+        const token = getToken();
+        const res = await fetch(`${apiBase}${url}`, {
+          headers: token ? { Authorization: `Bearer ${token}` } : {},
+        });
+        if (!res.ok) {
+          const text = await res.text().catch(() => "");
+          throw new Error(`Download failed ${res.status}: ${text}`);
+        }
+        a.href = URL.createObjectURL(await res.blob());
+      }
+      a.download = filename ?? `it-desk-tickets-${new Date().toISOString().slice(0, 10)}.${format}`;
+      document.body.appendChild(a);
+      a.click();
+      a.remove();
+      if (a.href.startsWith("blob:")) URL.revokeObjectURL(a.href);
+    } catch (e) {
+      console.error(e);
+      alert("파일을 내려받지 못했습니다.");
+    } finally {
+      setExporting(null);
+      setExportProgress(null);
+    }
   };
 
   const primaryBtnStyle = {
@@ -304,18 +342,18 @@ export default function AdminDataPage() {
         <div className="flex flex-wrap items-center gap-2">
           <button
             type="button"
-            onClick={handleExportCsv}
-            disabled={visibleColDefs.length === 0 || filteredTickets.length === 0}
+            onClick={() => handleExport("csv")}
+            disabled={visibleColDefs.length === 0 || exporting !== null}
             className="inline-flex items-center gap-2 rounded-lg px-4 py-2 text-sm font-semibold text-white transition-colors disabled:opacity-50"
             style={primaryBtnStyle}
           >
             <Download className="h-4 w-4" />
-            CSV 다운로드
+            {exporting === "csv" ? `생성 중${exportProgress != null ? ` ${Math.round(exportProgress)}%` : "..."}` : "CSV 다운로드"}
           </button>
           <button
             type="button"
-            onClick={handleExportXlsx}
-            disabled={visibleColDefs.length === 0 || filteredTickets.length === 0}
+            onClick={() => handleExport("xlsx")}
+            disabled={visibleColDefs.length === 0 || exporting !== null}
             className="inline-flex items-center gap-2 rounded-lg border px-4 py-2 text-sm font-semibold transition-colors disabled:opacity-50"
             style={{
               ...secondaryBtnStyle,
@@ -324,7 +362,7 @@ export default function AdminDataPage() {
             }}
           >
             <FileSpreadsheet className="h-4 w-4" />
-            XLSX 다운로드
+            {exporting === "xlsx" ? `생성 중${exportProgress != null ? ` ${Math.round(exportProgress)}%` : "..."}` : "XLSX 다운로드"}
           </button>
         </div>
       </div>
@@ -39,16 +39,28 @@ import {
   CartesianGrid,
 } from "recharts";
 
-type Ticket = {
-  id: number;
-  status: string;
-  category_id?: number | null;
-  work_type?: string | null;
-  created_at?: string;
-  updated_at?: string;
-  requester?: { title?: string | null; department?: string | null } | null;
+type StatCount = { key: string | null; count: number };
+
+type TicketStats = {
+  total: number;
+  summary: {
+    total_tickets: number;
+    total_pending: number;
+    today_new: number;
+    yesterday_new: number;
+    today_done: number;
+    yesterday_done: number;
+  };
+  by_status: StatCount[];
+  by_work_type: StatCount[];
+  by_category: { category_id: number | null; count: number }[];
+  by_requester_title: StatCount[];
+  by_requester_department: StatCount[];
+  series: { bucket_start: string; count: number }[];
 };
 
+type DonutRange = "daily" | "monthly" | "all";
+
 // KPICard removed - using StatCard 2.0 from ui library
 
 function ChartCard({
@@ -294,10 +306,6 @@ function kstMidnightTs(date: Date) {
   return Date.UTC(kst.getUTCFullYear(), kst.getUTCMonth(), kst.getUTCDate()) - KST_OFFSET_MS;
 }
 
-function kstDayDiff(a: Date, b: Date) {
-  return Math.floor((kstMidnightTs(a) - kstMidnightTs(b)) / DAY_MS);
-}
-
 function kstMonthStartTs(date: Date) {
   const kst = new Date(date.getTime() + KST_OFFSET_MS);
   return Date.UTC(kst.getUTCFullYear(), kst.getUTCMonth(), 1) - KST_OFFSET_MS;
@@ -323,21 +331,61 @@ function formatWeekLabel(weekStartTs: number) {
   return `${formatKstMd(weekStartTs)}~${formatKstMd(endTs)}`;
 }
 
-function filterTicketsByDonutRange<T extends { created_at?: string | null }>(items: T[], range: "daily" | "monthly" | "all"): T[] {
-  if (range === "all" || !items.length) return items;
+function kstDateString(ts: number) {
+  // KST 기준 YYYY-MM-DD (ts는 KST 자정의 UTC timestamp)
+  return new Date(ts + KST_OFFSET_MS).toISOString().slice(0, 10);
+}
+
+function parseKstDate(value: string) {
+  return Date.parse(`${value}T00:00:00+09:00`);
+}
+
+/** 도넛 차트 기간(일별/월별/전체)을 /admin/stats 쿼리 파라미터로 변환 */
+function donutRangeParams(range: DonutRange) {
+  if (range === "all") return "";
   const now = new Date();
-  const todayStart = kstMidnightTs(now);
+  if (range === "daily") {
+    const today = kstDateString(kstMidnightTs(now));
+    return `date_from=${today}&date_to=${today}`;
+  }
+  const kst = new Date(now.getTime() + KST_OFFSET_MS);
   const monthStart = kstMonthStartTs(now);
-  const nextMonthStart = new Date(monthStart);
-  nextMonthStart.setUTCMonth(nextMonthStart.getUTCMonth() + 1);
-  const nextMonthStartTs = nextMonthStart.getTime();
-  return items.filter((t) => {
-    const ts = t.created_at ? new Date(t.created_at).getTime() : 0;
-    if (range === "daily") return ts >= todayStart;
-    return ts >= monthStart && ts < nextMonthStartTs;
+  const monthEnd = Date.UTC(kst.getUTCFullYear(), kst.getUTCMonth() + 1, 0) - KST_OFFSET_MS;
+  return `date_from=${kstDateString(monthStart)}&date_to=${kstDateString(monthEnd)}`;
+}
+
+/** 요청 추이 차트 기간(최근 30일 / 12주 / 12개월)을 /admin/stats 쿼리 파라미터로 변환 */
+function seriesRangeParams(range: "daily" | "weekly" | "monthly") {
+  const now = new Date();
+  const todayTs = kstMidnightTs(now);
+  const today = kstDateString(todayTs);
+  if (range === "monthly") {
+    const kst = new Date(now.getTime() + KST_OFFSET_MS);
+    const fromTs = Date.UTC(kst.getUTCFullYear(), kst.getUTCMonth() - 11, 1) - KST_OFFSET_MS;
+    return `bucket=month&date_from=${kstDateString(fromTs)}&date_to=${today}`;
+  }
+  if (range === "weekly") {
+    // "주별"은 달력 주(월~일) 기준. 이번 주는 월요일~오늘까지(week-to-date)만 누적됨.
+    const fromTs = kstWeekStartTs(now) - 11 * 7 * DAY_MS;
+    return `bucket=week&date_from=${kstDateString(fromTs)}&date_to=${today}`;
+  }
+  return `bucket=day&date_from=${kstDateString(todayTs - 29 * DAY_MS)}&date_to=${today}`;
+}
+
+function useTicketStats(params: string) {
+  return useQuery({
+    queryKey: ["admin-stats", params],
+    queryFn: () => api<TicketStats>(`/admin/stats${params ? `?${params}` : ""}`),
+    staleTime: 30_000,
+    refetchOnWindowFocus: true,
+    refetchInterval: 15_000,
   });
 }
 
+function countsToChartData(items: StatCount[] | undefined) {
+  return (items ?? []).map((c) => ({ label: (c.key ?? "").trim() || "미기재", value: c.count }));
+}
+
 function donutRangeButtons(
   range: "daily" | "monthly" | "all",
   setRange: (r: "daily" | "monthly" | "all") => void
@@ -397,13 +445,14 @@ export default function AdminDashboard() {
     return null;
   }
 
-  const { data, isLoading, error } = useQuery({
-    queryKey: ["admin-dashboard-tickets"],
-    queryFn: () => api<Ticket[]>("/tickets?scope=all&limit=1000&offset=0"),
-    staleTime: 30_000,
-    refetchOnWindowFocus: true,
-    refetchInterval: 15_000,
-  });
+  const seriesQuery = useTicketStats(seriesRangeParams(range));
+  const workTypeQuery = useTicketStats(donutRangeParams(donutRangeWorkType));
+  const statusQuery = useTicketStats(donutRangeParams(donutRangeStatus));
+  const titleQuery = useTicketStats(donutRangeParams(donutRangeTitle));
+  const deptQuery = useTicketStats(donutRangeParams(donutRangeDept));
+  const categoryQuery = useTicketStats(donutRangeParams(donutRangeCategory));
+  const isLoading = seriesQuery.isLoading;
+  const error = seriesQuery.error;
 
   useEffect(() => {
     if (!error) return;
@@ -411,52 +460,11 @@ export default function AdminDashboard() {
   }, [error]);
 
   const stats = useMemo(() => {
-    const now = new Date();
-    const todayStartTs = kstMidnightTs(now);
-    const yesterdayStartTs = todayStartTs - DAY_MS;
-
-    let todayNew = 0;
-    let yesterdayNew = 0;
-    let todayDone = 0;
-    let yesterdayDone = 0;
-    let totalPending = 0;
-    let totalTickets = (data ?? []).length;
-
-    const byCategory: Record<number, number> = {};
-    let unknownCategory = 0;
-    const byStatus = { open: 0, in_progress: 0, resolved: 0, closed: 0 };
-    const byWorkType = { incident: 0, request: 0, change: 0, other: 0 };
-
-    (data ?? []).forEach((t) => {
-      const createdTs = t.created_at ? new Date(t.created_at).getTime() : null;
-      const updatedTs = t.updated_at ? new Date(t.updated_at).getTime() : createdTs;
-      const status = (t.status || "").toLowerCase();
-
-      if (status === "open" || status === "in_progress") totalPending++;
-      if (createdTs !== null && createdTs >= todayStartTs) todayNew++;
-      if (createdTs !== null && createdTs >= yesterdayStartTs && createdTs < todayStartTs) yesterdayNew++;
-      if (updatedTs !== null && updatedTs >= todayStartTs && (status === "resolved" || status === "closed")) {
-        todayDone++;
-      }
-      if (updatedTs !== null && updatedTs >= yesterdayStartTs && updatedTs < todayStartTs) {
-        if (status === "resolved" || status === "closed") yesterdayDone++;
-      }
-
-      if (t.category_id == null) {
-        unknownCategory += 1;
-      } else {
-        byCategory[t.category_id] = (byCategory[t.category_id] || 0) + 1;
-      }
-
-      if (status === "open") byStatus.open++;
-      else if (status === "in_progress") byStatus.in_progress++;
-      else if (status === "resolved") byStatus.resolved++;
-      else if (status === "closed") byStatus.closed++;
-
-      const wt = (t.work_type ?? "other") as keyof typeof byWorkType;
-      if (wt in byWorkType) byWorkType[wt] += 1;
-      else byWorkType.other += 1;
-    });
+    const summary = seriesQuery.data?.summary;
+    const todayNew = summary?.today_new ?? 0;
+    const yesterdayNew = summary?.yesterday_new ?? 0;
+    const todayDone = summary?.today_done ?? 0;
+    const yesterdayDone = summary?.yesterday_done ?? 0;
 
     const newTrendRaw =
       yesterdayNew === 0 ? (todayNew === 0 ? 0 : 100) : ((todayNew - yesterdayNew) / yesterdayNew) * 100;
@@ -468,29 +476,19 @@ export default function AdminDashboard() {
     return {
       todayNew,
       todayDone,
-      totalPending,
-      totalTickets,
+      totalPending: summary?.total_pending ?? 0,
+      totalTickets: summary?.total_tickets ?? 0,
       newTrend,
       doneTrend,
-      byCategory,
-      unknownCategory,
-      byStatus,
-      byWorkType,
     };
-  }, [data]);
-
-  const workTypeFiltered = useMemo(() => filterTicketsByDonutRange(data ?? [], donutRangeWorkType), [data, donutRangeWorkType]);
-  const statusFiltered = useMemo(() => filterTicketsByDonutRange(data ?? [], donutRangeStatus), [data, donutRangeStatus]);
-  const titleFiltered = useMemo(() => filterTicketsByDonutRange(data ?? [], donutRangeTitle), [data, donutRangeTitle]);
-  const deptFiltered = useMemo(() => filterTicketsByDonutRange(data ?? [], donutRangeDept), [data, donutRangeDept]);
-  const categoryFiltered = useMemo(() => filterTicketsByDonutRange(data ?? [], donutRangeCategory), [data, donutRangeCategory]);
+  }, [seriesQuery.data]);
 
   const workTypeChartData = useMemo(() => {
     const byWorkType = { incident: 0, request: 0, change: 0, other: 0 };
-    workTypeFiltered.forEach((t) => {
-      const wt = (t.work_type ?? "other") as keyof typeof byWorkType;
-      if (wt in byWorkType) byWorkType[wt] += 1;
-      else byWorkType.other += 1;
+    (workTypeQuery.data?.by_work_type ?? []).forEach((c) => {
+      const wt = (c.key ?? "other") as keyof typeof byWorkType;
+      if (wt in byWorkType) byWorkType[wt] += c.count;
+      else byWorkType.other += c.count;
     });
     return [
       { label: "장애", value: byWorkType.incident },
@@ -498,16 +496,13 @@ export default function AdminDashboard() {
       { label: "변경", value: byWorkType.change },
       { label: "기타", value: byWorkType.other },
     ];
-  }, [workTypeFiltered]);
+  }, [workTypeQuery.data]);
 
   const statusChartData = useMemo(() => {
     const byStatus = { open: 0, in_progress: 0, resolved: 0, closed: 0 };
-    statusFiltered.forEach((t) => {
-      const s = (t.status || "").toLowerCase();
-      if (s === "open") byStatus.open++;
-      else if (s === "in_progress") byStatus.in_progress++;
-      else if (s === "resolved") byStatus.resolved++;
-      else if (s === "closed") byStatus.closed++;
+    (statusQuery.data?.by_status ?? []).forEach((c) => {
+      const s = (c.key || "").toLowerCase() as keyof typeof byStatus;
+      if (s in byStatus) byStatus[s] += c.count;
     });
     return [
       { label: "대기", value: byStatus.open },
@@ -515,32 +510,24 @@ export default function AdminDashboard() {
       { label: "완료", value: byStatus.resolved },
       { label: "사업 검토", value: byStatus.closed },
     ];
-  }, [statusFiltered]);
+  }, [statusQuery.data]);
 
-  const requesterTitleChartData = useMemo(() => {
-    const byTitle: Record<string, number> = {};
-    titleFiltered.forEach((t) => {
-      const label = (t.requester?.title ?? "").trim() || "미기재";
-      byTitle[label] = (byTitle[label] ?? 0) + 1;
-    });
-    return Object.entries(byTitle).map(([label, value]) => ({ label, value }));
-  }, [titleFiltered]);
-
-  const requesterDepartmentChartData = useMemo(() => {
-    const byDept: Record<string, number> = {};
-    deptFiltered.forEach((t) => {
-      const label = (t.requester?.department ?? "").trim() || "미기재";
-      byDept[label] = (byDept[label] ?? 0) + 1;
-    });
-    return Object.entries(byDept).map(([label, value]) => ({ label, value }));
-  }, [deptFiltered]);
+  const requesterTitleChartData = useMemo(
+    () => countsToChartData(titleQuery.data?.by_requester_title),
+    [titleQuery.data]
+  );
+
+  const requesterDepartmentChartData = useMemo(
+    () => countsToChartData(deptQuery.data?.by_requester_department),
+    [deptQuery.data]
+  );
 
   const categoryChartData = useMemo(() => {
     const byCategory: Record<number, number> = {};
     let unknownCategory = 0;
-    categoryFiltered.forEach((t) => {
-      if (t.category_id == null) unknownCategory += 1;
-      else byCategory[t.category_id] = (byCategory[t.category_id] ?? 0) + 1;
+    (categoryQuery.data?.by_category ?? []).forEach((c) => {
+      if (c.category_id == null) unknownCategory += c.count;
+      else byCategory[c.category_id] = (byCategory[c.category_id] ?? 0) + c.count;
     });
     if (categories.length) {
       return categories.map((category) => {
@@ -553,64 +540,22 @@ export default function AdminDashboard() {
       label: categoryMap[Number(key)] ?? key,
       value,
     }));
-  }, [categoryFiltered, categoryMap, categories]);
+  }, [categoryQuery.data, categoryMap, categories]);
 
   const timeSeriesData = useMemo(() => {
-    const tickets = data ?? [];
-    const now = new Date(kstMidnightTs(new Date()));
-    const periods = range === "monthly" ? 12 : range === "weekly" ? 12 : 30;
-    const labels: string[] = [];
-    const values: number[] = [];
-
-    if (range === "monthly") {
-      for (let i = periods - 1; i >= 0; i--) {
-        const d = new Date(Date.UTC(now.getUTCFullYear(), now.getUTCMonth() - i, 1));
-        labels.push(`${d.getFullYear()}년 ${d.getMonth() + 1}월`);
-        values.push(0);
+    const series = seriesQuery.data?.series ?? [];
+    const labels = series.map((p) => {
+      const ts = parseKstDate(p.bucket_start);
+      if (range === "monthly") {
+        const d = new Date(ts + KST_OFFSET_MS);
+        return `${d.getUTCFullYear()}년 ${d.getUTCMonth() + 1}월`;
       }
-      tickets.forEach((t) => {
-        if (!t.created_at) return;
-        const d = new Date(new Date(t.created_at).getTime() + KST_OFFSET_MS);
-        const idx =
-          (d.getUTCFullYear() - now.getUTCFullYear()) * 12 + (d.getUTCMonth() - now.getUTCMonth()) + (periods - 1);
-        if (idx >= 0 && idx < periods) values[idx]++;
-      });
-    } else if (range === "weekly") {
-      // "주별"은 달력 주(월~일) 기준으로 집계.
-      // 이번 주는 월요일~오늘까지(week-to-date)만 자연스럽게 누적됨.
-      const currentWeekStartTs = kstWeekStartTs(now);
-      const baseWeekStartTs = currentWeekStartTs - (periods - 1) * 7 * DAY_MS;
-
-      for (let i = 0; i < periods; i++) {
-        const weekStartTs = baseWeekStartTs + i * 7 * DAY_MS;
-        labels.push(formatWeekLabel(weekStartTs));
-        values.push(0);
-      }
-
-      tickets.forEach((t) => {
-        if (!t.created_at) return;
-        const createdTs = new Date(t.created_at).getTime();
-        const weekStartTs = kstWeekStartTs(new Date(createdTs));
-        const idx = Math.floor((weekStartTs - baseWeekStartTs) / (7 * DAY_MS));
-        if (idx >= 0 && idx < periods) values[idx]++;
-      });
-    } else {
-      for (let i = periods - 1; i >= 0; i--) {
-        const d = new Date(now);
-        d.setDate(d.getDate() - i);
-        labels.push(`${d.getMonth() + 1}/${d.getDate()}`);
-        values.push(0);
-      }
-      tickets.forEach((t) => {
-        if (!t.created_at) return;
-        const created = new Date(new Date(t.created_at).getTime() + KST_OFFSET_MS);
-        const diff = kstDayDiff(now, created);
-        if (diff >= 0 && diff < periods) values[periods - 1 - diff]++;
-      });
-    }
-
+      if (range === "weekly") return formatWeekLabel(ts);
+      return formatKstMd(ts);
+    });
+    const values = series.map((p) => p.count);
     return { labels, values };
-  }, [data, range]);
+  }, [seriesQuery.data, range]);
 
   return (
     <div className="space-y-6 animate-fadeIn">
@@ -171,7 +171,7 @@ export default function AdminAllTicketsPage() {
 
   const { data, isLoading, error } = useQuery({
     queryKey: ["admin-tickets-all", { limit, offset }],
-    queryFn: () => api<TicketListResponse>(`/tickets?scope=all&limit=${limit}&offset=${offset}`),
+    queryFn: () => api<TicketListResponse>(`/tickets?scope=all&limit=${limit}&offset=${offset}&fields=summary`),
     staleTime: 5_000,
   });
 
@@ -175,7 +175,7 @@ export default function AdminTicketsPage() {
 
   const { data, isLoading, error } = useQuery({
     queryKey: ["admin-tickets", { limit, offset }],
-    queryFn: () => api<TicketListResponse>(`/tickets?scope=all&limit=${limit}&offset=${offset}`),
+    queryFn: () => api<TicketListResponse>(`/tickets?scope=all&limit=${limit}&offset=${offset}&fields=summary`),
     staleTime: 5_000,
   });
 
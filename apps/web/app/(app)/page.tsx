@@ -8,7 +8,6 @@ import { api } from "@/lib/api";
 type Ticket = {
   id: number;
   title: string;
-  description: string;
   status: string;
   priority: string;
   category_id: number | null;
@@ -65,7 +64,7 @@ export default function HomePage() {
   // 최근 요청 목록(필요하면 limit/offset 사용)
   const { data: tickets, isLoading } = useQuery({
     queryKey: ["tickets", "home"],
-    queryFn: () => api<Ticket[]>("/tickets?limit=1000&offset=0"),
+    queryFn: () => api<Ticket[]>("/tickets?limit=1000&offset=0&fields=summary"),
   });
 
   const stats = useMemo(() => {
@@ -157,7 +157,7 @@ export default function TicketsPage() {
 
   const { data, isLoading, error } = useQuery({
     queryKey: ["my-tickets", { limit, offset }],
-    queryFn: () => api<TicketListResponse>(`/tickets?limit=${limit}&offset=${offset}`),
+    queryFn: () => api<TicketListResponse>(`/tickets?limit=${limit}&offset=${offset}&fields=summary`),
     staleTime: 5_000,
   });
 
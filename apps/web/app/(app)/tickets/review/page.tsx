@@ -129,7 +129,7 @@ export default function ReviewTicketsPage() {
 
   const { data, isLoading, error } = useQuery({
     queryKey: ["review-tickets"],
-    queryFn: () => api<Ticket[]>(`/tickets?status=${status}&limit=1000&offset=0`),
+    queryFn: () => api<Ticket[]>(`/tickets?status=${status}&limit=1000&offset=0&fields=summary`),
     staleTime: 5_000,
   });
 
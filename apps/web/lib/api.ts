@@ -21,6 +21,10 @@ if (!baseUrl) {
   throw new Error("NEXT_PUBLIC_API_BASE_URL is not set");
 }
 
+export function apiUrl(path: string): string {
+  return `${baseUrl}${path}`;
+}
+
 type HttpMethod = "GET" | "POST" | "PATCH" | "PUT" | "DELETE";
 
 export async function api<T>(
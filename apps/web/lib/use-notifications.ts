@@ -1,53 +1,125 @@
 "use client";
 
 import { useEffect, useMemo, useState } from "react";
-import { useQuery } from "@tanstack/react-query";
-import { api } from "@/lib/api";
+import { useMutation, useQuery, useQueryClient } from "@tanstack/react-query";
+import { api, apiUrl } from "@/lib/api";
+import { getToken } from "@/lib/auth";
 
 export type NotificationItem = {
   id: string;
+  seq?: number | null;
   ticket_id?: number | null;
   ticket_title?: string | null;
   type: string;
   message: string;
   created_at: string;
+  read?: boolean;
 };
 
-const STORAGE_KEY = "it_service_desk_notifications_seen";
+const NOTIFICATIONS_KEY = ["notifications"];
+const INBOX_LIMIT = 50;
+const STREAM_RECONNECT_MS = 5_000;
 
-export function useNotifications() {
-  const [lastSeen, setLastSeen] = useState<number>(0);
+function maxSeq(items: NotificationItem[]): number | null {
+  const seqs = items.map((n) => n.seq ?? 0);
+  return seqs.length ? Math.max(...seqs) : null;
+}
 
-  useEffect(() => {
-    const raw = typeof window !== "undefined" ? localStorage.getItem(STORAGE_KEY) : null;
-    if (!raw) return;
-    const parsed = Number(raw);
-    if (!Number.isNaN(parsed)) setLastSeen(parsed);
-  }, []);
+// 새 알림을 기존 목록 앞에 합친다 (id 중복 제거, 최신 50건 유지)
+function mergeNotifications(prev: NotificationItem[], incoming: NotificationItem[]): NotificationItem[] {
+  if (!incoming.length) return prev;
+  const seen = new Set(incoming.map((n) => n.id));
+  return [...incoming, ...prev.filter((n) => !seen.has(n.id))]
+    .sort((a, b) => (b.seq ?? 0) - (a.seq ?? 0))
+    .slice(0, INBOX_LIMIT);
+}
+
+export function useNotifications() {
+  const qc = useQueryClient();
+  // SSE가 연결되어 있으면 폴링하지 않는다
+  const [live, setLive] = useState(false);
 
   const { data = [], isLoading } = useQuery({
-    queryKey: ["notifications"],
-    queryFn: () => api<NotificationItem[]>("/notifications"),
+    queryKey: NOTIFICATIONS_KEY,
+    queryFn: async () => {
+      const prev = qc.getQueryData<NotificationItem[]>(NOTIFICATIONS_KEY);
+      const since = prev ? maxSeq(prev) : null;
+      if (!prev || since === null) return api<NotificationItem[]>("/notifications");
+      // 이미 받은 목록이 있으면 그 이후 알림만 받아서 합친다
+      const delta = await api<NotificationItem[]>(`/notifications?since=${since}`);
+      return mergeNotifications(prev, delta);
+    },
     staleTime: 10_000,
-    refetchInterval: 30_000,
+    refetchInterval: live ? false : 30_000,
   });
 
+  useEffect(() => {
+    if (!getToken() || typeof EventSource === "undefined") return;
+    let es: EventSource | null = null;
+    let retry: ReturnType<typeof setTimeout> | null = null;
+    let closed = false;
+
+    // EventSource는 Authorization 헤더를 보낼 수 없어 토큰을 쿼리로 넘기는데, URL은 접속 로그에 남으므로
+    // 액세스 토큰 대신 연결할 때마다 짧은 스트림 전용 토큰을 받아 쓴다
+    const connect = async () => {
+      let token: string;
+      try {
+        token = (await api<{ token: string; expires_in: number }>("/notifications/stream-token", { method: "POST" })).token;
+      } catch {
+        if (!closed) retry = setTimeout(connect, STREAM_RECONNECT_MS);
+        return;
+      }
+      if (closed) return;
+      const prev = qc.getQueryData<NotificationItem[]>(NOTIFICATIONS_KEY);
+      const since = prev ? maxSeq(prev) : null;
+      const params = new URLSearchParams({ token });
+      if (since !== null) params.set("since", String(since));
+      es = new EventSource(apiUrl(`/notifications/stream?${params}`));
+      es.onopen = () => setLive(true);
+      es.onerror = () => {
+        setLive(false);
+        // 서버가 스트림을 닫으면 EventSource가 같은 URL로 다시 붙는데, 토큰이 만료돼 거절되면 새 토큰으로 연결한다
+        if (es?.readyState === EventSource.CLOSED && !closed) {
+          es.close();
+          retry = setTimeout(connect, STREAM_RECONNECT_MS);
+        }
+      };
+      es.addEventListener("notification", (e) => {
+        const item = JSON.parse((e as MessageEvent).data) as NotificationItem;
+        qc.setQueryData<NotificationItem[]>(NOTIFICATIONS_KEY, (prev = []) => mergeNotifications(prev, [item]));
+      });
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      if (retry) clearTimeout(retry);
+      es?.close();
+    };
+  }, [qc]);
+
   const notifications = useMemo(
     () => [...data].sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime()),
     [data]
   );
 
-  const unreadCount = useMemo(
-    () => notifications.filter((n) => new Date(n.created_at).getTime() > lastSeen).length,
-    [notifications, lastSeen]
-  );
+  // 읽음 위치는 서버(notification_cursors)에서 관리
+  const unreadCount = useMemo(() => notifications.filter((n) => !n.read).length, [notifications]);
+
+  const markReadM = useMutation({
+    mutationFn: (lastReadId: number | null) =>
+      api<{ last_read_id: number; unread_count: number }>("/notifications/read", {
+        method: "POST",
+        body: { last_read_id: lastReadId },
+      }),
+    onSuccess: (state) =>
+      qc.setQueryData<NotificationItem[]>(NOTIFICATIONS_KEY, (prev = []) =>
+        prev.map((n) => ((n.seq ?? 0) <= state.last_read_id ? { ...n, read: true } : n))
+      ),
+  });
 
   const markAllRead = () => {
-    const now = Date.now();
-    setLastSeen(now);
-    if (typeof window !== "undefined") {
-      localStorage.setItem(STORAGE_KEY, String(now));
-    }
+    markReadM.mutate(maxSeq(notifications));
   };
 
   return { notifications, unreadCount, isLoading, markAllRead };